@@ -10,8 +10,10 @@ with override_env({"DD_IAST_ENABLED": "True"}):
     from ddtrace.appsec._iast._taint_tracking import Source
     from ddtrace.appsec._iast._taint_tracking import TaintRange
     from ddtrace.appsec._iast._taint_tracking import create_context
+    from ddtrace.appsec._iast._taint_tracking import get_ranges
     from ddtrace.appsec._iast._taint_tracking import reset_context
     from ddtrace.appsec._iast._taint_tracking import set_ranges
+    from ddtrace.appsec._iast._taint_tracking import taint_pyobject
     from ddtrace.appsec._iast._taint_tracking.aspects import add_aspect
     from ddtrace.appsec._iast._taint_tracking.aspects import join_aspect
 
@@ -42,7 +44,7 @@ def aspect_function(internal_loop, tainted):
     value = ""
     res = value
     for _ in range(internal_loop):
-        res = add_aspect(res, join_aspect(str.join, 1, "_", (tainted, "_", tainted)))
+        res = add_aspect(res, join_aspect("_".join, 1, "_", (tainted, "_", tainted)))
         value = res
         res = add_aspect(res, tainted)
         value = res
@@ -52,6 +54,27 @@ def aspect_function(internal_loop, tainted):
     return value
 
 
+def fragments_function(internal_loop, tainted):
+    # Build a large string from many fragments of the same request parameter,
+    # as templates or serializers do
+    fragments = [
+        taint_pyobject(
+            pyobject="fragment_%d" % i,
+            source_name="sample_name",
+            source_value="sample_value",
+            source_origin=OriginType.PARAMETER,
+        )
+        for i in range(internal_loop)
+    ]
+    value = ""
+    for fragment in fragments:
+        value = add_aspect(value, fragment)
+    value = join_aspect("".join, 1, "", fragments)
+    # The ranges are read back like a sink would
+    get_ranges(value)
+    return value
+
+
 def new_request(enable_propagation):
     tainted = b"my_string".decode("ascii")
     reset_context()
@@ -71,10 +94,13 @@ def launch_function(enable_propagation, func, internal_loop, caller_loop):
 class IastPropagation(bm.Scenario):
     iast_enabled = bm.var(type=int)
     internal_loop = bm.var(type=int)
+    fragments = bm.var(type=int, default=0)
 
     def run(self):
         caller_loop = 10
-        if self.iast_enabled:
+        if self.fragments:
+            func = fragments_function
+        elif self.iast_enabled:
             func = aspect_function
         else:
             func = normal_function
@@ -0,0 +1,70 @@
+import bm
+
+from tests.utils import override_env
+
+
+with override_env({"DD_IAST_ENABLED": "True"}):
+    from ddtrace.appsec._iast.reporter import Evidence
+    from ddtrace.appsec._iast.reporter import Location
+    from ddtrace.appsec._iast.reporter import Source
+    from ddtrace.appsec._iast.reporter import Vulnerability
+    from ddtrace.appsec._iast.taint_sinks.command_injection import CommandInjection
+    from ddtrace.appsec._iast.taint_sinks.header_injection import HeaderInjection
+    from ddtrace.appsec._iast.taint_sinks.sql_injection import SqlInjection
+
+
+SINKS = {
+    "sql_injection": (
+        SqlInjection,
+        [
+            {"value": "SELECT * FROM users WHERE name = '"},
+            {"value": "John", "source": 0},
+            {"value": "' AND password = 'secret1234'"},
+        ],
+        [Source(origin="http.request.parameter", name="username", value="John")],
+    ),
+    "command_injection": (
+        CommandInjection,
+        [
+            {"value": "mysqladmin -u root -p "},
+            {"value": "'my_secret_password'", "source": 0},
+        ],
+        [Source(origin="http.request.parameter", name="password", value="'my_secret_password'")],
+    ),
+    "header_injection": (
+        HeaderInjection,
+        [
+            {"value": "Authorization: "},
+            {"value": "Bearer secret_token", "source": 0},
+        ],
+        [Source(origin="http.request.header", name="token", value="Bearer secret_token")],
+    ),
+}
+
+
+def redact(sink, value_parts, sources):
+    vulnerability = Vulnerability(
+        type=sink.vulnerability_type,
+        evidence=Evidence(valueParts=[dict(part) for part in value_parts]),
+        location=Location(path="benchmark.py", line=1, spanId=0),
+    )
+    sink._redact_vulnerability(vulnerability, [Source(origin=s.origin, name=s.name, value=s.value) for s in sources])
+
+
+class IastRedaction(bm.Scenario):
+    sink = bm.var(type=str)
+    cached = bm.var_bool()
+    internal_loop = bm.var(type=int)
+
+    def run(self):
+        sink, value_parts, sources = SINKS[self.sink]
+
+        def _(loops):
+            for _ in range(loops):
+                for _ in range(self.internal_loop):
+                    if not self.cached:
+                        # Every report is a new evidence, the sink specific redaction always runs
+                        sink._redacted_evidence_cache.clear()
+                    redact(sink, value_parts, sources)
+
+        yield _
@@ -0,0 +1,62 @@
+import bm
+
+from ddtrace.debugging._expressions import dd_compile
+from ddtrace.debugging._redaction import dd_compile_redacted
+
+
+class Node(object):
+    def __init__(self, name, child=None):
+        self.name = name
+        self.child = child
+
+
+EXPRESSIONS = {
+    "ref": {"eq": [{"ref": "n"}, 42]},
+    "getmember": {"eq": [{"getmember": [{"getmember": [{"ref": "node"}, "child"]}, "name"]}, "leaf"]},
+    "index": {"eq": [{"index": [{"index": [{"ref": "data"}, "items"]}, 1]}, 2]},
+    "any": {"any": [{"ref": "items"}, {"gt": [{"ref": "@it"}, 2]}]},
+    "filter": {"len": {"filter": [{"ref": "items"}, {"gt": [{"ref": "@it"}, 1]}]}},
+    "and": {
+        "and": [
+            {"isDefined": "n"},
+            {"startsWith": [{"getmember": [{"ref": "node"}, "name"]}, "ro"]},
+        ]
+    },
+}
+
+LOCALS = {
+    "n": 42,
+    "node": Node("root", Node("leaf")),
+    "data": {"items": [1, 2, 3]},
+    "items": list(range(10)),
+}
+
+
+class DebuggerExpressions(bm.Scenario):
+    expression = bm.var(type=str)
+    redacted = bm.var_bool()
+    compile = bm.var_bool()
+    internal_loop = bm.var(type=int)
+
+    def run(self):
+        compile_expression = dd_compile_redacted if self.redacted else dd_compile
+        ast = EXPRESSIONS[self.expression]
+        _locals = LOCALS
+
+        if self.compile:
+            # Compile the same expression for many probes
+
+            def _(loops):
+                for _ in range(loops):
+                    for _ in range(self.internal_loop):
+                        compile_expression(ast)
+
+        else:
+            compiled = compile_expression(ast)
+
+            def _(loops):
+                for _ in range(loops):
+                    for _ in range(self.internal_loop):
+                        compiled(_locals)
+
+        yield _
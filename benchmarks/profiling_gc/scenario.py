@@ -0,0 +1,47 @@
+import gc
+
+import bm
+
+from ddtrace.profiling import recorder
+from ddtrace.profiling.collector import gc as collector_gc
+
+
+class Node(object):
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+class ProfilingGC(bm.Scenario):
+    collector_enabled = bm.var_bool()
+    ntrees = bm.var(type=int)
+    depth = bm.var(type=int)
+
+    def _build_tree(self, depth, parent=None):
+        node = Node(parent)
+        if depth > 0:
+            self._build_tree(depth - 1, node)
+            self._build_tree(depth - 1, node)
+        return node
+
+    def run(self):
+        collector = None
+        if self.collector_enabled:
+            collector = collector_gc.GCCollector(recorder.Recorder())
+            collector.start()
+
+        def _(loops):
+            for _ in range(loops):
+                # Parent/children references create cycles that only the
+                # cyclic garbage collector can reclaim.
+                for _ in range(self.ntrees):
+                    self._build_tree(self.depth)
+                gc.collect()
+
+        try:
+            yield _
+        finally:
+            if collector is not None:
+                collector.stop()
@@ -3,7 +3,9 @@ import collections
 import gzip
 import json
 import time
+from typing import Any
 from typing import Optional
+from typing import Tuple
 
 from ddtrace import constants
 from ddtrace._trace._limits import MAX_SPAN_META_VALUE_LEN
@@ -74,14 +76,49 @@ class APIManager(Service):
 
         log.debug("%s initialized", self.__class__.__name__)
         self._hashtable: collections.OrderedDict[int, float] = collections.OrderedDict()
+        # Last schema extracted by the WAF for each endpoint and schema tag, with its encoded value
+        self._schemas: collections.OrderedDict[Tuple[int, str], Tuple[Any, str]] = collections.OrderedDict()
 
     def _stop_service(self) -> None:
         remove_context_callback(self._schema_callback, global_callback=True)
         self._hashtable.clear()
+        self._schemas.clear()
 
     def _start_service(self) -> None:
         add_context_callback(self._schema_callback, global_callback=True)
 
+    @staticmethod
+    def _end_point_hash(env) -> int:
+        return hash(
+            (
+                env.waf_addresses.get(SPAN_DATA_NAMES.REQUEST_ROUTE),
+                env.waf_addresses.get(SPAN_DATA_NAMES.REQUEST_METHOD),
+                env.waf_addresses.get(SPAN_DATA_NAMES.RESPONSE_STATUS),
+            )
+        )
+
+    def _encode_schema(self, end_point_hash: int, meta: str, schema: Any) -> str:
+        """Encode a schema extracted by the WAF, reusing the encoding of the last schema of the endpoint if equal."""
+        key = (end_point_hash, meta)
+        cached = self._schemas.get(key)
+        if cached is not None and cached[0] == schema:
+            try:
+                self._schemas.move_to_end(key)
+            except KeyError:
+                # Evicted by a concurrent request
+                pass
+            return cached[1]
+
+        encoded = base64.b64encode(gzip.compress(json.dumps(schema, separators=",:").encode())).decode()
+        self._schemas.pop(key, None)
+        if len(self._schemas) >= MAX_HASHTABLE_SIZE:
+            try:
+                self._schemas.popitem(last=False)
+            except KeyError:
+                pass
+        self._schemas[key] = (schema, encoded)
+        return encoded
+
     def _should_collect_schema(self, env, priority: int) -> bool:
         # Rate limit per route
         if priority <= 0:
@@ -99,7 +136,7 @@ class APIManager(Service):
                 bool(status),
             )
             return False
-        end_point_hash = hash((route, method, status))
+        end_point_hash = self._end_point_hash(env)
         current_time = time.monotonic()
         previous_time = self._hashtable.get(end_point_hash, M_INFINITY)
         if previous_time >= current_time - asm_config._api_security_sample_delay:
@@ -164,12 +201,11 @@ class APIManager(Service):
         result = call_waf_callback(waf_payload)
         if result is None:
             return
+        end_point_hash = self._end_point_hash(env)
         for meta, schema in result.derivatives.items():
             b64_gzip_content = b""
             try:
-                b64_gzip_content = base64.b64encode(
-                    gzip.compress(json.dumps(schema, separators=",:").encode())
-                ).decode()
+                b64_gzip_content = self._encode_schema(end_point_hash, meta, schema)
                 if len(b64_gzip_content) >= MAX_SPAN_META_VALUE_LEN:
                     raise TooLargeSchemaException
                 root._meta[meta] = b64_gzip_content
@@ -4,7 +4,9 @@ import json
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
@@ -39,6 +41,19 @@ _TELEMETRY_WAF_RESULTS = "t_waf_results"
 
 GLOBAL_CALLBACKS: Dict[str, List[Callable]] = {}
 
+_PHASE_REQUEST_BODY = "request_body"
+_PHASE_RESPONSE = "response"
+
+# Request phases at which each integration runs the WAF on all the addresses it
+# gathered so far. When WAF batching is enabled, the addresses deferred with
+# defer_waf_callback are not evaluated on their own but by the run of the next of
+# those phases. Only integrations running the WAF after the request body is parsed
+# and before the user code can be listed here, so that blocking still happens
+# before the request is handled.
+WAF_FLUSH_POINTS: Dict[str, FrozenSet[str]] = {
+    "django": frozenset((_PHASE_REQUEST_BODY, _PHASE_RESPONSE)),
+}
+
 
 class ASM_Environment:
     """
@@ -57,6 +72,8 @@ class ASM_Environment:
         self.addresses_sent: Set[str] = set()
         self.must_call_globals: bool = True
         self.waf_triggers: List[Dict[str, Any]] = []
+        self.integration: Optional[str] = None
+        self.waf_batch: Set[str] = set()
 
 
 def _get_asm_context() -> ASM_Environment:
@@ -257,6 +274,52 @@ def call_waf_callback(custom_data: Optional[Dict[str, Any]] = None, **kwargs) ->
         return None
 
 
+def _can_batch_waf_call(env: ASM_Environment) -> bool:
+    if not asm_config._waf_batching or not env.active or env.integration is None:
+        return False
+    return _PHASE_REQUEST_BODY in WAF_FLUSH_POINTS.get(env.integration, ())
+
+
+def defer_waf_callback(addresses: Iterable[str]) -> Optional[DDWaf_result]:
+    """
+    Run the WAF on the given persistent addresses, whose values are read from the
+    request context.
+
+    If WAF batching is enabled and the current integration runs the WAF at the
+    request body phase, the addresses are only evaluated by the WAF run of the
+    next phase of the integration and None is returned.
+    """
+    env = _get_asm_context()
+    if _can_batch_waf_call(env) and get_value(_CALLBACKS, _WAF_CALL):
+        env.waf_batch.update(addresses)
+        return None
+    return call_waf_callback({address: None for address in addresses})
+
+
+def call_waf_phase(phase: str) -> Optional[DDWaf_result]:
+    """
+    Run the WAF on all the addresses gathered so far, at the given request phase
+    of the integration.
+
+    If the phase is a flush point of the integration, the addresses deferred since
+    the previous flush are evaluated by this run.
+    """
+    env = _get_asm_context()
+    if env.waf_batch and phase in WAF_FLUSH_POINTS.get(env.integration, ()):
+        # a run without custom data evaluates every address set in the request context
+        env.waf_batch = set()
+    return call_waf_callback()
+
+
+def flush_waf_batch() -> Optional[DDWaf_result]:
+    """Run the WAF on the addresses deferred since the last flush, if any."""
+    env = _get_asm_context()
+    if not env.active or not env.waf_batch:
+        return None
+    addresses, env.waf_batch = env.waf_batch, set()
+    return call_waf_callback({address: None for address in addresses})
+
+
 def set_ip(ip: Optional[str]) -> None:
     if ip is not None:
         set_waf_address(SPAN_DATA_NAMES.REQUEST_HTTP_IP, ip, _get_asm_context().span)
@@ -400,6 +463,8 @@ def _on_context_started(ctx):
         ctx.get_item("headers_case_sensitive"),
         ctx.get_item("block_request_callable"),
     )
+    if resources is not None:
+        _get_asm_context().integration = ctx.identifier.split(".", 1)[0]
     ctx.set_item("resources", resources)
 
 
@@ -505,7 +570,7 @@ def _call_waf_first(integration, *_):
         return
 
     log.debug("%s WAF call for Suspicious Request Blocking on request", integration)
-    result = call_waf_callback()
+    result = call_waf_phase(_PHASE_REQUEST_BODY)
     return result.derivatives if result is not None else None
 
 
@@ -514,7 +579,7 @@ def _call_waf(integration, *_):
         return
 
     log.debug("%s WAF call for Suspicious Request Blocking on response", integration)
-    result = call_waf_callback()
+    result = call_waf_phase(_PHASE_RESPONSE)
     return result.derivatives if result is not None else None
 
 
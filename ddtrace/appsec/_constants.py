@@ -82,8 +82,10 @@ class IAST(metaclass=Constant_Class):
     CONTEXT_KEY = "_iast_data"
     PATCH_MODULES = "_DD_IAST_PATCH_MODULES"
     DENY_MODULES = "_DD_IAST_DENY_MODULES"
+    PATCH_CACHE_DIR = "_DD_IAST_PATCH_CACHE_DIR"
     SEP_MODULES = ","
     REQUEST_IAST_ENABLED = "_dd.iast.request_enabled"
+    REQUEST_OCE_STATE = "_dd.iast.request_oce_state"
     TEXT_TYPES = (str, bytes, bytearray)
 
 
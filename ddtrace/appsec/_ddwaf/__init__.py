@@ -14,13 +14,19 @@ LOGGER = get_logger(__name__)
 
 if asm_config._asm_libddwaf_available:
     try:
+        from .ddwaf_types import DDWAF_MAX_CONTAINER_DEPTH
+        from .ddwaf_types import DDWAF_MAX_CONTAINER_SIZE
+        from .ddwaf_types import DDWAF_MAX_STRING_LENGTH
         from .ddwaf_types import DDWafRulesType
+        from .ddwaf_types import ObjectStore
         from .ddwaf_types import _observator
         from .ddwaf_types import ddwaf_config
         from .ddwaf_types import ddwaf_context_capsule
         from .ddwaf_types import ddwaf_get_version
         from .ddwaf_types import ddwaf_object
         from .ddwaf_types import ddwaf_object_free
+        from .ddwaf_types import ddwaf_object_free_fn
+        from .ddwaf_types import ddwaf_object_p
         from .ddwaf_types import ddwaf_result
         from .ddwaf_types import ddwaf_run
         from .ddwaf_types import py_ddwaf_context_init
@@ -93,7 +99,10 @@ if _DDWAF_LOADED:
             obfuscation_parameter_value_regexp: bytes,
         ):
             config = ddwaf_config(
-                key_regex=obfuscation_parameter_key_regexp, value_regex=obfuscation_parameter_value_regexp
+                key_regex=obfuscation_parameter_key_regexp,
+                value_regex=obfuscation_parameter_value_regexp,
+                # The data built by the native converter is owned by the context and must not be freed by the WAF
+                free_fn=ddwaf_object_free_fn() if ObjectStore is not None else ddwaf_object_free,
             )
             diagnostics = ddwaf_object()
             ruleset_map_object = ddwaf_object.create_without_limits(ruleset_map)
@@ -166,19 +175,40 @@ if _DDWAF_LOADED:
                 return DDWaf_result([], {}, 0, (time.time() - start) * 1e6, False, 0, {})
 
             result = ddwaf_result()
-            observator = _observator()
-            wrapper = ddwaf_object(data, observator=observator)
-            wrapper_ephemeral = ddwaf_object(ephemeral_data, observator=observator) if ephemeral_data else None
-            error = ddwaf_run(ctx.ctx, wrapper, wrapper_ephemeral, ctypes.byref(result), int(timeout_ms * 1000))
-            if error < 0:
-                LOGGER.debug("run DDWAF error: %d\ninput %s\nerror %s", error, wrapper.struct, self.info.errors)
+            if ctx.objects is not None:
+                # Persistent data lives as long as the context, so the addresses already
+                # converted for this request are reused when they are sent again.
+                objects = ctx.objects
+                objects.truncation = 0
+                wrapper = ctypes.cast(objects.convert(data, cache=True), ddwaf_object_p)
+                ephemeral_objects = None
+                wrapper_ephemeral = None
+                if ephemeral_data:
+                    ephemeral_objects = ObjectStore(
+                        DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH
+                    )
+                    wrapper_ephemeral = ctypes.cast(ephemeral_objects.convert(ephemeral_data), ddwaf_object_p)
+                error = ddwaf_run(ctx.ctx, wrapper, wrapper_ephemeral, ctypes.byref(result), int(timeout_ms * 1000))
+                truncation = objects.truncation | (ephemeral_objects.truncation if ephemeral_objects else 0)
+                if error < 0:
+                    LOGGER.debug(
+                        "run DDWAF error: %d\ninput %s\nerror %s", error, wrapper.contents.struct, self.info.errors
+                    )
+            else:
+                observator = _observator()
+                wrapper = ddwaf_object(data, observator=observator)
+                wrapper_ephemeral = ddwaf_object(ephemeral_data, observator=observator) if ephemeral_data else None
+                error = ddwaf_run(ctx.ctx, wrapper, wrapper_ephemeral, ctypes.byref(result), int(timeout_ms * 1000))
+                truncation = observator.truncation
+                if error < 0:
+                    LOGGER.debug("run DDWAF error: %d\ninput %s\nerror %s", error, wrapper.struct, self.info.errors)
             return DDWaf_result(
                 result.events.struct,
                 result.actions.struct,
                 result.total_runtime / 1e3,
                 (time.time() - start) * 1e6,
                 result.timeout,
-                observator.truncation,
+                truncation,
                 result.derivatives.struct,
             )
 
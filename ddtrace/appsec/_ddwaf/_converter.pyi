@@ -0,0 +1,6 @@
+from typing import Any
+
+class ObjectStore:
+    truncation: int
+    def __init__(self, max_objects: int, max_depth: int, max_string_length: int) -> None: ...
+    def convert(self, data: Any, cache: bool = False) -> int: ...
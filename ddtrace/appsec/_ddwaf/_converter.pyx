@@ -0,0 +1,304 @@
+"""Native conversion of Python request data into ddwaf objects.
+
+The objects built by an :class:`ObjectStore` are owned by the store: the
+containers are allocated by the store and the strings point directly into the
+Python ``str`` and ``bytes`` objects it keeps alive. The WAF must therefore be
+configured not to free the data passed to ``ddwaf_run``, and the store must
+outlive the WAF context the objects are given to.
+"""
+from cpython.bytes cimport PyBytes_AS_STRING
+from cpython.bytes cimport PyBytes_GET_SIZE
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+from libc.stdint cimport uintptr_t
+from libc.stdlib cimport calloc
+from libc.stdlib cimport free
+
+
+cdef extern from *:
+    """
+    #include <stdbool.h>
+    #include <stdint.h>
+
+    /* Layout of ddwaf_object as defined in ddwaf.h */
+    typedef struct _dd_ddwaf_object {
+        const char* parameterName;
+        uint64_t parameterNameLength;
+        union {
+            const char* stringValue;
+            uint64_t uintValue;
+            int64_t intValue;
+            struct _dd_ddwaf_object* array;
+            bool boolean;
+            double f64;
+        } value;
+        uint64_t nbEntries;
+        int type;
+    } dd_ddwaf_object;
+    """
+    ctypedef union dd_ddwaf_value:
+        const char* stringValue
+        uint64_t uintValue
+        int64_t intValue
+        void* array
+        bint boolean
+        double f64
+
+    ctypedef struct dd_ddwaf_object:
+        const char* parameterName
+        uint64_t parameterNameLength
+        dd_ddwaf_value value
+        uint64_t nbEntries
+        int type
+
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t* size) except NULL
+
+
+cdef enum:
+    DDWAF_OBJ_SIGNED = 1 << 0
+    DDWAF_OBJ_STRING = 1 << 2
+    DDWAF_OBJ_ARRAY = 1 << 3
+    DDWAF_OBJ_MAP = 1 << 4
+    DDWAF_OBJ_BOOL = 1 << 5
+    DDWAF_OBJ_FLOAT = 1 << 6
+    DDWAF_OBJ_NULL = 1 << 7
+
+# Same values as the truncation flags reported by the ctypes converter
+cdef enum:
+    TRUNC_STRING_LENGTH = 1
+    TRUNC_CONTAINER_SIZE = 2
+    TRUNC_CONTAINER_DEPTH = 4
+
+# Values of these types cannot change after they have been sent to the WAF
+cdef tuple _IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+# Snapshot of a container that holds values whose conversion cannot be reused
+cdef object _NO_SNAPSHOT = object()
+
+
+cdef object _snapshot(value, Py_ssize_t max_depth):
+    """Return an immutable copy of everything the conversion of ``value`` reads.
+
+    Containers are copied into tuples, following the same items as
+    ``ObjectStore._convert``. Leaves are kept with their type, as ``True``,
+    ``1`` and ``1.0`` compare equal but are not converted the same way.
+    ``_NO_SNAPSHOT`` is returned if any value is not of an exact list, dict or
+    immutable type.
+    """
+    cdef list items
+    cdef type value_type = type(value)
+
+    if value_type in _IMMUTABLE_TYPES:
+        return (value_type, value)
+    if value_type is list:
+        if max_depth <= 0:
+            # Only the size is read past the maximum depth
+            return (list, len(value) > 0)
+        items = []
+        for item in value:
+            item = _snapshot(item, max_depth - 1)
+            if item is _NO_SNAPSHOT:
+                return _NO_SNAPSHOT
+            items.append(item)
+        return (list, tuple(items))
+    if value_type is dict:
+        if max_depth <= 0:
+            return (dict, any(isinstance(key, (bytes, str)) for key in value))
+        items = []
+        for key, val in value.items():
+            if type(key) is not str and type(key) is not bytes:
+                if isinstance(key, (bytes, str)):
+                    return _NO_SNAPSHOT
+                # Non string keys are discarded but still count towards the size limit
+                items.append(None)
+                continue
+            val = _snapshot(val, max_depth - 1)
+            if val is _NO_SNAPSHOT:
+                return _NO_SNAPSHOT
+            items.append((key, val))
+        return (dict, tuple(items))
+    return _NO_SNAPSHOT
+
+
+cdef class ObjectStore(object):
+    """Build ddwaf objects and own their memory.
+
+    Top-level addresses converted with ``cache=True`` are remembered: if the
+    same value is given again for an address, the objects built the first time
+    are reused instead of being converted again. As containers might have been
+    modified in place, an immutable snapshot of their content is kept along
+    with their conversion, and they are only reused if it did not change.
+    """
+
+    cdef list _pins
+    cdef list _blocks
+    cdef dict _cache
+    cdef Py_ssize_t _max_objects
+    cdef Py_ssize_t _max_depth
+    cdef Py_ssize_t _max_string_length
+    cdef public int truncation
+
+    def __cinit__(self, Py_ssize_t max_objects, Py_ssize_t max_depth, Py_ssize_t max_string_length):
+        self._pins = []
+        self._blocks = []
+        self._cache = {}
+        self._max_objects = max_objects
+        self._max_depth = max_depth
+        self._max_string_length = max_string_length
+        self.truncation = 0
+
+    def __dealloc__(self):
+        for block in self._blocks:
+            free(<void*><uintptr_t>block)
+
+    cdef dd_ddwaf_object* _alloc(self, Py_ssize_t count) except NULL:
+        cdef dd_ddwaf_object* objects = <dd_ddwaf_object*>calloc(count if count > 0 else 1, sizeof(dd_ddwaf_object))
+        if objects == NULL:
+            raise MemoryError()
+        self._blocks.append(<uintptr_t>objects)
+        return objects
+
+    cdef const char* _string(self, value, uint64_t* length) except NULL:
+        cdef const char* data
+        cdef Py_ssize_t size
+
+        if isinstance(value, str):
+            try:
+                # The UTF-8 representation is cached by the str object
+                data = PyUnicode_AsUTF8AndSize(value, &size)
+            except UnicodeEncodeError:
+                value = value.encode("UTF-8", errors="ignore")
+                data = PyBytes_AS_STRING(value)
+                size = PyBytes_GET_SIZE(value)
+        else:
+            data = PyBytes_AS_STRING(value)
+            size = PyBytes_GET_SIZE(value)
+
+        if size > self._max_string_length - 1:
+            # difference of 1 to take null char at the end on the C side into account
+            self.truncation |= TRUNC_STRING_LENGTH
+            value = data[: self._max_string_length - 1]
+            data = PyBytes_AS_STRING(value)
+            size = PyBytes_GET_SIZE(value)
+
+        self._pins.append(value)
+        length[0] = size
+        return data
+
+    cdef int _convert(self, dd_ddwaf_object* obj, value, Py_ssize_t max_objects, Py_ssize_t max_depth) except -1:
+        cdef dd_ddwaf_object* children
+        cdef Py_ssize_t count
+        cdef Py_ssize_t i
+
+        if isinstance(value, bool):
+            obj.type = DDWAF_OBJ_BOOL
+            obj.value.boolean = value
+        elif isinstance(value, int):
+            obj.type = DDWAF_OBJ_SIGNED
+            try:
+                obj.value.intValue = value
+            except OverflowError:
+                # integers are sent on 64 signed bits
+                obj.value.intValue = <int64_t><uint64_t>(value & 0xFFFFFFFFFFFFFFFF)
+        elif isinstance(value, (str, bytes)):
+            obj.value.stringValue = self._string(value, &obj.nbEntries)
+            obj.type = DDWAF_OBJ_STRING
+        elif isinstance(value, float):
+            obj.type = DDWAF_OBJ_FLOAT
+            obj.value.f64 = value
+        elif isinstance(value, list):
+            if max_depth <= 0:
+                self.truncation |= TRUNC_CONTAINER_DEPTH
+                max_objects = 0
+            obj.type = DDWAF_OBJ_ARRAY
+            count = len(value)
+            if count > max_objects:
+                self.truncation |= TRUNC_CONTAINER_SIZE
+                count = max_objects
+            if count:
+                children = self._alloc(count)
+                obj.value.array = children
+                for i in range(count):
+                    self._convert(&children[i], value[i], max_objects, max_depth - 1)
+                obj.nbEntries = count
+        elif isinstance(value, dict):
+            if max_depth <= 0:
+                self.truncation |= TRUNC_CONTAINER_DEPTH
+                max_objects = 0
+            obj.type = DDWAF_OBJ_MAP
+            count = min(len(value), max_objects)
+            if count:
+                children = self._alloc(count)
+                obj.value.array = children
+                i = 0
+                # order is unspecified and could lead to problems if max_objects is reached
+                for counter, (key, val) in enumerate(value.items()):
+                    if not isinstance(key, (bytes, str)):  # discards non string keys
+                        continue
+                    if counter >= max_objects:
+                        self.truncation |= TRUNC_CONTAINER_SIZE
+                        break
+                    # patch for libddwaf 1.17.0
+                    if key == "status_code" and isinstance(val, int):
+                        val = str(val)
+                    # end_patch
+                    children[i].parameterName = self._string(key, &children[i].parameterNameLength)
+                    self._convert(&children[i], val, max_objects, max_depth - 1)
+                    i += 1
+                obj.nbEntries = i
+            elif any(isinstance(key, (bytes, str)) for key in value):
+                self.truncation |= TRUNC_CONTAINER_SIZE
+        elif value is not None:
+            obj.value.stringValue = self._string(str(value), &obj.nbEntries)
+            obj.type = DDWAF_OBJ_STRING
+        else:
+            obj.type = DDWAF_OBJ_NULL
+        return 0
+
+    cdef int _convert_addresses(self, dd_ddwaf_object* obj, dict data) except -1:
+        cdef dd_ddwaf_object* children
+        cdef dd_ddwaf_object* cached_object
+        cdef Py_ssize_t i = 0
+        cdef int truncation
+
+        obj.type = DDWAF_OBJ_MAP
+        if not data:
+            return 0
+
+        children = self._alloc(len(data))
+        obj.value.array = children
+        for address, value in data.items():
+            if not isinstance(address, (bytes, str)):
+                continue
+            snapshot = _snapshot(value, self._max_depth - 1)
+            cached = self._cache.get(address) if snapshot is not _NO_SNAPSHOT else None
+            # the snapshot tells if a container was modified in place since its conversion
+            if cached is not None and cached[0] is value and cached[3] == snapshot:
+                cached_object = <dd_ddwaf_object*><uintptr_t>cached[1]
+                children[i] = cached_object[0]
+                self.truncation |= <int>cached[2]
+            else:
+                truncation, self.truncation = self.truncation, 0
+                children[i].parameterName = self._string(address, &children[i].parameterNameLength)
+                self._convert(&children[i], value, self._max_objects, self._max_depth - 1)
+                if snapshot is not _NO_SNAPSHOT:
+                    self._cache[address] = (value, <uintptr_t>&children[i], self.truncation, snapshot)
+                self.truncation |= truncation
+            i += 1
+        obj.nbEntries = i
+        return 0
+
+    cpdef uintptr_t convert(self, data, bint cache=False) except 0:
+        """Convert ``data`` and return the address of the resulting ddwaf object.
+
+        :param cache: Reuse the objects built for the top-level keys of
+            ``data`` when the same values are given again, unchanged.
+        """
+        cdef dd_ddwaf_object* obj = self._alloc(1)
+
+        if cache and type(data) is dict:
+            self._convert_addresses(obj, data)
+        else:
+            self._convert(obj, data, self._max_objects, self._max_depth)
+
+        return <uintptr_t>obj
@@ -16,6 +16,11 @@ DDWafRulesType = Union[None, int, str, List[Any], Dict[str, Any]]
 
 log = get_logger(__name__)
 
+try:
+    from ._converter import ObjectStore
+except ImportError:
+    ObjectStore = None  # type: ignore[assignment,misc]
+
 #
 # Dynamic loading of libddwaf. For now it requires the file or a link to be in current directory
 #
@@ -335,6 +340,12 @@ class ddwaf_context_capsule:
     def __init__(self, ctx: ddwaf_context) -> None:
         self.ctx = ctx
         self.free_fn = ddwaf_context_destroy
+        # Owner of the data given to the context by the native converter
+        self.objects = (
+            ObjectStore(DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH)
+            if ObjectStore is not None
+            else None
+        )
 
     def __del__(self):
         if self.ctx:
@@ -343,6 +354,8 @@ class ddwaf_context_capsule:
             except TypeError:
                 pass
             self.ctx = None
+        # The context might reference the objects until it is destroyed
+        self.objects = None
 
     def __bool__(self):
         return bool(self.ctx)
@@ -1,5 +1,9 @@
 from collections import OrderedDict
+from math import exp
+from threading import Lock
 from time import monotonic
+from typing import List
+from typing import Tuple
 
 from ddtrace.settings.asm import config as asm_config
 
@@ -43,3 +47,130 @@ class deduplication:
         else:
             result = self.func(*args, **kwargs)
         return result
+
+
+class DecayingBloomFilter:
+    """
+    Fixed memory set of hashes, forgetting the hashes added more than a time lapse ago.
+
+    Hashes are added to the current generation of a Bloom filter. When half of the time lapse has passed, the
+    current generation becomes the previous one and a new empty generation is started, so a hash is remembered
+    between half and all of the time lapse after it was added, however often it is added again in the meantime. A
+    hash never added can be reported as present with a probability given by ``false_positive_rate``.
+    """
+
+    def __init__(self, bits: int = 1 << 16, hashes: int = 4):
+        self._bits = bits
+        self._hashes = hashes
+        self._current = bytearray(bits >> 3)
+        self._previous = bytearray(bits >> 3)
+        self._current_count = 0
+        self._previous_count = 0
+        self._rotated_at = monotonic()
+        self._lock = Lock()
+
+    @property
+    def memory(self) -> int:
+        """Size of the filter in bytes."""
+        return len(self._current) + len(self._previous)
+
+    def _positions(self, value_hash: int) -> List[int]:
+        # Double hashing from the two halves of the 64 bits hash
+        h1 = value_hash & 0xFFFFFFFF
+        h2 = ((value_hash >> 32) & 0xFFFFFFFF) | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+
+    def _rotate(self, time_lapse: float) -> bool:
+        current = monotonic()
+        elapsed = current - self._rotated_at
+        if elapsed < time_lapse / 2:
+            return False
+        if elapsed >= time_lapse:
+            # Nothing was added during the last half time lapse
+            self._previous = bytearray(len(self._current))
+            self._previous_count = 0
+        else:
+            self._previous = self._current
+            self._previous_count = self._current_count
+        self._current = bytearray(len(self._previous))
+        self._current_count = 0
+        self._rotated_at = current
+        return True
+
+    def add(self, value_hash: int, time_lapse: float) -> Tuple[bool, bool]:
+        """
+        Add a hash to the filter.
+
+        Returns whether the hash was already present and whether the generations were rotated.
+        """
+        positions = self._positions(value_hash)
+        with self._lock:
+            rotated = self._rotate(time_lapse)
+            current, previous = self._current, self._previous
+            if all(current[p >> 3] & (1 << (p & 7)) for p in positions) or all(
+                previous[p >> 3] & (1 << (p & 7)) for p in positions
+            ):
+                # Present hashes are not added again, so that they are forgotten after a time lapse
+                return True, rotated
+            for p in positions:
+                current[p >> 3] |= 1 << (p & 7)
+            self._current_count += 1
+            return False, rotated
+
+    def __contains__(self, value_hash: int) -> bool:
+        positions = self._positions(value_hash)
+        with self._lock:
+            return any(
+                all(generation[p >> 3] & (1 << (p & 7)) for p in positions)
+                for generation in (self._current, self._previous)
+            )
+
+    def false_positive_rate(self) -> float:
+        """Estimated probability for a hash never added to be reported as present."""
+        with self._lock:
+            rates = [
+                (1.0 - exp(-self._hashes * count / self._bits)) ** self._hashes
+                for count in (self._current_count, self._previous_count)
+            ]
+        return 1.0 - (1.0 - rates[0]) * (1.0 - rates[1])
+
+    def clear(self):
+        with self._lock:
+            self._current = bytearray(len(self._current))
+            self._previous = bytearray(len(self._previous))
+            self._current_count = self._previous_count = 0
+            self._rotated_at = monotonic()
+
+
+class probabilistic_deduplication(deduplication):
+    """
+    Deduplication of calls in fixed memory, for arguments of high cardinality.
+
+    A call can be wrongly deduplicated with the probability reported by the false positive rate of the filter.
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+        self.filter = DecayingBloomFilter()
+
+    def _on_rotate(self):
+        pass
+
+    def _reset_cache(self):
+        """
+        Reset the cache of reported logs
+        For testing purposes only
+        """
+        self.filter.clear()
+
+    def __call__(self, *args, **kwargs):
+        if not asm_config._deduplication_enabled:
+            return self.func(*args, **kwargs)
+
+        raw_log_hash = hash("".join([str(arg) for arg in self._extract(args)]))
+        present, rotated = self.filter.add(raw_log_hash, self._time_lapse)
+        if rotated:
+            self._on_rotate()
+        if present:
+            return None
+        return self.func(*args, **kwargs)
@@ -1,5 +1,5 @@
-import inspect
 from itertools import chain
+import sys
 from typing import Any
 from typing import Dict
 from typing import Iterable
@@ -8,6 +8,7 @@ from typing import Optional
 
 from ddtrace._trace.span import Span
 from ddtrace.appsec._constants import EXPLOIT_PREVENTION
+from ddtrace.internal._stack import capture_stack
 from ddtrace.settings.asm import config as asm_config
 import ddtrace.tracer
 
@@ -39,12 +40,7 @@ def report_stack(
     if asm_config._ep_max_stack_traces and len(exploit) >= asm_config._ep_max_stack_traces:
         return None
 
-    stack = inspect.stack()
-    if crop_stack is not None:
-        for i, frame in enumerate(stack):
-            if stack[i].frame.f_code.co_name == crop_stack:
-                stack = stack[i + 1 :]
-                break
+    stack = capture_stack(sys._getframe(), crop=crop_stack)
     res: Dict[str, Any] = {
         "language": "python",
         "id": stack_id,
@@ -59,9 +55,9 @@ def report_stack(
     frames = [
         {
             "id": i,
-            "function": getattr(stack[i].frame.f_code, "co_qualname", stack[i].frame.f_code.co_name),
-            "file": stack[i].filename,
-            "line": stack[i].lineno,
+            "function": stack[i][3],
+            "file": stack[i][0],
+            "line": stack[i][1],
         }
         for i in iterator
     ]
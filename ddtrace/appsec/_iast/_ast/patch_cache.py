@@ -0,0 +1,148 @@
+"""
+On-disk cache of the code objects of AST patched modules.
+
+Patching a module requires parsing its source, running the IAST AST visitor on
+it and compiling the result, on every process start. The resulting code objects
+are stored like ``.pyc`` files, under a key made of the module source, its path
+and name, the IAST patching code and the Python version, so that patching a
+module that did not change is a cache hit on the next start.
+
+The cache is disabled unless ``_DD_IAST_PATCH_CACHE_DIR`` is set.
+"""
+import functools
+import hashlib
+from importlib.util import MAGIC_NUMBER
+import marshal
+import os
+import sys
+import tempfile
+from types import CodeType
+from types import ModuleType
+from typing import Optional
+from typing import Tuple
+
+from ddtrace.internal.logger import get_logger
+from ddtrace.internal.module import origin
+from ddtrace.settings.asm import config as asm_config
+
+
+log = get_logger(__name__)
+
+_PATCHED = b"\x01"
+_NOT_PATCHED = b"\x00"
+_SUFFIX = ".iastc"
+
+
+@functools.lru_cache(maxsize=None)
+def _fingerprint() -> bytes:
+    """Identify the IAST patching code and the Python version."""
+    from ddtrace import __version__
+
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update(sys.implementation.cache_tag.encode())
+    digest.update(MAGIC_NUMBER)
+    # Development versions of the patching code can change without a version bump
+    ast_dir = os.path.dirname(__file__)
+    for name in sorted(os.listdir(ast_dir)):
+        if name.endswith(".py"):
+            with open(os.path.join(ast_dir, name), "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.digest()
+
+
+def cache_key(module: ModuleType) -> Optional[str]:
+    """
+    Return the key of the patched code of the given module, or None if the
+    cache is disabled or the module has no source file.
+    """
+    if not asm_config._iast_patch_cache_dir:
+        return None
+
+    module_origin = origin(module)
+    if module_origin is None:
+        return None
+
+    module_path = str(module_origin)
+    try:
+        with open(module_path, "rb") as source_file:
+            source = source_file.read()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(_fingerprint())
+    digest.update(module.__name__.encode())
+    digest.update(b"\x00")
+    digest.update(module_path.encode(errors="surrogateescape"))
+    digest.update(b"\x00")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(asm_config._iast_patch_cache_dir, key[:2], key + _SUFFIX)
+
+
+def load(key: Optional[str]) -> Tuple[bool, Optional[CodeType]]:
+    """
+    Look up the patched code of a module.
+
+    Returns whether the key was found and the patched code object, which is None
+    if the module does not need to be patched.
+    """
+    if key is None:
+        return False, None
+
+    try:
+        with open(_cache_path(key), "rb") as cache_file:
+            data = cache_file.read()
+    except OSError:
+        return False, None
+
+    header = len(MAGIC_NUMBER)
+    if data[:header] != MAGIC_NUMBER:
+        return False, None
+
+    flag = data[header : header + 1]
+    if flag == _NOT_PATCHED:
+        return True, None
+    if flag != _PATCHED:
+        return False, None
+
+    try:
+        code = marshal.loads(data[header + 1 :])
+    except (EOFError, ValueError, TypeError):
+        log.debug("Invalid IAST patch cache entry %s", key, exc_info=True)
+        return False, None
+
+    if not isinstance(code, CodeType):
+        return False, None
+    return True, code
+
+
+def store(key: Optional[str], code: Optional[CodeType]) -> None:
+    """
+    Store the patched code of a module, or None if the module does not need to
+    be patched.
+
+    The entry is written to a temporary file first and then moved in place, so
+    that concurrent processes never read a partial entry.
+    """
+    if key is None:
+        return
+
+    path = _cache_path(key)
+    data = MAGIC_NUMBER + (_NOT_PATCHED if code is None else _PATCHED + marshal.dumps(code))
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        log.debug("Cannot write IAST patch cache entry %s", path, exc_info=True)
@@ -2,6 +2,7 @@
 
 from ddtrace.internal.logger import get_logger
 
+from ._ast import patch_cache
 from ._ast.ast_patching import astpatch_module
 from ._utils import _is_iast_enabled
 
@@ -16,19 +17,26 @@ def _exec_iast_patched_module(module_watchdog, module):
     patched_source = None
     compiled_code = None
     if IS_IAST_ENABLED:
-        try:
-            module_path, patched_source = astpatch_module(module)
-        except Exception:
-            log.debug("Unexpected exception while AST patching", exc_info=True)
-            patched_source = None
-
-    if patched_source:
-        try:
-            # Patched source is compiled in order to execute it
-            compiled_code = compile(patched_source, module_path, "exec")
-        except Exception:
-            log.debug("Unexpected exception while compiling patched code", exc_info=True)
-            compiled_code = None
+        cache_key = patch_cache.cache_key(module)
+        cached, compiled_code = patch_cache.load(cache_key)
+        if not cached:
+            try:
+                module_path, patched_source = astpatch_module(module)
+            except Exception:
+                log.debug("Unexpected exception while AST patching", exc_info=True)
+                cache_key = None
+                patched_source = None
+
+            if patched_source:
+                try:
+                    # Patched source is compiled in order to execute it
+                    compiled_code = compile(patched_source, module_path, "exec")
+                except Exception:
+                    log.debug("Unexpected exception while compiling patched code", exc_info=True)
+                    cache_key = None
+                    compiled_code = None
+
+            patch_cache.store(cache_key, compiled_code)
 
     if compiled_code:
         # Patched source is executed instead of original module
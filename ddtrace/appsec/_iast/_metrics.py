@@ -108,6 +108,14 @@ def _set_metric_iast_executed_source(source_type):
     )
 
 
+@metric_verbosity(TELEMETRY_INFORMATION_VERBOSITY)
+def _set_metric_iast_deduplication(false_positive_rate, memory):
+    telemetry.telemetry_writer.add_gauge_metric(
+        TELEMETRY_NAMESPACE_TAG_IAST, "deduplication.false_positive_rate", false_positive_rate
+    )
+    telemetry.telemetry_writer.add_gauge_metric(TELEMETRY_NAMESPACE_TAG_IAST, "deduplication.memory", memory)
+
+
 @metric_verbosity(TELEMETRY_INFORMATION_VERBOSITY)
 def _set_metric_iast_executed_sink(vulnerability_type):
     telemetry.telemetry_writer.add_count_metric(
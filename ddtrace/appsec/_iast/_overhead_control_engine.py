@@ -2,16 +2,30 @@
 The Overhead control engine (OCE) is an element that by design ensures that the overhead does not go over a maximum
 limit. It will measure operations being executed in a request and it will deactivate detection
 (and therefore reduce the overhead to nearly 0) if a certain threshold is reached.
+
+With adaptive sampling, the probability of analyzing a request is kept per route template, as resolved by the web
+framework when the request starts: it decreases each time an analyzed request of the route finds no new vulnerability
+and goes back to 100% when a new vulnerability is found or when the route has not been analyzed for a while. Requests
+whose route cannot be resolved when they start are sampled with the global request sampling percentage.
+
+The CPU time of analyzed requests is bounded by a global budget. The whole CPU time of the request thread, between the
+start and the end of the request span, is charged to the budget: the taint tracking and the sinks run interleaved with
+the application code, so the budget bounds the analyzed requests rather than the IAST overhead alone.
 """
 import os
+import random
 import threading
 from typing import TYPE_CHECKING  # noqa:F401
 
+from ddtrace.internal.compat import monotonic
 from ddtrace.internal.logger import get_logger
+from ddtrace.internal.utils.formats import asbool
 from ddtrace.sampler import RateSampler
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Dict  # noqa:F401
+    from typing import Optional  # noqa:F401
     from typing import Set  # noqa:F401
     from typing import Tuple  # noqa:F401
     from typing import Type  # noqa:F401
@@ -29,6 +43,18 @@ def get_request_sampling_value():  # type: () -> float
 MAX_REQUESTS = int(os.environ.get("DD_IAST_MAX_CONCURRENT_REQUESTS", 2))
 MAX_VULNERABILITIES_PER_REQUEST = int(os.environ.get("DD_IAST_VULNERABILITIES_PER_REQUEST", 2))
 
+ADAPTIVE_SAMPLING = asbool(os.environ.get("_DD_IAST_ADAPTIVE_SAMPLING", False))
+# CPU seconds that analyzed requests can use per second of wall time
+CPU_BUDGET = float(os.environ.get("_DD_IAST_CPU_BUDGET", 0.1))
+# Unused budget is kept for this many seconds to absorb bursts of requests
+CPU_BUDGET_WINDOW = 10.0
+MIN_ROUTE_SAMPLING = 0.01
+ROUTE_SAMPLING_DECAY = 0.5
+# Routes not analyzed for this many seconds are sampled again at 100%
+COLD_ROUTE_INTERVAL = 60.0
+MAX_ROUTES = 1024
+MAX_ROUTE_FINGERPRINTS = 256
+
 
 class Operation(object):
     """Common operation related to Overhead Control Engine (OCE). Every vulnerabilities/taint_sinks should inherit
@@ -85,6 +111,15 @@ class Operation(object):
         return True
 
 
+class _RouteState(object):
+    __slots__ = ("rate", "fingerprints", "last_analyzed")
+
+    def __init__(self):
+        self.rate = 1.0
+        self.fingerprints = set()  # type: Set[Tuple[str, str, int]]
+        self.last_analyzed = None  # type: Optional[float]
+
+
 class OverheadControl(object):
     """This class is meant to control the overhead introduced by IAST analysis.
     The goal is to do sampling at different levels of the IAST analysis (per process, per request, etc)
@@ -94,17 +129,37 @@ class OverheadControl(object):
     _request_quota = MAX_REQUESTS
     _vulnerabilities = set()  # type: Set[Type[Operation]]
     _sampler = RateSampler(sample_rate=get_request_sampling_value() / 100.0)
+    _adaptive = ADAPTIVE_SAMPLING
+    _routes = {}  # type: Dict[str, _RouteState]
+    _cpu_budget = CPU_BUDGET * CPU_BUDGET_WINDOW
+    _cpu_budget_updated_at = monotonic()
 
     def reconfigure(self):
         self._sampler = RateSampler(sample_rate=get_request_sampling_value() / 100.0)
+        self._routes = {}
+        self._cpu_budget = CPU_BUDGET * CPU_BUDGET_WINDOW
+        self._cpu_budget_updated_at = monotonic()
 
-    def acquire_request(self, span):
-        # type: (Span) -> bool
+    @property
+    def adaptive(self):
+        # type: () -> bool
+        return self._adaptive
+
+    def acquire_request(self, span, route=None):
+        # type: (Span, Optional[str]) -> bool
         """Decide whether if IAST analysis will be done for this request.
         - Block a request's quota at start of the request to limit simultaneous requests analyzed.
         - Use sample rating to analyze only a percentage of the total requests (30% by default).
+        - With adaptive sampling, check the CPU budget and use the sampling rate of the route template of the request,
+          if known.
         """
-        if self._request_quota <= 0 or not self._sampler.sample(span):
+        if self._request_quota <= 0:
+            return False
+
+        if self._adaptive:
+            if not self._sample_route(span, route):
+                return False
+        elif not self._sampler.sample(span):
             return False
 
         with self._lock:
@@ -115,12 +170,70 @@ class OverheadControl(object):
 
         return True
 
-    def release_request(self):
-        """increment request's quota at end of the request."""
+    def release_request(self, route=None, cpu_time=None, fingerprints=None):
+        # type: (Optional[str], Optional[float], Optional[Set[Tuple[str, str, int]]]) -> None
+        """increment request's quota at end of the request.
+
+        :param route: The route template resolved by the framework for the request.
+        :param cpu_time: The CPU time, in seconds, used by the request thread.
+        :param fingerprints: The type, file and line of the vulnerabilities reported by the request.
+        """
+        if self._adaptive:
+            self._update_route(route, cpu_time, fingerprints)
         with self._lock:
             self._request_quota += 1
         self.vulnerabilities_reset_quota()
 
+    def _sample_route(self, span, route):
+        # type: (Span, Optional[str]) -> bool
+        now = monotonic()
+        with self._lock:
+            self._cpu_budget = min(
+                CPU_BUDGET * CPU_BUDGET_WINDOW, self._cpu_budget + (now - self._cpu_budget_updated_at) * CPU_BUDGET
+            )
+            self._cpu_budget_updated_at = now
+            if self._cpu_budget <= 0:
+                return False
+
+            if route is not None:
+                state = self._routes.get(route)
+                if state is None or state.last_analyzed is None or now - state.last_analyzed > COLD_ROUTE_INTERVAL:
+                    # New or cold route
+                    return True
+                rate = state.rate
+
+        if route is None:
+            # Unknown route: the request might be for a new route as well as for a route that is already well covered
+            return self._sampler.sample(span)
+
+        return random.random() < rate
+
+    def _update_route(self, route, cpu_time, fingerprints):
+        # type: (Optional[str], Optional[float], Optional[Set[Tuple[str, str, int]]]) -> None
+        with self._lock:
+            if cpu_time is not None:
+                self._cpu_budget -= cpu_time
+
+            if route is None:
+                return
+
+            # Routes are kept in least recently analyzed order
+            state = self._routes.pop(route, None)
+            if state is None:
+                if len(self._routes) >= MAX_ROUTES:
+                    del self._routes[next(iter(self._routes))]
+                state = _RouteState()
+            self._routes[route] = state
+
+            new_fingerprints = (fingerprints or set()) - state.fingerprints
+            if new_fingerprints:
+                state.rate = 1.0
+                if len(state.fingerprints) + len(new_fingerprints) <= MAX_ROUTE_FINGERPRINTS:
+                    state.fingerprints.update(new_fingerprints)
+            else:
+                state.rate = max(MIN_ROUTE_SAMPLING, state.rate * ROUTE_SAMPLING_DECAY)
+            state.last_analyzed = monotonic()
+
     def register(self, klass):
         # type: (Type[Operation]) -> Type[Operation]
         """Register vulnerabilities/taint_sinks. This set of elements will restart for each request."""
@@ -167,17 +167,46 @@ Initializer::release_tainted_object(TaintedObjectPtr tobj)
 }
 
 TaintRangePtr
-Initializer::allocate_taint_range(RANGE_START start, RANGE_LENGTH length, Source origin)
+Initializer::allocate_taint_range(RANGE_START start, RANGE_LENGTH length, SourcePtr origin)
 {
     if (!available_ranges_stack.empty()) {
         auto rptr = available_ranges_stack.top();
         available_ranges_stack.pop();
-        rptr->set_values(start, length, origin);
+        rptr->set_values(start, length, std::move(origin));
         return rptr;
     }
 
     // Stack is empty, create new object
-    return make_shared<TaintRange>(start, length, origin);
+    return make_shared<TaintRange>(start, length, std::move(origin));
+}
+
+SourcePtr
+Initializer::intern_source(const string& name, const string& value, OriginType origin)
+{
+    auto& bucket = interned_sources[Source::hash(name, value, origin)];
+    for (const auto& source : bucket) {
+        if (source->origin == origin and source->name == name and source->value == value) {
+            return source;
+        }
+    }
+
+    if (interned_sources_count >= INTERNED_SOURCES_SIZE) {
+        // Table full, sources are still shared by the ranges already using them
+        interned_sources.clear();
+        interned_sources_count = 0;
+        return intern_source(name, value, origin);
+    }
+
+    auto source = make_shared<Source>(name, value, origin);
+    bucket.emplace_back(source);
+    interned_sources_count++;
+    return source;
+}
+
+int
+Initializer::interned_sources_size()
+{
+    return static_cast<int>(interned_sources_count);
 }
 
 void
@@ -218,6 +247,8 @@ Initializer::destroy_context()
 {
     free_tainting_map((TaintRangeMapType*)ThreadContextCache.tx_id);
     ThreadContextCache.tx_id = 0;
+    interned_sources.clear();
+    interned_sources_count = 0;
 }
 
 void
@@ -226,6 +257,8 @@ Initializer::reset_context()
     //    lock_guard<recursive_mutex> lock(contexts_mutex);
     ThreadContextCache.tx_id = 0;
     clear_tainting_maps();
+    interned_sources.clear();
+    interned_sources_count = 0;
 }
 
 // Created in the PYBIND11_MODULE in _native.cpp
@@ -240,6 +273,7 @@ pyexport_initializer(py::module& m)
     m.def("num_objects_tainted", [] { return initializer->num_objects_tainted(); });
     m.def("initializer_size", [] { return initializer->initializer_size(); });
     m.def("active_map_addreses_size", [] { return initializer->active_map_addreses_size(); });
+    m.def("interned_sources_size", [] { return initializer->interned_sources_size(); });
 
     m.def(
       "create_context", []() { return initializer->create_context(); }, py::return_value_policy::reference);
@@ -20,9 +20,12 @@ class Initializer
     py::object pyfunc_get_python_lib;
     static constexpr int TAINTRANGES_STACK_SIZE = 4096;
     static constexpr int TAINTEDOBJECTS_STACK_SIZE = 4096;
+    static constexpr int INTERNED_SOURCES_SIZE = 4096;
     stack<TaintedObjectPtr> available_taintedobjects_stack;
     stack<TaintRangePtr> available_ranges_stack;
     unordered_set<TaintRangeMapType*> active_map_addreses;
+    unordered_map<size_t, vector<SourcePtr>> interned_sources;
+    size_t interned_sources_count = 0;
 
   public:
     /**
@@ -137,9 +140,30 @@ class Initializer
     // FIXME: these should be static functions of TaintRange
     // IMPORTANT: if the returned object is not assigned to the map, you have
     // responsibility of calling release_taint_range on it or you'll have a leak.
-    TaintRangePtr allocate_taint_range(RANGE_START start, RANGE_LENGTH length, Source source);
+    TaintRangePtr allocate_taint_range(RANGE_START start, RANGE_LENGTH length, SourcePtr source);
 
     void release_taint_range(TaintRangePtr rangeptr);
+
+    /**
+     * Returns the shared source with the given values, creating it if needed.
+     *
+     * Ranges from the same source then share a single Source instead of copying
+     * its name and value. The table is emptied when the request context is
+     * destroyed, the sources stay alive as long as ranges use them.
+     *
+     * @param name The name of the source.
+     * @param value The value of the source.
+     * @param origin The origin of the source.
+     * @return A pointer to the interned source.
+     */
+    SourcePtr intern_source(const string& name, const string& value, OriginType origin);
+
+    /**
+     * Gets the number of interned sources.
+     *
+     * @return The number of interned sources.
+     */
+    int interned_sources_size();
 };
 
 extern unique_ptr<Initializer> initializer;
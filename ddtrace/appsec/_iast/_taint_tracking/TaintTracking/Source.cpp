@@ -69,7 +69,7 @@ pyexport_source(py::module& m)
       .value("GRPC_BODY", OriginType::GRPC_BODY)
       .export_values();
 
-    py::class_<Source>(m, "Source")
+    py::class_<Source, SourcePtr>(m, "Source")
       .def(py::init<string, string, const OriginType>(), "name"_a = "", "value"_a = "", "origin"_a = OriginType())
       .def(py::init<int, string, const OriginType>(), "name"_a = "", "value"_a = "", "origin"_a = OriginType())
       .def_readonly("name", &Source::name)
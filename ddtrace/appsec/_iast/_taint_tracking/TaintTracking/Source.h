@@ -70,6 +70,9 @@ struct Source
     explicit operator std::string() const;
 };
 
+// Sources are immutable once created and shared by all the ranges they taint
+using SourcePtr = shared_ptr<Source>;
+
 inline string
 origin_to_str(OriginType origin_type)
 {
@@ -17,7 +17,7 @@ TaintRange::toString() const
 {
     ostringstream ret;
     ret << "TaintRange at " << this << " "
-        << "[start=" << start << ", length=" << length << " source=" << source.toString() << "]";
+        << "[start=" << start << ", length=" << length << " source=" << (source ? source->toString() : "None") << "]";
     return ret.str();
 }
 
@@ -33,7 +33,7 @@ TaintRange::get_hash() const
 {
     uint hstart = hash<uint>()(this->start);
     uint hlength = hash<uint>()(this->length);
-    uint hsource = hash<uint>()(this->source.get_hash());
+    uint hsource = hash<uint>()(this->source ? this->source->get_hash() : 0);
     return hstart ^ hlength ^ hsource;
 };
 
@@ -124,8 +124,8 @@ api_set_ranges_from_values(PyObject* self, PyObject* const* args, Py_ssize_t nar
             string source_value = PyObjectToString(args[3]);
             if (not source_value.empty()) {
                 auto source_origin = OriginType(PyLong_AsLong(args[4]));
-                auto source = Source(source_name, source_value, source_origin);
-                auto range = initializer->allocate_taint_range(0, len_pyobject, source);
+                auto source = initializer->intern_source(source_name, source_value, source_origin);
+                auto range = initializer->allocate_taint_range(0, len_pyobject, std::move(source));
                 TaintRangeRefs ranges = vector{ range };
                 result = set_ranges(pyobject_n, ranges, tx_map);
                 if (not result) {
@@ -431,8 +431,9 @@ pyexport_taintrange(py::module& m)
     // Fake constructor, used to force calling allocate_taint_range for performance reasons
     m.def(
       "taint_range",
-      [](RANGE_START start, RANGE_LENGTH length, Source source) {
-          return initializer->allocate_taint_range(start, length, std::move(source));
+      [](RANGE_START start, RANGE_LENGTH length, const Source& source) {
+          return initializer->allocate_taint_range(
+            start, length, initializer->intern_source(source.name, source.value, source.origin));
       },
       "start"_a,
       "length"_a,
@@ -36,11 +36,11 @@ struct TaintRange
 {
     RANGE_START start = 0;
     RANGE_LENGTH length = 0;
-    Source source;
+    SourcePtr source;
 
     TaintRange() = default;
 
-    TaintRange(RANGE_START start, RANGE_LENGTH length, Source source)
+    TaintRange(RANGE_START start, RANGE_LENGTH length, SourcePtr source)
       : start(start)
       , length(length)
       , source(std::move(source))
@@ -50,7 +50,7 @@ struct TaintRange
         }
     }
 
-    inline void set_values(RANGE_START start_, RANGE_LENGTH length_, Source source_)
+    inline void set_values(RANGE_START start_, RANGE_LENGTH length_, SourcePtr source_)
     {
         if (length_ <= 0) {
             throw std::invalid_argument("Error: Length cannot be set to 0.");
@@ -6,42 +6,27 @@
 namespace py = pybind11;
 
 /**
- * This function allocates a new taint range with the given offset and maximum length.
+ * This function appends a taint range, merging it with the last one if they are
+ * adjacent and come from the same source.
  *
- * @param source_taint_range The source taint range.
- * @param offset The offset to be applied.
- * @param max_length The maximum length of the taint range.
- *
- * @return A new taint range with the given offset and maximum length.
+ * @param start The start of the taint range.
+ * @param length The length of the taint range.
+ * @param source The source of the taint range.
  */
-TaintRangePtr
-allocate_limited_taint_range_with_offset(const TaintRangePtr& source_taint_range,
-                                         RANGE_START offset,
-                                         RANGE_LENGTH max_length)
-{
-    RANGE_LENGTH length;
-    if (max_length != -1)
-        length = min(max_length, source_taint_range->length);
-    else
-        length = source_taint_range->length;
-
-    auto tptr = initializer->allocate_taint_range(offset,                      // start
-                                                  length,                      // length
-                                                  source_taint_range->source); // source
-    return tptr;
-}
-
-/**
- * @brief Shifts the taint range by the given offset.
- * @param offset The offset to be applied.
- */
-TaintRangePtr
-shift_taint_range(const TaintRangePtr& source_taint_range, RANGE_START offset)
+void
+TaintedObject::append_range(RANGE_START start, RANGE_LENGTH length, const SourcePtr& source)
 {
-    auto tptr = initializer->allocate_taint_range(source_taint_range->start + offset, // start
-                                                  source_taint_range->length,         // length
-                                                  source_taint_range->source);        // source
-    return tptr;
+    if (!ranges_.empty()) {
+        auto& last = ranges_.back();
+        if (last->source == source and last->start + last->length == start) {
+            // Ranges are shared between tainted objects, so the last one can't be extended in place
+            auto merged = initializer->allocate_taint_range(last->start, last->length + length, source);
+            initializer->release_taint_range(std::move(last));
+            last = std::move(merged);
+            return;
+        }
+    }
+    ranges_.emplace_back(initializer->allocate_taint_range(start, length, source));
 }
 
 /**
@@ -80,19 +65,21 @@ TaintedObject::add_ranges_shifted(TaintRangeRefs ranges,
     if (!ranges.empty() and to_add > 0) {
         ranges_.reserve(ranges_.size() + to_add);
         int i = 0;
-        if (offset == 0 and max_length == -1) {
-            ranges_.insert(ranges_.end(), ranges.begin(), ranges.end());
+        if (offset == 0 and max_length == -1 and ranges_.empty()) {
+            ranges_.insert(ranges_.end(), ranges.begin(), ranges.begin() + to_add);
         } else {
             for (const auto& trange : ranges) {
                 if (max_length != -1 and orig_offset != -1) {
                     // Make sure original position (orig_offset) is covered by the range
                     if (trange->start <= orig_offset and
                         ((trange->start + trange->length) >= orig_offset + max_length)) {
-                        ranges_.emplace_back(allocate_limited_taint_range_with_offset(trange, offset, max_length));
+                        append_range(offset,
+                                     max_length != -1 ? min(max_length, trange->length) : trange->length,
+                                     trange->source);
                         i++;
                     }
                 } else {
-                    ranges_.emplace_back(shift_taint_range(trange, offset));
+                    append_range(trange->start + offset, trange->length, trange->source);
                     i++;
                 }
                 if (i >= to_add) {
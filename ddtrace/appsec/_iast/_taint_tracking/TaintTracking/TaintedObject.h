@@ -10,6 +10,8 @@ class TaintedObject
     TaintRangeRefs ranges_;
     size_t rc_{};
 
+    void append_range(RANGE_START start, RANGE_LENGTH length, const SourcePtr& source);
+
   public:
     constexpr static int TAINT_RANGE_LIMIT = 100;
     constexpr static int RANGES_INITIAL_RESERVE = 16;
@@ -29,6 +29,7 @@ if _is_python_version_supported():
     from ._native.initializer import debug_taint_map
     from ._native.initializer import destroy_context
     from ._native.initializer import initializer_size
+    from ._native.initializer import interned_sources_size
     from ._native.initializer import num_objects_tainted
     from ._native.initializer import reset_context
     from ._native.taint_tracking import OriginType
@@ -76,6 +77,7 @@ __all__ = [
     "destroy_context",
     "initializer_size",
     "active_map_addreses_size",
+    "interned_sources_size",
     "create_context",
     "str_to_origin",
     "origin_to_str",
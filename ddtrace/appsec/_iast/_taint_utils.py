@@ -148,6 +148,68 @@ def _is_tainted_struct(obj):
     return hasattr(obj, "_origins")
 
 
+def _lazy_taint(struct, value, source_name, origin, source_name_nested):
+    """
+    Taint a value read from a lazy tainted structure.
+
+    Tainted values and nested structures are cached by identity of the original
+    value, so reading the same item again returns the same object without
+    tainting it again.
+    """
+    if not value:
+        return value
+
+    if isinstance(value, (str, bytes, bytearray)):
+        cache_key = (id(value), source_name, origin)
+    elif isinstance(value, (abc.Mapping, abc.Sequence)) and not _is_tainted_struct(value):
+        cache_key = (id(value), source_name_nested, None)
+    else:
+        return value
+
+    cached = struct._cache.get(cache_key)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+
+    original = value
+    if isinstance(value, (str, bytes, bytearray)):
+        from ._taint_tracking import is_pyobject_tainted
+        from ._taint_tracking import taint_pyobject
+
+        if is_pyobject_tainted(value) and not struct._override_pyobject_tainted:
+            return value
+        try:
+            # TODO: migrate this part to shift ranges instead of creating a new one
+            value = taint_pyobject(
+                pyobject=value,
+                source_name=source_name,
+                source_value=value,
+                source_origin=origin,
+            )
+        except SystemError:
+            # TODO: Find the root cause for
+            # SystemError: NULL object passed to Py_BuildValue
+            log.debug("IAST SystemError while tainting value: %s", value, exc_info=True)
+            return value
+        except Exception:
+            log.debug("IAST Unexpected exception while tainting value", exc_info=True)
+            return value
+    elif isinstance(value, abc.Mapping):
+        value = LazyTaintDict(
+            value, origins=struct._origins, override_pyobject_tainted=struct._override_pyobject_tainted
+        )
+    else:
+        value = LazyTaintList(
+            value,
+            origins=struct._origins,
+            override_pyobject_tainted=struct._override_pyobject_tainted,
+            source_name=source_name_nested,
+        )
+
+    # the original value is kept in the cache so that its id can't be reused
+    struct._cache[cache_key] = (original, value)
+    return value
+
+
 class LazyTaintList:
     """
     Encapsulate a list to lazily taint all content on any depth
@@ -160,40 +222,10 @@ class LazyTaintList:
         self._origin_value = origins[1]
         self._override_pyobject_tainted = override_pyobject_tainted
         self._source_name = source_name
+        self._cache = {}
 
     def _taint(self, value):
-        if value:
-            if isinstance(value, (str, bytes, bytearray)):
-                from ._taint_tracking import is_pyobject_tainted
-                from ._taint_tracking import taint_pyobject
-
-                if not is_pyobject_tainted(value) or self._override_pyobject_tainted:
-                    try:
-                        # TODO: migrate this part to shift ranges instead of creating a new one
-                        value = taint_pyobject(
-                            pyobject=value,
-                            source_name=self._source_name,
-                            source_value=value,
-                            source_origin=self._origin_value,
-                        )
-                    except SystemError:
-                        # TODO: Find the root cause for
-                        # SystemError: NULL object passed to Py_BuildValue
-                        log.debug("IAST SystemError while tainting value: %s", value, exc_info=True)
-                    except Exception:
-                        log.debug("IAST Unexpected exception while tainting value", exc_info=True)
-            elif isinstance(value, abc.Mapping) and not _is_tainted_struct(value):
-                value = LazyTaintDict(
-                    value, origins=self._origins, override_pyobject_tainted=self._override_pyobject_tainted
-                )
-            elif isinstance(value, abc.Sequence) and not _is_tainted_struct(value):
-                value = LazyTaintList(
-                    value,
-                    origins=self._origins,
-                    override_pyobject_tainted=self._override_pyobject_tainted,
-                    source_name=self._source_name,
-                )
-        return value
+        return _lazy_taint(self, value, self._source_name, self._origin_value, self._source_name)
 
     def __add__(self, other):
         if _is_tainted_struct(other):
@@ -288,6 +320,7 @@ class LazyTaintList:
     def clear(self):
         # TODO: stop tainting in this case
         self._obj.clear()
+        self._cache.clear()
 
     def copy(self):
         return LazyTaintList(
@@ -340,42 +373,12 @@ class LazyTaintDict:
         self._origin_key = origins[0]
         self._origin_value = origins[1]
         self._override_pyobject_tainted = override_pyobject_tainted
+        self._cache = {}
 
     def _taint(self, value, key, origin=None):
         if origin is None:
             origin = self._origin_value
-        if value:
-            if isinstance(value, (str, bytes, bytearray)):
-                from ._taint_tracking import is_pyobject_tainted
-                from ._taint_tracking import taint_pyobject
-
-                if not is_pyobject_tainted(value) or self._override_pyobject_tainted:
-                    try:
-                        # TODO: migrate this part to shift ranges instead of creating a new one
-                        value = taint_pyobject(
-                            pyobject=value,
-                            source_name=key,
-                            source_value=value,
-                            source_origin=origin,
-                        )
-                    except SystemError:
-                        # TODO: Find the root cause for
-                        # SystemError: NULL object passed to Py_BuildValue
-                        log.debug("IAST SystemError while tainting value: %s", value, exc_info=True)
-                    except Exception:
-                        log.debug("IAST Unexpected exception while tainting value", exc_info=True)
-            elif isinstance(value, abc.Mapping) and not _is_tainted_struct(value):
-                value = LazyTaintDict(
-                    value, origins=self._origins, override_pyobject_tainted=self._override_pyobject_tainted
-                )
-            elif isinstance(value, abc.Sequence) and not _is_tainted_struct(value):
-                value = LazyTaintList(
-                    value,
-                    origins=self._origins,
-                    override_pyobject_tainted=self._override_pyobject_tainted,
-                    source_name=key,
-                )
-        return value
+        return _lazy_taint(self, value, key, origin, key)
 
     @property  # type: ignore
     def __class__(self):
@@ -411,7 +414,8 @@ class LazyTaintDict:
         self._obj |= other
 
     def __iter__(self):
-        return iter(self.keys())
+        for k in self._obj.keys():
+            yield self._taint(k, k, self._origin_key)
 
     def __le__(self, other):
         if _is_tainted_struct(other):
@@ -444,7 +448,8 @@ class LazyTaintDict:
         return repr(self._obj)
 
     def __reversed__(self):
-        return reversed(self.keys())
+        for k in reversed(self._obj.keys()):
+            yield self._taint(k, k, self._origin_key)
 
     def __setitem__(self, key, value):
         self._obj[key] = value
@@ -455,6 +460,7 @@ class LazyTaintDict:
     def clear(self):
         # TODO: stop tainting in this case
         self._obj.clear()
+        self._cache.clear()
 
     def copy(self):
         return LazyTaintDict(
@@ -475,12 +481,10 @@ class LazyTaintDict:
         return self._taint(res, key)
 
     def items(self):
-        for k in self.keys():
-            yield (k, self[k])
+        return abc.ItemsView(self)
 
     def keys(self):
-        for k in self._obj.keys():
-            yield self._taint(k, k, self._origin_key)
+        return abc.KeysView(self)
 
     def pop(self, *args):
         return self._taint(self._obj.pop(*args), "pop")
@@ -499,8 +503,7 @@ class LazyTaintDict:
         self._obj.update(*args, **kargs)
 
     def values(self):
-        for _, v in self.items():
-            yield v
+        return abc.ValuesView(self)
 
     # Django Query Dict support
     def getlist(self, key, default=None):
@@ -538,11 +541,26 @@ def check_tainted_args(args, kwargs, tracer, integration_name, method):
     return False
 
 
+def lazy_taint_structure(main_obj, source_key, source_value, override_pyobject_tainted=False):
+    """taint any structured object lazily
+    Mappings and sequences are wrapped in proxies tainting their content on first access,
+    other objects are tainted eagerly.
+    """
+    if not main_obj or _is_tainted_struct(main_obj):
+        return main_obj
+    if isinstance(main_obj, abc.Mapping):
+        return LazyTaintDict(
+            main_obj, origins=(source_key, source_value), override_pyobject_tainted=override_pyobject_tainted
+        )
+    if isinstance(main_obj, abc.Sequence) and not isinstance(main_obj, (str, bytes, bytearray)):
+        return LazyTaintList(
+            main_obj, origins=(source_key, source_value), override_pyobject_tainted=override_pyobject_tainted
+        )
+    return eager_taint_structure(main_obj, source_key, source_value, override_pyobject_tainted)
+
+
+eager_taint_structure = taint_structure
+
 if asm_config._iast_lazy_taint:
     # redefining taint_structure to use lazy object if required
-
-    def taint_structure(main_obj, source_key, source_value, override_pyobject_tainted=False):  # noqa: F811
-        if isinstance(main_obj, abc.Mapping):
-            return LazyTaintDict(main_obj, source_key, source_value, override_pyobject_tainted)
-        elif isinstance(main_obj, abc.Sequence):
-            return LazyTaintList(main_obj, source_key, source_value, override_pyobject_tainted)
+    taint_structure = lazy_taint_structure  # noqa: F811
@@ -1,3 +1,4 @@
+import functools
 import json
 import re
 import string
@@ -40,6 +41,8 @@ _SOURCE_VALUE_SCRUB = None
 _SOURCE_NUMERAL_SCRUB = None
 
 
+# Source names and values are repeated across requests, so the result of the patterns is memoized
+@functools.lru_cache(maxsize=1024)
 def _has_to_scrub(s):  # type: (str) -> bool
     global _SOURCE_NAME_SCRUB
     global _SOURCE_VALUE_SCRUB
@@ -57,7 +60,8 @@ def _has_to_scrub(s):  # type: (str) -> bool
     )
 
 
-def _is_numeric(s):
+@functools.lru_cache(maxsize=1024)
+def _is_numeric(s):  # type: (str) -> bool
     global _SOURCE_NUMERAL_SCRUB
 
     if _SOURCE_NUMERAL_SCRUB is None:
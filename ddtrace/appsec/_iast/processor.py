@@ -1,3 +1,6 @@
+import contextvars
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import attr
@@ -7,6 +10,7 @@ from ddtrace.appsec._constants import APPSEC
 from ddtrace.appsec._constants import IAST
 from ddtrace.constants import ORIGIN_KEY
 from ddtrace.ext import SpanTypes
+from ddtrace.ext import http
 from ddtrace.internal import core
 from ddtrace.internal.logger import get_logger
 
@@ -20,12 +24,46 @@ from ._utils import _is_iast_enabled
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Optional  # noqa:F401
+    from typing import Set  # noqa:F401
+    from typing import Tuple  # noqa:F401
 
     from ddtrace._trace.span import Span  # noqa:F401
 
 log = get_logger(__name__)
 
 
+# Route template of the request whose span is about to start, as resolved by the web framework
+_REQUEST_ROUTE = contextvars.ContextVar("iast_route", default=None)  # type: contextvars.ContextVar[Optional[str]]
+
+
+def _on_wsgi_context_started(ctx):
+    # type: (core.ExecutionContext) -> None
+    route = None
+    if oce.adaptive:
+        # Only frameworks that can match the request before handling it, like Flask, resolve a route here
+        request_route = getattr(ctx.get_item("middleware"), "_request_route", None)
+        environ = ctx.get_item("environ")
+        if request_route is not None and environ:
+            route = request_route(environ)
+    _REQUEST_ROUTE.set(route)
+
+
+def _on_django_context_started(ctx):
+    # type: (core.ExecutionContext) -> None
+    _REQUEST_ROUTE.set(ctx.get_item("route", traverse=False))
+
+
+def _on_request_context_ended(ctx):
+    # type: (core.ExecutionContext) -> None
+    _REQUEST_ROUTE.set(None)
+
+
+core.on("context.started.wsgi.__call__", _on_wsgi_context_started)
+core.on("context.ended.wsgi.__call__", _on_request_context_ended)
+core.on("context.started.django.traced_get_response", _on_django_context_started)
+core.on("context.ended.django.traced_get_response", _on_request_context_ended)
+
+
 @attr.s(eq=False)
 class AppSecIastSpanProcessor(SpanProcessor):
     @staticmethod
@@ -53,8 +91,11 @@ class AppSecIastSpanProcessor(SpanProcessor):
         create_context()
 
         request_iast_enabled = False
-        if oce.acquire_request(span):
+        route = _REQUEST_ROUTE.get()
+        if oce.acquire_request(span, route):
             request_iast_enabled = True
+            if oce.adaptive:
+                core.set_item(IAST.REQUEST_OCE_STATE, (route, threading.get_ident(), time.thread_time()), span=span)
 
         core.set_item(IAST.REQUEST_IAST_ENABLED, request_iast_enabled, span=span)
 
@@ -93,4 +134,16 @@ class AppSecIastSpanProcessor(SpanProcessor):
         if span.get_tag(ORIGIN_KEY) is None:
             span.set_tag_str(ORIGIN_KEY, APPSEC.ORIGIN_VALUE)
 
-        oce.release_request()
+        oce_state = core.get_item(IAST.REQUEST_OCE_STATE, span=span)
+        if oce_state is None:
+            oce.release_request()
+            return
+
+        route, thread_id, cpu_start = oce_state
+        # The CPU time of the whole request thread is charged, and it can only be measured if the request did not
+        # move to another thread
+        cpu_time = time.thread_time() - cpu_start if thread_id == threading.get_ident() else None
+        fingerprints = set()  # type: Set[Tuple[str, str, int]]
+        if data:
+            fingerprints = {(v.type, v.location.path, v.location.line) for v in data.vulnerabilities}
+        oce.release_request(span.get_tag(http.ROUTE) or route, cpu_time, fingerprints)
@@ -1,17 +1,19 @@
 import os
 from typing import TYPE_CHECKING  # noqa:F401
-from typing import cast  # noqa:F401
+
+import attr
 
 from ddtrace import tracer
 from ddtrace.appsec._constants import IAST
 from ddtrace.internal import core
+from ddtrace.internal._stack import get_info_frame
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.utils.cache import LFUCache
 from ddtrace.settings.asm import config as asm_config
 
-from ..._deduplications import deduplication
+from ..._deduplications import probabilistic_deduplication
+from .._metrics import _set_metric_iast_deduplication
 from .._overhead_control_engine import Operation
-from .._stacktrace import get_info_frame
 from .._utils import _has_to_scrub
 from .._utils import _is_evidence_value_parts
 from .._utils import _scrub
@@ -31,6 +33,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from typing import Optional  # noqa:F401
     from typing import Set  # noqa:F401
     from typing import Text  # noqa:F401
+    from typing import Tuple  # noqa:F401
     from typing import Union  # noqa:F401
 
 log = get_logger(__name__)
@@ -38,11 +41,17 @@ log = get_logger(__name__)
 CWD = os.path.abspath(os.getcwd())
 
 
-class taint_sink_deduplication(deduplication):
+class taint_sink_deduplication(probabilistic_deduplication):
     def _extract(self, args):
         # we skip 0, 1 and last position because its the cls, span and sources respectively
         return args[2:-1]
 
+    def _on_rotate(self):
+        try:
+            _set_metric_iast_deduplication(self.filter.false_positive_rate(), self.filter.memory)
+        except Exception:
+            log.debug("Error reporting IAST deduplication metrics", exc_info=True)
+
 
 def _check_positions_contained(needle, container):
     needle_start, needle_end = needle
@@ -59,12 +68,12 @@ def _check_positions_contained(needle, container):
 class VulnerabilityBase(Operation):
     vulnerability_type = ""
     evidence_type = ""
-    _redacted_report_cache = LFUCache()
+    _redacted_evidence_cache = LFUCache(maxsize=1024)
 
     @classmethod
     def _reset_cache_for_testing(cls):
-        """Reset the redacted reports and deduplication cache. For testing purposes only."""
-        cls._redacted_report_cache.clear()
+        """Reset the redacted evidence and deduplication cache. For testing purposes only."""
+        cls._redacted_evidence_cache.clear()
 
     @classmethod
     def wrap(cls, func):
@@ -88,26 +97,13 @@ class VulnerabilityBase(Operation):
         if line_number is not None and (line_number == 0 or line_number < -1):
             line_number = -1
 
-        report = core.get_item(IAST.CONTEXT_KEY, span=span)
-        if report:
-            report.vulnerabilities.add(
-                Vulnerability(
-                    type=vulnerability_type,
-                    evidence=evidence,
-                    location=Location(path=file_name, line=line_number, spanId=span.span_id),
-                )
-            )
+        vulnerability = Vulnerability(
+            type=vulnerability_type,
+            evidence=evidence,
+            location=Location(path=file_name, line=line_number, spanId=span.span_id),
+        )
 
-        else:
-            report = IastSpanReporter(
-                vulnerabilities={
-                    Vulnerability(
-                        type=vulnerability_type,
-                        evidence=evidence,
-                        location=Location(path=file_name, line=line_number, spanId=span.span_id),
-                    )
-                }
-            )
+        report_sources = None
         if sources:
 
             def cast_value(value):
@@ -117,18 +113,83 @@ class VulnerabilityBase(Operation):
                     value_decoded = value
                 return value_decoded
 
-            report.sources = [Source(origin=x.origin, name=x.name, value=cast_value(x.value)) for x in sources]
+            report_sources = [Source(origin=x.origin, name=x.name, value=cast_value(x.value)) for x in sources]
 
         if getattr(cls, "redact_report", False):
-            redacted_report = cls._redacted_report_cache.get(
-                hash(report), lambda x: cls._redact_report(cast(IastSpanReporter, report))
-            )
+            report_sources = cls._redact_vulnerability(vulnerability, report_sources)
+
+        report = core.get_item(IAST.CONTEXT_KEY, span=span)
+        if report:
+            report.vulnerabilities.add(vulnerability)
         else:
-            redacted_report = report
-        core.set_item(IAST.CONTEXT_KEY, redacted_report, span=span)
+            report = IastSpanReporter(vulnerabilities={vulnerability})
+        if report_sources is not None:
+            report.sources = report_sources
+        core.set_item(IAST.CONTEXT_KEY, report, span=span)
 
         return True
 
+    @classmethod
+    def _redact_vulnerability(cls, vulnerability, sources):
+        # type: (Vulnerability, Optional[List[Source]]) -> Optional[List[Source]]
+        """Redact the evidence of a vulnerability and its sources in place, and return the redacted sources.
+
+        The redacted evidence and sources are cached by their original values, so that the sink specific
+        redaction only runs once for the same evidence and sources.
+        """
+        evidence = vulnerability.evidence
+        # Key on the evidence content: Evidence.__hash__ ignores the order of the value parts
+        parts_key = (
+            tuple(tuple(sorted(part.items())) for part in evidence.valueParts)
+            if evidence.valueParts is not None
+            else None
+        )
+        key = (
+            cls,
+            evidence.value,
+            evidence.pattern,
+            evidence.redacted,
+            parts_key,
+            tuple(sources) if sources else (),
+        )
+        redacted = cls._redacted_evidence_cache.get(
+            key, lambda _: cls._compute_redacted_vulnerability(vulnerability, sources)
+        )
+        redacted_evidence, redacted_sources = redacted
+        # The redacted evidence and sources are copied as the report can be modified afterwards
+        evidence.value, evidence.pattern, evidence.redacted = redacted_evidence[:3]
+        value_parts = redacted_evidence[3]
+        evidence.valueParts = [dict(part) for part in value_parts] if value_parts is not None else None
+        if sources is None:
+            return None
+        return [attr.evolve(source) for source in redacted_sources]
+
+    @classmethod
+    def _compute_redacted_vulnerability(cls, vulnerability, sources):
+        # type: (Vulnerability, Optional[List[Source]]) -> Tuple[Tuple[Any, ...], Tuple[Source, ...]]
+        # Redact copies so that the original values are kept as the key of the cache
+        evidence = vulnerability.evidence
+        evidence_copy = Evidence(
+            value=evidence.value,
+            pattern=evidence.pattern,
+            valueParts=[dict(part) for part in evidence.valueParts] if evidence.valueParts is not None else None,
+            redacted=evidence.redacted,
+        )
+        vulnerability_copy = attr.evolve(vulnerability, evidence=evidence_copy)
+        sources_copy = [attr.evolve(source) for source in sources] if sources else []
+        report = cls._redact_report(IastSpanReporter(sources=sources_copy, vulnerabilities={vulnerability_copy}))
+        redacted_vulnerability = next(iter(report.vulnerabilities))
+        redacted_evidence = redacted_vulnerability.evidence
+        return (
+            (
+                redacted_evidence.value,
+                redacted_evidence.pattern,
+                redacted_evidence.redacted,
+                tuple(redacted_evidence.valueParts) if redacted_evidence.valueParts is not None else None,
+            ),
+            tuple(report.sources),
+        )
+
     @classmethod
     def report(cls, evidence_value="", sources=None):
         # type: (Union[Text|List[Dict[str, Any]]], Optional[List[Source]]) -> None
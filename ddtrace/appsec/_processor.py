@@ -256,8 +256,7 @@ class AppSecSpanProcessor(SpanProcessor):
             _asm_request_context.set_waf_address(SPAN_DATA_NAMES.REQUEST_HTTP_IP, ip, span)
             if ip and self._is_needed(WAF_DATA_NAMES.REQUEST_HTTP_IP):
                 log.debug("[DDAS-001-00] Executing ASM WAF for checking IP block")
-                # _asm_request_context.call_callback()
-                _asm_request_context.call_waf_callback({"REQUEST_HTTP_IP": None})
+                _asm_request_context.defer_waf_callback(("REQUEST_HTTP_IP",))
 
     def _waf_action(
         self, span: Span, ctx: ddwaf_context_capsule, custom_data: Optional[Dict[str, Any]] = None, **kwargs
@@ -419,6 +418,9 @@ class AppSecSpanProcessor(SpanProcessor):
                 if headers_req:
                     _set_headers(span, headers_req, kind="request", only_asm_enabled=True)
 
+                # addresses batched after the last WAF run of the request
+                _asm_request_context.flush_waf_batch()
+
                 # this call is only necessary for tests or frameworks that are not using blocking
                 if not has_triggers(span) and _asm_request_context.in_context():
                     log.debug("metrics waf call")
@@ -438,8 +438,19 @@ def traced_get_response(django, pin, func, instance, args, kwargs):
 
     request_headers = utils._get_request_headers(request)
 
+    # Resolve the view before the request span starts, so that its route template is known when the span starts
+    resolver_match = None
+    resolver = get_resolver(getattr(request, "urlconf", None))
+    if resolver:
+        try:
+            resolver_match = resolver.resolve(request.path_info)
+            log.debug("resolver.pattern %s", resolver_match.kwargs)
+        except Exception:
+            pass
+
     with core.context_with_data(
         "django.traced_get_response",
+        route=utils.get_django_2_route(request, resolver_match) if utils.DJANGO22 and resolver_match else None,
         remote_addr=request.META.get("REMOTE_ADDR"),
         headers=request_headers,
         headers_case_sensitive=django.VERSION < (2, 2),
@@ -495,13 +506,7 @@ def traced_get_response(django, pin, func, instance, args, kwargs):
             uri = utils.get_request_uri(request)
             if uri is not None and query:
                 uri += "?" + query
-            resolver = get_resolver(getattr(request, "urlconf", None))
-            if resolver:
-                try:
-                    path = resolver.resolve(request.path_info).kwargs
-                    log.debug("resolver.pattern %s", path)
-                except Exception:
-                    path = None
+            path = resolver_match.kwargs if resolver_match else None
 
             core.dispatch("django.start_response", (ctx, request, utils._extract_body, query, uri, path))
             core.dispatch("django.start_response.post", ("Django",))
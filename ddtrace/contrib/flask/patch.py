@@ -133,6 +133,22 @@ class _FlaskWSGIMiddleware(_DDWSGIMiddlewareBase):
             result = start_response(status_code, headers)
         return result
 
+    def _request_route(self, environ):
+        # The wrapped application is the bound Flask.wsgi_app method
+        app = getattr(self.app, "__self__", None)
+        if app is None:
+            return None
+        try:
+            # DEV: This executes before a request context is created
+            url_adapter = app.create_url_adapter(_RequestType(environ))
+            if url_adapter is None:
+                return None
+            rule, _ = url_adapter.match(return_rule=True)
+        except Exception:
+            # e.g. NotFound, MethodNotAllowed or RequestRedirect
+            return None
+        return rule.rule
+
     def _request_call_modifier(self, ctx, parsed_headers=None):
         environ = ctx.get_item("environ")
         # Create a werkzeug request from the `environ` to make interacting with it easier
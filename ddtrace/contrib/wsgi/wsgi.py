@@ -89,6 +89,11 @@ class _DDWSGIMiddlewareBase(object):
         "Returns the name of a response span. Example: `flask.response`"
         raise NotImplementedError
 
+    def _request_route(self, environ):
+        # type: (Dict[str, str]) -> Optional[str]
+        "Returns the route template matching the request, if the application can resolve it before handling it"
+        return None
+
     def __call__(self, environ: Iterable, start_response: Callable) -> wrapt.ObjectProxy:
         headers = get_request_headers(environ)
         closing_iterable = ()
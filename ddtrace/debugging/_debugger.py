@@ -7,9 +7,11 @@ from pathlib import Path
 import sys
 import threading
 from types import CoroutineType
+from types import FrameType
 from types import FunctionType
 from types import ModuleType
 from typing import Any
+from typing import Callable
 from typing import Deque
 from typing import Dict
 from typing import Iterable
@@ -49,6 +51,7 @@ from ddtrace.debugging._probe.remoteconfig import ProbePollerEvent
 from ddtrace.debugging._probe.remoteconfig import ProbePollerEventType
 from ddtrace.debugging._probe.remoteconfig import ProbeRCAdapter
 from ddtrace.debugging._probe.status import ProbeStatusLogger
+from ddtrace.debugging._signal.budget import SignalBudget
 from ddtrace.debugging._signal.collector import SignalCollector
 from ddtrace.debugging._signal.collector import SignalContext
 from ddtrace.debugging._signal.metric_sample import MetricSample
@@ -149,6 +152,53 @@ class DebuggerModuleWatchdog(ModuleWatchdog):
             cls._instance.after_import(module)
 
 
+SignalFactory = Callable[[FrameType, threading.Thread, List[Tuple[str, Any]]], Signal]
+
+
+class FunctionProbeDispatch(Dict[str, FunctionProbe]):
+    """Function probes of a wrapped function, with their dispatch plan.
+
+    The plan is compiled every time a probe is added or removed, so that the
+    instrumented function only has to go through an ordered tuple of
+    ``(probe, signal factory, rate limiter)`` entries on each call. The rate
+    limiter is set only for the log probes, which can be skipped before
+    creating any signal when their rate limit is exceeded, provided that they
+    have no condition. The condition is checked on each call, as probe updates
+    can add or remove it.
+    """
+
+    def __init__(self, debugger: "Debugger", probes: Dict[str, FunctionProbe]) -> None:
+        super().__init__(probes)
+        self._debugger = debugger
+        self.plan: Tuple[Tuple[FunctionProbe, SignalFactory, Optional[RateLimiter]], ...] = ()
+        self.compile()
+
+    def __setitem__(self, probe_id: str, probe: FunctionProbe) -> None:
+        super().__setitem__(probe_id, probe)
+        self.compile()
+
+    def __delitem__(self, probe_id: str) -> None:
+        super().__delitem__(probe_id)
+        self.compile()
+
+    def compile(self) -> None:
+        plan = []
+
+        # Trigger the context creators first, so that the new context can be
+        # consumed by the consumers.
+        for probe in sorted(self.values(), key=lambda p: not p.__context_creator__):
+            factory = self._debugger._signal_factory(probe)
+            if factory is None:
+                log.error("Unsupported probe type: %s", type(probe))
+                continue
+
+            limiter = probe.limiter if isinstance(probe, LogFunctionProbe) else None
+
+            plan.append((probe, factory, limiter))
+
+        self.plan = tuple(plan)
+
+
 class Debugger(Service):
     _instance: Optional["Debugger"] = None
     _probe_meter = _probe_metrics.get_meter("probe")
@@ -232,10 +282,17 @@ class Debugger(Service):
         self._signal_queue = SignalQueue(
             encoder=LogSignalJsonEncoder(service_name),
             on_full=self._on_encoder_buffer_full,
+            deferred=True,
+            batch_size=di_config.upload_batch_size,
         )
         self._status_logger = status_logger = self.__logger__(service_name)
 
         self._probe_registry = ProbeRegistry(status_logger=status_logger)
+        self._signal_budget = SignalBudget(
+            max_overhead=di_config.max_overhead,
+            on_degraded=self._probe_registry.set_sample_rate,
+            on_restored=self._probe_registry.set_sample_rate,
+        )
         self._uploader = self.__uploader__(self._signal_queue)
         self._collector = self.__collector__(self._signal_queue)
         self._services = [self._uploader]
@@ -253,7 +310,7 @@ class Debugger(Service):
         if ed_config.enabled:
             from ddtrace.debugging._exception.auto_instrument import SpanExceptionProcessor
 
-            self._span_processor = SpanExceptionProcessor(collector=self._collector)
+            self._span_processor = SpanExceptionProcessor(collector=self._collector, budget=self._signal_budget)
             self._span_processor.register()
         else:
             self._span_processor = None
@@ -286,6 +343,12 @@ class Debugger(Service):
         instrumented code is running.
         """
         try:
+            budget = self._signal_budget
+            if not budget.admit(probe.probe_id):
+                self._collector.skip(probe, "budget")
+                return
+
+            start_time = compat.thread_time_ns()
             actual_frame = sys._getframe(1)
             signal: Optional[Signal] = None
             if isinstance(probe, MetricLineProbe):
@@ -323,86 +386,99 @@ class Debugger(Service):
             log.debug("[%s][P: %s] Debugger. Report signal %s", os.getpid(), os.getppid(), signal)
             self._collector.push(signal)
 
+            budget.record(probe.probe_id, compat.thread_time_ns() - start_time)
+
             if signal.state is SignalState.DONE:
                 self._probe_registry.set_emitting(probe)
 
         except Exception:
             log.error("Failed to execute probe hook", exc_info=True)
 
-    def _dd_debugger_wrapper(self, wrappers: Dict[str, FunctionProbe]) -> Wrapper:
+    def _signal_factory(self, probe: FunctionProbe) -> Optional[SignalFactory]:
+        """Get the signal constructor of a function probe, with its probe bound."""
+        tracer = self._tracer
+
+        if isinstance(probe, MetricFunctionProbe):
+            meter = self._probe_meter
+            return lambda frame, thread, args: MetricSample(
+                probe=probe,
+                frame=frame,
+                thread=thread,
+                args=args,
+                trace_context=tracer.current_trace_context(),
+                meter=meter,
+            )
+        if isinstance(probe, LogFunctionProbe):
+            return lambda frame, thread, args: Snapshot(
+                probe=probe,
+                frame=frame,
+                thread=thread,
+                args=args,
+                trace_context=tracer.current_trace_context(),
+            )
+        if isinstance(probe, SpanFunctionProbe):
+            return lambda frame, thread, args: DynamicSpan(
+                probe=probe,
+                frame=frame,
+                thread=thread,
+                args=args,
+                trace_context=tracer.current_trace_context(),
+            )
+        if isinstance(probe, SpanDecorationFunctionProbe):
+            return lambda frame, thread, args: SpanDecoration(
+                probe=probe,
+                frame=frame,
+                thread=thread,
+                args=args,
+            )
+        return None
+
+    def _dd_debugger_wrapper(self, wrappers: FunctionProbeDispatch) -> Wrapper:
         """Debugger wrapper.
 
         This gets called with a reference to the wrapped function and the probe,
-        together with the arguments to pass. We only check
-        whether the probe is active and the debugger is enabled. If so, we
-        capture all the relevant debugging context.
+        together with the arguments to pass. We go through the dispatch plan
+        of the function probes, and the relevant debugging context is captured
+        only if at least one of them might emit a signal.
         """
 
         def _(wrapped: FunctionType, args: Tuple[Any], kwargs: Dict[str, Any]) -> Any:
-            if not wrappers:
+            plan = wrappers.plan
+            if not plan:
                 return wrapped(*args, **kwargs)
 
-            argnames = wrapped.__code__.co_varnames
-            actual_frame = sys._getframe(1)
-            allargs = list(chain(zip(argnames, args), kwargs.items()))
-            thread = threading.current_thread()
-
-            open_contexts: Deque[SignalContext] = deque()
+            open_contexts: Optional[Deque[SignalContext]] = None
             signal: Optional[Signal] = None
+            budget = self._signal_budget
+
+            for probe, factory, limiter in plan:
+                # Probe conditions are evaluated before the rate limit, and
+                # their evaluation errors are reported, so only the rate limit
+                # of unconditional log probes can be checked in advance.
+                if limiter is not None and probe.condition is None and limiter.exceeded():
+                    self._collector.skip(probe, "rate")
+                    continue
 
-            # Group probes on the basis of whether they create new context.
-            context_creators: List[Probe] = []
-            context_consumers: List[Probe] = []
-            for p in wrappers.values():
-                (context_creators if p.__context_creator__ else context_consumers).append(p)
-
-            # Trigger the context creators first, so that the new context can be
-            # consumed by the consumers.
-            for probe in chain(context_creators, context_consumers):
-                # Because new context might be created, we need to recompute it
-                # for each probe.
-                trace_context = self._tracer.current_trace_context()
-
-                if isinstance(probe, MetricFunctionProbe):
-                    signal = MetricSample(
-                        probe=probe,
-                        frame=actual_frame,
-                        thread=thread,
-                        args=allargs,
-                        trace_context=trace_context,
-                        meter=self._probe_meter,
-                    )
-                elif isinstance(probe, LogFunctionProbe):
-                    signal = Snapshot(
-                        probe=probe,
-                        frame=actual_frame,
-                        thread=thread,
-                        args=allargs,
-                        trace_context=trace_context,
-                    )
-                elif isinstance(probe, SpanFunctionProbe):
-                    signal = DynamicSpan(
-                        probe=probe,
-                        frame=actual_frame,
-                        thread=thread,
-                        args=allargs,
-                        trace_context=trace_context,
-                    )
-                elif isinstance(probe, SpanDecorationFunctionProbe):
-                    signal = SpanDecoration(
-                        probe=probe,
-                        frame=actual_frame,
-                        thread=thread,
-                        args=allargs,
-                    )
-                else:
-                    log.error("Unsupported probe type: %s", type(probe))
+                if not budget.admit(probe.probe_id):
+                    self._collector.skip(probe, "budget")
                     continue
 
-                # Open probe signal contexts are ordered, with those that have
-                # created new tracing context first. We need to finalise them in
-                # reverse order, so we append them to the beginning.
-                open_contexts.appendleft(self._collector.attach(signal))
+                enter_time = compat.thread_time_ns()
+                if open_contexts is None:
+                    # The context is only collected for the first probe that
+                    # might emit a signal.
+                    actual_frame = sys._getframe(1)
+                    allargs = list(chain(zip(wrapped.__code__.co_varnames, args), kwargs.items()))
+                    thread = threading.current_thread()
+                    open_contexts = deque()
+
+                # Because new context might be created, the signal factories
+                # recompute the trace context for each probe. Open probe signal
+                # contexts are ordered, with those that have created new tracing
+                # context first. We need to finalise them in reverse order, so
+                # we append them to the beginning.
+                open_contexts.appendleft(self._collector.attach(factory(actual_frame, thread, allargs)))
+                budget.record(probe.probe_id, compat.thread_time_ns() - enter_time)
 
             if not open_contexts:
                 return wrapped(*args, **kwargs)
@@ -424,8 +500,10 @@ class Debugger(Service):
                     return dd_coroutine_wrapper(retval, open_contexts)
 
             for context in open_contexts:
+                exit_time = compat.thread_time_ns()
                 context.exit(retval, exc_info, end_time - start_time)
                 signal = context.signal
+                budget.record(signal.probe.probe_id, compat.thread_time_ns() - exit_time)
                 if signal.state is SignalState.DONE:
                     self._probe_registry.set_emitting(signal.probe)
 
@@ -531,6 +609,7 @@ class Debugger(Service):
 
             (registered_probe,) = self._probe_registry.unregister(probe)
             unregistered_probes.append(cast(LineProbe, registered_probe))
+            self._signal_budget.discard(probe.probe_id)
 
         probes_for_source: Dict[Path, List[LineProbe]] = defaultdict(list)
         for probe in unregistered_probes:
@@ -601,7 +680,9 @@ class Debugger(Service):
                     function,
                 )
             else:
-                wrappers = cast(FullyNamedWrappedFunction, function).__dd_wrappers__ = {probe.probe_id: probe}
+                wrappers = cast(FullyNamedWrappedFunction, function).__dd_wrappers__ = FunctionProbeDispatch(
+                    self, {probe.probe_id: probe}
+                )
                 self._function_store.wrap(cast(FunctionType, function), self._dd_debugger_wrapper(wrappers))
                 log.debug(
                     "[%s][P: %s] Function probe %r wrapped around %r",
@@ -639,6 +720,7 @@ class Debugger(Service):
                 continue
 
             (registered_probe,) = registered_probes
+            self._signal_budget.discard(probe.probe_id)
 
             assert probe.module is not None  # nosec
             module = sys.modules.get(probe.module, None)
@@ -1,14 +1,17 @@
 import abc
+from collections import deque
 from dataclasses import dataclass
 from heapq import heapify
 from heapq import heappop
 from heapq import heappush
 import json
+from json.encoder import encode_basestring_ascii
 import os
 from threading import Thread
 from types import FrameType
 from typing import Any
 from typing import Callable
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -62,6 +65,18 @@ class Encoder(abc.ABC):
     def encode(self, item: Any) -> bytes:
         """Encode the given snapshot."""
 
+    def payload(self, item: Any) -> Any:
+        """Take the data to encode from the given snapshot.
+
+        The payload is encoded later with ``encode_payload``, so it must not
+        refer to any object that the application can modify.
+        """
+        return item
+
+    def encode_payload(self, payload: Any) -> bytes:
+        """Encode the given payload."""
+        return self.encode(payload)
+
 
 class BufferedEncoder(abc.ABC):
     count = 0
@@ -229,6 +244,68 @@ class JSONTree:
         return list(self.root.leaves)
 
 
+PRUNED_PROPERTY = '{"pruned":true}'
+
+
+class BudgetedJsonEncoder(object):
+    """Single-pass JSON encoder with a size budget.
+
+    Objects are encoded as with ``json.dumps``, until the size of the encoded
+    data reaches the budget. From then on, the objects nested at least
+    ``min_level`` levels deep are not descended into and are replaced with the
+    pruned property instead. The other values are still encoded, so the
+    result can exceed the budget, but by far less than the unbounded encoding
+    of large objects.
+    """
+
+    def __init__(self, budget: int, min_level: int) -> None:
+        self.budget = budget
+        self.min_level = min_level
+
+    def encode(self, o: Any) -> str:
+        self._chunks: List[str] = []
+        self._size = 0
+        self._encode(o, 0)
+        return "".join(self._chunks)
+
+    def _emit(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+    def _encode(self, o: Any, level: int) -> None:
+        if isinstance(o, str):
+            self._emit(encode_basestring_ascii(o))
+
+        elif isinstance(o, dict):
+            if level >= self.min_level and self._size >= self.budget:
+                self._emit(PRUNED_PROPERTY)
+                return
+
+            self._emit("{")
+            first = True
+            for k, v in o.items():
+                if not first:
+                    self._emit(", ")
+                first = False
+                self._emit(encode_basestring_ascii(k if isinstance(k, str) else json.dumps(k)))
+                self._emit(": ")
+                self._encode(v, level + 1)
+            self._emit("}")
+
+        elif isinstance(o, (list, tuple)):
+            self._emit("[")
+            first = True
+            for v in o:
+                if not first:
+                    self._emit(", ")
+                first = False
+                self._encode(v, level)
+            self._emit("]")
+
+        else:
+            self._emit(json.dumps(o))
+
+
 class LogSignalJsonEncoder(Encoder):
     MAX_SIGNAL_SIZE = (1 << 20) - 2
     MIN_LEVEL = 5
@@ -237,14 +314,31 @@ class LogSignalJsonEncoder(Encoder):
         self._service = service
         self._host = host
 
+    def payload(self, log_signal: LogSignal) -> Dict[str, Any]:
+        """Build the payload of the given signal.
+
+        The payload only holds the data captured from the signal, so it can be
+        encoded later, once the instrumented code has moved on.
+        """
+        return _build_log_track_payload(self._service, log_signal, self._host)
+
     def encode(self, log_signal: LogSignal) -> bytes:
-        return self.pruned(json.dumps(_build_log_track_payload(self._service, log_signal, self._host))).encode("utf-8")
+        return self.encode_payload(self.payload(log_signal))
+
+    def encode_payload(self, payload: Dict[str, Any]) -> bytes:
+        log_signal_json = json.dumps(payload)
+        if len(log_signal_json) > self.MAX_SIGNAL_SIZE:
+            # Encode the payload again with a budget rather than parsing the
+            # oversized encoding to prune it. The budget leaves room for the
+            # values that cannot be pruned.
+            log_signal_json = BudgetedJsonEncoder(self.MAX_SIGNAL_SIZE >> 1, self.MIN_LEVEL).encode(payload)
+
+        return self.pruned(log_signal_json).encode("utf-8")
 
     def pruned(self, log_signal_json: str) -> str:
         if len(log_signal_json) <= self.MAX_SIGNAL_SIZE:
             return log_signal_json
 
-        PRUNED_PROPERTY = '{"pruned":true}'
         PRUNED_LEN = len(PRUNED_PROPERTY)
 
         tree = JSONTree(log_signal_json)
@@ -285,27 +379,88 @@ class LogSignalJsonEncoder(Encoder):
 
 
 class SignalQueue(BufferedEncoder):
+    """Queue of encoded signals.
+
+    When ``deferred`` is set, the payloads of the signals are built when they
+    are put in the queue, but they are only encoded when the queue is flushed,
+    that is on the uploader thread rather than on the thread that emitted them.
+    The payloads only hold the captured data, and no references to the
+    application objects. At most ``max_pending`` payloads can wait to be
+    encoded. A flush stops encoding pending payloads once the encoded data
+    reaches ``batch_size`` bytes, and the rest are left for the next flush.
+    """
+
     def __init__(
         self,
         encoder: Encoder,
         buffer_size: int = 4 * (1 << 20),
         on_full: Optional[Callable[[Any, bytes], None]] = None,
+        deferred: bool = False,
+        max_pending: int = 1024,
+        batch_size: Optional[int] = None,
     ) -> None:
         self._encoder = encoder
         self._buffer = JsonBuffer(buffer_size)
         self._lock = forksafe.Lock()
         self._on_full = on_full
-        self.count = 0
+        self._deferred = deferred
+        self._pending: Deque[Any] = deque()
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._count = 0
         self.max_size = buffer_size - self._buffer.size
 
+    @property
+    def count(self) -> int:  # type: ignore[override]
+        return self._count + len(self._pending)
+
     def put(self, item: Snapshot) -> int:
-        return self.put_encoded(item, self._encoder.encode(item))
+        if not self._deferred:
+            return self.put_encoded(item, self._encoder.encode(item))
+
+        payload = self._encoder.payload(item)
+        with self._lock:
+            pending = len(self._pending)
+            if pending < self._max_pending:
+                self._pending.append(payload)
+                return 0
+
+        if self._on_full is not None:
+            self._on_full(item, b"")
+        raise BufferFull(pending, 1)
+
+    def _encode_pending(self) -> None:
+        while self._pending and (self._batch_size is None or not self._count or self._buffer.size < self._batch_size):
+            with self._lock:
+                try:
+                    payload = self._pending.popleft()
+                except IndexError:
+                    break
+
+            try:
+                encoded = self._encoder.encode_payload(payload)
+            except Exception:
+                log.error("Failed to encode signal", exc_info=True)
+                continue
+
+            with self._lock:
+                try:
+                    self._buffer.put(encoded)
+                    self._count += 1
+                except BufferFull:
+                    if not self._count:
+                        # The signal does not fit in an empty buffer
+                        log.debug("Signal too large to be encoded")
+                        continue
+                    # Try again on the next flush
+                    self._pending.appendleft(payload)
+                    break
 
     def put_encoded(self, item: Snapshot, encoded: bytes) -> int:
         try:
             with self._lock:
                 size = self._buffer.put(encoded)
-                self.count += 1
+                self._count += 1
                 return size
         except BufferFull:
             if self._on_full is not None:
@@ -313,12 +468,15 @@ class SignalQueue(BufferedEncoder):
             raise
 
     def flush(self) -> Optional[bytes]:
+        if self._deferred:
+            self._encode_pending()
+
         with self._lock:
-            if self.count == 0:
+            if self._count == 0:
                 # Reclaim memory
                 self._buffer._reset()
                 return None
 
             encoded = self._buffer.flush()
-            self.count = 0
+            self._count = 0
             return encoded
@@ -11,13 +11,17 @@ import attr
 
 from ddtrace._trace.processor import SpanProcessor
 from ddtrace._trace.span import Span
+from ddtrace.debugging._config import ed_config
 from ddtrace.debugging._probe.model import LiteralTemplateSegment
 from ddtrace.debugging._probe.model import LogLineProbe
+from ddtrace.debugging._signal.budget import SignalBudget
 from ddtrace.debugging._signal.collector import SignalCollector
 from ddtrace.debugging._signal.snapshot import DEFAULT_CAPTURE_LIMITS
 from ddtrace.debugging._signal.snapshot import Snapshot
+from ddtrace.internal.compat import thread_time_ns
 from ddtrace.internal.rate_limiter import BudgetRateLimiterWithJitter as RateLimiter
 from ddtrace.internal.rate_limiter import RateLimitExceeded
+from ddtrace.internal.utils.cache import LFUCache
 
 
 GLOBAL_RATE_LIMITER = RateLimiter(
@@ -25,6 +29,13 @@ GLOBAL_RATE_LIMITER = RateLimiter(
     raise_on_exceed=False,
 )
 
+# used to account for the time spent capturing exception snapshots in the
+# signal budget, as the probes are created on the fly.
+BUDGET_KEY = "exception-replay"
+
+# maximum number of exception fingerprints to keep track of
+MAX_FINGERPRINTS = 1024
+
 # used to store a snapshot on the frame locals
 SNAPSHOT_KEY = "_dd_exception_replay_snapshot_id"
 
@@ -76,6 +87,22 @@ def unwind_exception_chain(
     return chain, exc_id
 
 
+def exception_fingerprint(chain: t.Deque[t.Tuple[BaseException, t.Optional[TracebackType]]]) -> int:
+    """Compute the fingerprint of an exception chain.
+
+    Exceptions of the same types raised through the same code locations have
+    the same fingerprint. Code objects are identified by their ID, as they are
+    not always hashable (e.g. when instrumented).
+    """
+    locations: t.List[t.Any] = []
+    for exc, tb in chain:
+        locations.append(type(exc))
+        while tb is not None:
+            locations.append((id(tb.tb_frame.f_code), tb.tb_lineno))
+            tb = tb.tb_next
+    return hash(tuple(locations))
+
+
 @attr.s
 class SpanExceptionProbe(LogLineProbe):
     @classmethod
@@ -142,16 +169,40 @@ def can_capture(span: Span) -> bool:
     raise ValueError(msg)
 
 
+@attr.s
+class CapturedException(object):
+    """Capture state of an exception fingerprint.
+
+    The span tags of the last capture are kept so that the spans of repeated
+    exceptions can link to the earlier snapshots without capturing new ones.
+    """
+
+    limiter = attr.ib(type=RateLimiter)
+    tags = attr.ib(type=t.Optional[t.List[t.Tuple[str, str]]], default=None)
+
+    @classmethod
+    def create(cls, fingerprint: int) -> "CapturedException":
+        interval = ed_config.capture_interval
+        return cls(
+            limiter=RateLimiter(
+                limit_rate=1.0 / interval if interval > 0 else float("inf"),
+                tau=interval if interval > 0 else 1.0,
+                raise_on_exceed=False,
+            )
+        )
+
+
 @attr.s
 class SpanExceptionProcessor(SpanProcessor):
     collector = attr.ib(type=SignalCollector)
+    budget = attr.ib(type=t.Optional[SignalBudget], default=None)
+    _fingerprints = attr.ib(type=LFUCache, init=False, factory=lambda: LFUCache(maxsize=MAX_FINGERPRINTS))
 
     def on_span_start(self, span: Span) -> None:
         pass
 
     def on_span_finish(self, span: Span) -> None:
-        if not (span.error and can_capture(span)):
-            # No error or budget to capture
+        if not span.error:
             return
 
         _, exc, _tb = sys.exc_info()
@@ -161,6 +212,23 @@ class SpanExceptionProcessor(SpanProcessor):
             # No exceptions to capture
             return
 
+        captured = self._fingerprints.get(exception_fingerprint(chain), CapturedException.create)
+        if captured.tags is not None and captured.limiter.exceeded():
+            # The same exception was captured recently, so we link to the
+            # earlier snapshots instead of capturing new ones.
+            for tag, value in captured.tags:
+                span.set_tag_str(tag, value)
+            return
+
+        budget = self.budget
+        if not ((budget is None or budget.admit(BUDGET_KEY)) and can_capture(span)):
+            # No budget to capture
+            return
+
+        start_time = thread_time_ns()
+        captured.limiter.limit()
+
+        tags: t.List[t.Tuple[str, str]] = []
         seq = count(1)  # 1-based sequence number
 
         while chain:
@@ -200,13 +268,20 @@ class SpanExceptionProcessor(SpanProcessor):
                     frame.f_locals[SNAPSHOT_KEY] = snapshot_id = snapshot.uuid
 
                 # Add correlation tags on the span
-                span.set_tag_str(FRAME_SNAPSHOT_ID_TAG % seq_nr, snapshot_id)
-                span.set_tag_str(FRAME_FUNCTION_TAG % seq_nr, code.co_name)
-                span.set_tag_str(FRAME_FILE_TAG % seq_nr, code.co_filename)
-                span.set_tag_str(FRAME_LINE_TAG % seq_nr, str(_tb.tb_lineno))
+                tags.append((FRAME_SNAPSHOT_ID_TAG % seq_nr, snapshot_id))
+                tags.append((FRAME_FUNCTION_TAG % seq_nr, code.co_name))
+                tags.append((FRAME_FILE_TAG % seq_nr, code.co_filename))
+                tags.append((FRAME_LINE_TAG % seq_nr, str(_tb.tb_lineno)))
 
                 # Move up the stack
                 _tb = _tb.tb_next
 
-            span.set_tag_str(DEBUG_INFO_TAG, "true")
-            span.set_tag_str(EXCEPTION_ID_TAG, str(exc_id))
+            tags.append((DEBUG_INFO_TAG, "true"))
+            tags.append((EXCEPTION_ID_TAG, str(exc_id)))
+
+        for tag, value in tags:
+            span.set_tag_str(tag, value)
+        captured.tags = tags
+
+        if budget is not None:
+            budget.record(BUDGET_KEY, thread_time_ns() - start_time)
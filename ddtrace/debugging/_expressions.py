@@ -24,6 +24,7 @@ Full grammar:
     arg_op_type             =>  filter | substring | getmember | index
 """  # noqa
 from itertools import chain
+import json
 import re
 import sys
 from types import FunctionType
@@ -44,6 +45,7 @@ from bytecode import Label
 from ddtrace.debugging._safety import safe_getitem
 from ddtrace.internal.compat import PYTHON_VERSION_INFO as PY
 from ddtrace.internal.logger import get_logger
+from ddtrace.internal.utils.cache import LFUCache
 
 
 DDASTType = Union[Dict[str, Any], Dict[str, List[Any]], Any]
@@ -85,7 +87,34 @@ def instanceof(value: Any, type_qname: str) -> bool:
     return False
 
 
+# Item getters of the exact collection types that can be indexed safely
+_GETITEM: Dict[type, Callable[[Any, Any], Any]] = {
+    list: list.__getitem__,
+    dict: dict.__getitem__,
+    tuple: tuple.__getitem__,
+}
+
+
+def _getitem(o: Any, i: Any) -> Any:
+    getitem = _GETITEM.get(type(o))
+    if getitem is None:
+        # Subclasses and other types
+        return safe_getitem(o, i)
+    return getitem(o, i)
+
+
 class DDCompiler:
+    """Compiler of DSL expressions.
+
+    Compiled expressions are cached by their canonical JSON AST, so that probes
+    with identical expressions share the same compiled function.
+    """
+
+    MAX_CACHE_SIZE = 256
+
+    def __init__(self) -> None:
+        self._cache = LFUCache(maxsize=self.MAX_CACHE_SIZE)
+
     @classmethod
     def __getmember__(cls, o, a):
         return object.__getattribute__(o, a)
@@ -98,6 +127,26 @@ class DDCompiler:
     def __ref__(cls, x):
         return x
 
+    def _getmember_function(self, attr: str) -> Callable[[Any, str], Any]:
+        """Get the function that accesses the given attribute on evaluation.
+
+        Unless the member access is customised, the safe attribute access is
+        called directly.
+        """
+        if type(self).__getmember__.__func__ is DDCompiler.__getmember__.__func__:  # type: ignore[attr-defined]
+            return object.__getattribute__
+        return self.__getmember__
+
+    def _index_function(self, index: DDASTType) -> Callable[[Any, Any], Any]:
+        """Get the function that accesses the given index on evaluation.
+
+        Unless the index access is customised, the items of the common
+        collection types are accessed directly.
+        """
+        if type(self).__index__.__func__ is DDCompiler.__index__.__func__:  # type: ignore[attr-defined]
+            return _getitem
+        return self.__index__
+
     def _make_function(self, ast: DDASTType, args: Tuple[str, ...], name: str) -> FunctionType:
         compiled = self._compile_predicate(ast)
         if compiled is None:
@@ -300,7 +349,7 @@ class DDCompiler:
             if not cv:
                 return None
 
-            return self._call_function(self.__getmember__, cv, [Instr("LOAD_CONST", attr)])
+            return self._call_function(self._getmember_function(attr), cv, [Instr("LOAD_CONST", attr)])
 
         if _type == "index":
             v, i = args
@@ -310,7 +359,7 @@ class DDCompiler:
             ci = self._compile_predicate(i)
             if not ci:
                 return None
-            return self._call_function(self.__index__, cv, ci)
+            return self._call_function(self._index_function(i), cv, ci)
 
         if _type == "instanceof":
             v, t = args
@@ -346,7 +395,10 @@ class DDCompiler:
         )
 
     def compile(self, ast: DDASTType) -> Callable[[Dict[str, Any]], Any]:
-        return self._make_function(ast, ("_locals",), "<expr>")
+        return self._cache.get(
+            json.dumps(ast, sort_keys=True, separators=(",", ":")),
+            lambda _: self._make_function(ast, ("_locals",), "<expr>"),
+        )
 
 
 dd_compile = DDCompiler().compile
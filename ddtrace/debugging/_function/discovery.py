@@ -1,6 +1,8 @@
 from collections import defaultdict
 from collections import deque
+import os
 from pathlib import Path
+from threading import Lock
 
 from ddtrace.internal.utils.inspection import undecorated
 from ddtrace.vendor.wrapt.wrappers import FunctionWrapper
@@ -11,6 +13,7 @@ try:
 except ImportError:
     from typing_extensions import Protocol  # type: ignore[assignment]
 
+from types import CodeType
 from types import FunctionType
 from types import ModuleType
 from typing import Any
@@ -18,6 +21,7 @@ from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -172,6 +176,86 @@ def _collect_functions(module: ModuleType) -> Dict[str, FullyNamedFunction]:
     return functions
 
 
+# Code objects are identified by their name and first line number, which are
+# the same for all the code objects compiled from the same source.
+CodeKey = Tuple[str, int]
+
+
+def _code_key(code: CodeType) -> CodeKey:
+    return code.co_name, code.co_firstlineno
+
+
+class LineIndex(object):
+    """Index of the code objects of a source file by line number.
+
+    The index is extended incrementally with code objects and all the code
+    objects nested in their constants. Code objects already seen are skipped,
+    so adding the same code again is cheap.
+    """
+
+    def __init__(self, path: Path, mtime: int) -> None:
+        self.path = path
+        self.mtime = mtime
+        self._lines: Dict[int, Set[CodeKey]] = defaultdict(set)
+        self._seen: Set[CodeKey] = set()
+        self._lock = Lock()
+
+    def add(self, code: CodeType) -> None:
+        with self._lock:
+            codes = deque([code])
+            while codes:
+                c = codes.popleft()
+                key = _code_key(c)
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+
+                # The module code object owns the module-level lines, which do
+                # not belong to any function.
+                if c.co_name != "<module>":
+                    for lineno in linenos(c):
+                        self._lines[lineno].add(key)
+
+                codes.extend(_ for _ in c.co_consts if isinstance(_, CodeType))
+
+    def at_line(self, line: int) -> Set[CodeKey]:
+        """Get the keys of the code objects at the given line."""
+        return self._lines.get(line, set())
+
+    def lines(self) -> List[int]:
+        """Get all the indexed line numbers in ascending order."""
+        return sorted(self._lines)
+
+
+# Line indices by module origin. These survive the modules they were built for,
+# e.g. across reloads, as long as the source file is not modified.
+_line_indices: Dict[Path, LineIndex] = {}
+
+
+def line_index(module: ModuleType) -> Optional[LineIndex]:
+    """Get the line index of the source file of the given module.
+
+    The index is cached by module origin and is rebuilt if the modification
+    time of the source file changes. It is only filled with the code objects of
+    the functions of the loaded module, and never with code compiled again from
+    the source file, which might have changed since the module was imported.
+    """
+    path = origin(module)
+    if path is None:
+        return None
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    index = _line_indices.get(path)
+    if index is None or index.mtime != mtime:
+        index = _line_indices[path] = LineIndex(path, mtime)
+
+    return index
+
+
 class FunctionDiscovery(defaultdict):
     """Discover all function objects in a module.
 
@@ -181,32 +265,92 @@ class FunctionDiscovery(defaultdict):
     instances of this class should be obtained with the ``from_module`` class
     method. This builds the discovery object and caches the information on the
     module object itself.
+
+    Functions are resolved lazily: the module is only walked for function
+    objects once, the first time they are needed, and the line numbers are
+    looked up in the :class:`LineIndex` of the module source file, which is
+    shared with the later instances of the module, e.g. after a reload. The
+    mapping is filled as line numbers are looked up, and it is filled with all
+    the line numbers before it is enumerated.
     """
 
     def __init__(self, module: ModuleType) -> None:
-        super().__init__(list)
+        super().__init__()
         self._module = module
-        self._fullname_index = {}
+        self._module_path = origin(module)
+        self._line_index = line_index(module)
+        self._collected: Optional[Tuple[Dict[str, FullyNamedFunction], Dict[CodeKey, List[FullyNamedFunction]]]] = None
+
+    def _collect(self) -> Tuple[Dict[str, FullyNamedFunction], Dict[CodeKey, List[FullyNamedFunction]]]:
+        if self._collected is not None:
+            return self._collected
 
-        functions = _collect_functions(module)
+        fullname_index: Dict[str, FullyNamedFunction] = {}
+        code_index: Dict[CodeKey, List[FullyNamedFunction]] = defaultdict(list)
         seen_functions = set()
-        module_path = origin(module)
-        if module_path is None:
-            # We are not going to collect anything because no code objects will
-            # match the origin.
-            return
-
-        for fname, function in functions.items():
-            if (
-                function not in seen_functions
-                and Path(cast(FunctionType, function).__code__.co_filename).resolve() == module_path
-            ):
-                # We only map line numbers for functions that actually belong to
-                # the module.
-                for lineno in linenos(cast(FunctionType, function)):
-                    self[lineno].append(function)
-            self._fullname_index[fname] = function
-            seen_functions.add(function)
+
+        if self._module_path is not None:
+            for fname, function in _collect_functions(self._module).items():
+                code = cast(FunctionType, function).__code__
+                if function not in seen_functions and Path(code.co_filename).resolve() == self._module_path:
+                    # We only map line numbers for functions that actually
+                    # belong to the module.
+                    code_index[_code_key(code)].append(function)
+                    if self._line_index is not None:
+                        self._line_index.add(code)
+                fullname_index[fname] = function
+                seen_functions.add(function)
+
+        self._collected = fullname_index, code_index
+        return self._collected
+
+    @property
+    def _fullname_index(self) -> Dict[str, FullyNamedFunction]:
+        return self._collect()[0]
+
+    def __missing__(self, line: int) -> List[FullyNamedFunction]:
+        if self._line_index is None:
+            return []
+
+        code_index = self._collect()[1]
+        functions = [f for key in self._line_index.at_line(line) for f in code_index.get(key, [])]
+        if functions:
+            self[line] = functions
+        return functions
+
+    def lines(self) -> List[int]:
+        """Get all the line numbers with functions."""
+        if self._line_index is None:
+            return []
+        self._collect()
+        return [line for line in self._line_index.lines() if self.at_line(line)]
+
+    def _fill(self) -> None:
+        # Look up all the line numbers, so that the mapping has them all
+        self.lines()
+
+    def __contains__(self, line: object) -> bool:
+        return isinstance(line, int) and bool(self.at_line(line))
+
+    def __iter__(self) -> Iterator[int]:
+        self._fill()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._fill()
+        return super().__len__()
+
+    def keys(self):
+        self._fill()
+        return super().keys()
+
+    def values(self):
+        self._fill()
+        return super().values()
+
+    def items(self):
+        self._fill()
+        return super().items()
 
     def at_line(self, line: int) -> List[FullyNamedFunction]:
         """Get the functions at the given line.
@@ -3,16 +3,18 @@ from types import FunctionType
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import cast
 
 from ddtrace.debugging._function.discovery import FullyNamed
 from ddtrace.internal.injection import HookInfoType
 from ddtrace.internal.injection import HookType
 from ddtrace.internal.injection import eject_hooks
-from ddtrace.internal.injection import inject_hooks
+from ddtrace.internal.injection import inject_hooks_in_code
 from ddtrace.internal.wrapping import WrappedFunction
 from ddtrace.internal.wrapping import Wrapper
 from ddtrace.internal.wrapping import unwrap
@@ -21,6 +23,14 @@ from ddtrace.internal.wrapping import wrap
 
 WrapperType = Callable[[FunctionType, Any, Any, Any], Any]
 
+# Hooks are identified by the hook, the line and the identity of the argument
+HookKeyType = Tuple[HookType, int, int]
+
+
+def _hook_key(hook: HookInfoType) -> HookKeyType:
+    _hook, line, arg = hook
+    return _hook, line, id(arg)
+
 
 class FullyNamedWrappedFunction(FullyNamed, WrappedFunction):
     """A fully named wrapper function."""
@@ -37,11 +47,21 @@ class FunctionStore(object):
 
     If extra attributes are defined during the patching process, they will get
     removed when the functions are restored.
+
+    The hooks injected into a function are tracked, and the code of the
+    function is always generated from its original code with all its hooks in
+    a single rewrite. The generated code objects are cached by the set of hooks,
+    so that injecting and ejecting the same hooks does not recompile the
+    function.
     """
 
+    MAX_CODE_CACHE_SIZE = 32
+
     def __init__(self, extra_attrs: Optional[List[str]] = None) -> None:
         self._code_map: Dict[FunctionType, CodeType] = {}
         self._wrapper_map: Dict[FunctionType, Wrapper] = {}
+        self._hooks: Dict[FunctionType, Dict[HookKeyType, HookInfoType]] = {}
+        self._code_cache: Dict[FunctionType, Dict[FrozenSet[HookKeyType], CodeType]] = {}
         self._extra_attrs = ["__dd_wrapped__"]
         if extra_attrs:
             self._extra_attrs.extend(extra_attrs)
@@ -56,6 +76,49 @@ class FunctionStore(object):
         if function not in self._code_map:
             self._code_map[function] = function.__code__
 
+    def _move_hooks(self, source: FunctionType, target: FunctionType) -> None:
+        """Track the hooks of the source function under the target function.
+
+        This is needed when wrapping moves the code of a function, together
+        with its hooks, to another function object.
+        """
+        hooks = self._hooks.pop(source, None)
+        if hooks is None:
+            return
+
+        self._hooks[target] = hooks
+        self._code_map.setdefault(target, self._code_map[source])
+        cache = self._code_cache.pop(source, None)
+        if cache is not None:
+            self._code_cache[target] = cache
+
+    def _rewrite(self, function: FunctionType, hooks: Dict[HookKeyType, HookInfoType]) -> List[HookInfoType]:
+        """Set the code of the function to its original code with the given hooks.
+
+        Returns the list of hooks that failed to be injected.
+        """
+        original_code = self._code_map[function]
+        if not hooks:
+            function.__code__ = original_code
+            return []
+
+        cache = self._code_cache.setdefault(function, {})
+        code = cache.get(frozenset(hooks))
+        if code is not None:
+            function.__code__ = code
+            return []
+
+        code, failed = inject_hooks_in_code(original_code, list(hooks.values()))
+        for hook in failed:
+            del hooks[_hook_key(hook)]
+
+        if len(cache) >= self.MAX_CODE_CACHE_SIZE:
+            cache.clear()
+        cache[frozenset(hooks)] = code
+
+        function.__code__ = code
+        return failed
+
     def inject_hooks(self, function: FullyNamedWrappedFunction, hooks: List[HookInfoType]) -> Set[str]:
         """Bulk-inject hooks into a function.
 
@@ -66,7 +129,11 @@ class FunctionStore(object):
         except AttributeError:
             f = cast(FunctionType, function)
             self._store(f)
-            return {p.probe_id for _, _, p in inject_hooks(f, hooks)}
+            function_hooks = dict(self._hooks.get(f, {}))
+            function_hooks.update((_hook_key(hook), hook) for hook in hooks)
+            failed = self._rewrite(f, function_hooks)
+            self._hooks[f] = function_hooks
+            return {p.probe_id for _, _, p in failed}
 
     def eject_hooks(self, function: FunctionType, hooks: List[HookInfoType]) -> Set[str]:
         """Bulk-eject hooks from a function.
@@ -77,7 +144,17 @@ class FunctionStore(object):
             wrapped = cast(FullyNamedWrappedFunction, function).__dd_wrapped__
         except AttributeError:
             # Not a wrapped function so we can actually eject from it
-            return {p.probe_id for _, _, p in eject_hooks(function, hooks)}
+            function_hooks = self._hooks.get(function)
+            if function_hooks is None:
+                # The hooks were not injected by this store
+                return {p.probe_id for _, _, p in eject_hooks(function, hooks)}
+
+            failed = set()
+            for hook in hooks:
+                if function_hooks.pop(_hook_key(hook), None) is None:
+                    failed.add(hook[2].probe_id)
+            self._rewrite(function, function_hooks)
+            return failed
         else:
             # Try on the wrapped function.
             return self.eject_hooks(cast(FunctionType, wrapped), hooks)
@@ -95,13 +172,22 @@ class FunctionStore(object):
         self._store(function)
         self._wrapper_map[function] = wrapper
         wrap(function, wrapper)
+        # The hooks are now in the code of the wrapped function
+        self._move_hooks(function, cast(FunctionType, cast(FullyNamedWrappedFunction, function).__dd_wrapped__))
 
     def unwrap(self, function: FullyNamedWrappedFunction) -> None:
         """Unwrap a hook around a wrapped function."""
+        wrapped = cast(FunctionType, function.__dd_wrapped__)
         unwrap(function, self._wrapper_map.pop(cast(FunctionType, function)))
+        if not hasattr(function, "__dd_wrapped__"):
+            # The code of the wrapped function, and its hooks, are back in the
+            # function
+            self._move_hooks(wrapped, cast(FunctionType, function))
 
     def restore_all(self) -> None:
         """Restore all the patched functions to their original form."""
+        self._hooks.clear()
+        self._code_cache.clear()
         for function, code in self._code_map.items():
             function.__code__ = code
             for attr in self._extra_attrs:
@@ -20,6 +20,7 @@ class ProbeRegistryEntry(object):
         "probe",
         "installed",
         "emitting",
+        "sample_rate",
         "error_type",
         "message",
     )
@@ -28,6 +29,7 @@ class ProbeRegistryEntry(object):
         self.probe = probe
         self.installed = False
         self.emitting = False
+        self.sample_rate = 1.0
         self.error_type: Optional[str] = None
         self.message: Optional[str] = None
 
@@ -37,6 +39,9 @@ class ProbeRegistryEntry(object):
     def set_emitting(self) -> None:
         self.emitting = True
 
+    def set_sample_rate(self, sample_rate: float) -> None:
+        self.sample_rate = sample_rate
+
     def set_error(self, error_type: str, message: str) -> None:
         self.error_type = error_type
         self.message = message
@@ -121,6 +126,26 @@ class ProbeRegistry(dict):
                 entry.set_emitting()
                 self.logger.emitting(probe)
 
+    def set_sample_rate(self, probe_id: str, sample_rate: float) -> None:
+        """Set the sample rate of a probe that is emitting within the overhead
+        budget.
+
+        The probe status is logged when the probe starts or stops being sampled
+        down.
+        """
+        with self._lock:
+            entry = cast(Optional[ProbeRegistryEntry], self.get(probe_id))
+            if entry is None:
+                # Not a registered probe, e.g. an exception replay probe
+                return
+
+            degraded = entry.sample_rate < 1.0
+            entry.set_sample_rate(sample_rate)
+            if sample_rate < 1.0 and not degraded:
+                self.logger.degraded(entry.probe, sample_rate)
+            elif sample_rate >= 1.0 and degraded:
+                self.logger.emitting(entry.probe, "Probe %s is no longer sampled down" % probe_id)
+
     def set_error(self, probe: Probe, error_type: str, message: str) -> None:
         """Set the error message for a probe."""
         with self._lock:
@@ -128,7 +153,9 @@ class ProbeRegistry(dict):
             self.logger.error(probe, (error_type, message))
 
     def _log_probe_status_unlocked(self, entry: ProbeRegistryEntry) -> None:
-        if entry.emitting:
+        if entry.emitting and entry.sample_rate < 1.0:
+            self.logger.degraded(entry.probe, entry.sample_rate)
+        elif entry.emitting:
             self.logger.emitting(entry.probe)
         elif entry.installed:
             self.logger.installed(entry.probe)
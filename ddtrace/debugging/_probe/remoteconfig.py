@@ -264,6 +264,10 @@ class DebuggerRemoteConfigSubscriber(RemoteConfigSubscriber):
     def __init__(self, data_connector, callback, name, status_logger):
         super().__init__(data_connector, callback, name)
         self._configs: Dict[str, Dict[str, Probe]] = {}
+        # The raw configurations the probes were built from. Every update
+        # carries all the configurations, so this avoids parsing the probes
+        # and compiling their expressions again when they did not change.
+        self._raw_configs: Dict[str, Any] = {}
         self._status_timestamp_sequence = count(
             time.time() + di_config.diagnostics_interval, di_config.diagnostics_interval
         )
@@ -316,6 +320,12 @@ class DebuggerRemoteConfigSubscriber(RemoteConfigSubscriber):
             self._callback(ProbePollerEvent.NEW_PROBES, new_probes)
 
     def _update_probes_for_config(self, config_id: str, config: Any) -> None:
+        if config_id in self._raw_configs and self._raw_configs[config_id] == config:
+            log.debug(
+                "[%s][P: %s] Dynamic Instrumentation, configuration %s unchanged", os.getpid(), os.getppid(), config_id
+            )
+            return
+
         prev_probes: Dict[str, Probe] = self._configs.get(config_id, {})
         next_probes: Dict[str, Probe] = (
             {probe.probe_id: probe for probe in get_probes(config, self._status_logger)}
@@ -327,8 +337,10 @@ class DebuggerRemoteConfigSubscriber(RemoteConfigSubscriber):
 
         if next_probes:
             self._configs[config_id] = next_probes
+            self._raw_configs[config_id] = config
         else:
             self._configs.pop(config_id, None)
+            self._raw_configs.pop(config_id, None)
 
 
 class ProbeRCAdapter(PubSub):
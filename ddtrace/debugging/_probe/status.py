@@ -1,4 +1,7 @@
+import ctypes
+import hashlib
 import json
+import os
 from queue import SimpleQueue as Queue
 import time
 import typing as t
@@ -10,6 +13,7 @@ from ddtrace.debugging._metrics import metrics
 from ddtrace.debugging._probe.model import Probe
 from ddtrace.internal import compat
 from ddtrace.internal import runtime
+from ddtrace.internal.compat import get_mp_context
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.utils.http import FormData
 from ddtrace.internal.utils.http import connector
@@ -24,14 +28,71 @@ meter = metrics.get_meter("probe.status")
 ErrorInfo = t.Tuple[str, str]
 
 
+def status_key(probe: Probe, status: str) -> int:
+    """Process-independent key of a probe status."""
+    digest = hashlib.blake2b(f"{probe.probe_id}:{probe.version}:{status}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedStatusTable:
+    """Probe statuses recently emitted by the processes sharing the table.
+
+    The table is allocated in shared memory, so that worker processes forked
+    from the parent process see the statuses emitted by each other. Each slot
+    holds the key of a status, with the time and the PID of its last emission.
+    Keys that map to the same slot evict each other, so a status might be
+    emitted more than once per interval, but it is never wrongly suppressed.
+    """
+
+    SLOTS = 1024
+
+    def __init__(self) -> None:
+        context = get_mp_context()
+        self._keys = context.Array(ctypes.c_uint64, self.SLOTS, lock=False)
+        self._times = context.Array(ctypes.c_double, self.SLOTS, lock=False)
+        self._pids = context.Array(ctypes.c_int64, self.SLOTS, lock=False)
+
+    def should_emit(self, key: int, now: float, interval: float) -> bool:
+        """Whether the status with the given key should be emitted by this process.
+
+        A status is suppressed if another process emitted it within the given
+        interval. Otherwise the emission is recorded.
+        """
+        slot = key % self.SLOTS
+        pid = os.getpid()
+
+        if self._keys[slot] == key:
+            timestamp, emitter = self._times[slot], self._pids[slot]
+            # Check the key again in case the slot was updated concurrently
+            if self._keys[slot] == key and emitter != pid and now - timestamp < interval:
+                return False
+
+        # Invalidate the slot while it is being updated
+        self._keys[slot] = 0
+        self._times[slot] = now
+        self._pids[slot] = pid
+        self._keys[slot] = key
+
+        return True
+
+
 class ProbeStatusLogger:
     RETRY_ATTEMPTS = 3
     RETRY_INTERVAL = 1
     ENDPOINT = "/debugger/v1/diagnostics"
 
+    # Shared with the processes forked after the first logger is created
+    _shared_statuses: t.Optional[SharedStatusTable] = None
+
     def __init__(self, service: str) -> None:
         self._service = service
         self._queue: Queue[str] = Queue()
+
+        if di_config.diagnostics_deduplication and ProbeStatusLogger._shared_statuses is None:
+            try:
+                ProbeStatusLogger._shared_statuses = SharedStatusTable()
+            except Exception:
+                log.debug("Cannot allocate the shared probe status table", exc_info=True)
         self._connect = connector(di_config._intake_url, timeout=di_config.upload_timeout)
         # Make it retryable
         self._write_payload_with_backoff = fibonacci_backoff_with_jitter(
@@ -95,7 +156,18 @@ class ProbeStatusLogger:
             meter.increment("error")
 
     def _enqueue(self, probe: Probe, status: str, message: str, error: t.Optional[ErrorInfo] = None) -> None:
-        self._queue.put_nowait(self._payload(probe, status, message, time.time(), error))
+        now = time.time()
+
+        shared_statuses = self._shared_statuses
+        if (
+            di_config.diagnostics_deduplication
+            and shared_statuses is not None
+            and not shared_statuses.should_emit(status_key(probe, status), now, di_config.diagnostics_interval)
+        ):
+            log.debug("Probe status %s for probe %s already emitted by another process", status, probe.probe_id)
+            return
+
+        self._queue.put_nowait(self._payload(probe, status, message, now, error))
         log.debug("Probe status %s for probe %s enqueued", status, probe.probe_id)
 
     def flush(self) -> None:
@@ -143,5 +215,13 @@ class ProbeStatusLogger:
             message or "Probe %s is emitting data" % probe.probe_id,
         )
 
+    def degraded(self, probe: Probe, sample_rate: float, message: t.Optional[str] = None) -> None:
+        self._enqueue(
+            probe,
+            "WARNING",
+            message
+            or "Probe %s is sampled at %.2f%% to stay within the overhead budget" % (probe.probe_id, sample_rate * 100),
+        )
+
     def error(self, probe: Probe, error: t.Optional[ErrorInfo] = None) -> None:
         self._enqueue(probe, "ERROR", "Failed to instrument probe %s" % probe.probe_id, error)
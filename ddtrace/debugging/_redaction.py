@@ -1,5 +1,6 @@
 from ddtrace.debugging._expressions import DDCompiler
 from ddtrace.debugging._expressions import DDExpression
+from ddtrace.debugging._expressions import _getitem
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.utils.cache import cached
 from ddtrace.settings.dynamic_instrumentation import config
@@ -140,6 +141,17 @@ class DDRedactedCompiler(DDCompiler):
 
         return super().__index__(o, i)
 
+    def _getmember_function(self, attr):
+        # Attributes are known at compile time, so the access to those that are
+        # not redacted needs no checks on evaluation.
+        return self.__getmember__ if redact(attr) else object.__getattribute__
+
+    def _index_function(self, index):
+        # Likewise for literal indices
+        if isinstance(index, (int, float, bool)) or (isinstance(index, str) and not redact(index)):
+            return _getitem
+        return self.__index__
+
     @classmethod
     def __ref__(cls, s):
         if redact(s):
@@ -0,0 +1,133 @@
+"""Process-wide CPU budget for probe signals.
+
+Each probe has its own rate limit, but the time spent evaluating conditions,
+capturing snapshots and emitting metrics adds up across probes. The budget
+tracks the CPU time spent by the signals of all the probes, as measured on the
+threads that emit them, keeps a rolling estimate of its share of the wall time,
+and samples the probes down when the estimate exceeds the configured overhead.
+Degraded probes are sampled back up once the overhead is well within the budget
+again.
+"""
+from collections import defaultdict
+import random
+import threading
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from ddtrace.internal.compat import monotonic_ns
+from ddtrace.internal.logger import get_logger
+
+
+log = get_logger(__name__)
+
+BudgetCallback = Callable[[str, float], None]
+
+
+class SignalBudget(object):
+    """CPU budget shared by the probes that emit signals.
+
+    Probes are identified by a key, normally the probe ID. Before emitting a
+    signal, callers check whether the probe is admitted with ``admit``, and
+    then record the CPU time spent emitting the signal with ``record``, as
+    measured with ``thread_time_ns``.
+
+    :param max_overhead: The maximum CPU time, in percent of the wall time,
+        that the signals are allowed to take. A non-positive value disables the
+        budget.
+    :param window: The duration, in seconds, of the measurement window.
+    :param on_degraded: Called with the key and the new sample rate when a
+        probe is sampled down.
+    :param on_restored: Called with the key and a sample rate of 1.0 when a
+        degraded probe is no longer sampled.
+    """
+
+    # Weight of the latest window in the rolling estimate of the overhead
+    SMOOTHING = 0.5
+    # Degraded probes are sampled back up only if the overhead estimate is
+    # below this fraction of the budget, to avoid oscillations.
+    RECOVERY_THRESHOLD = 0.5
+    MIN_SAMPLE_RATE = 0.01
+
+    def __init__(
+        self,
+        max_overhead: float,
+        window: float = 1.0,
+        on_degraded: Optional[BudgetCallback] = None,
+        on_restored: Optional[BudgetCallback] = None,
+    ) -> None:
+        self.max_share = max_overhead / 100.0
+        self.enabled = self.max_share > 0.0
+        self.share = 0.0
+        self.on_degraded = on_degraded
+        self.on_restored = on_restored
+
+        self._window_ns = int(window * 1e9)
+        self._window_start_ns = monotonic_ns()
+        self._costs: Dict[str, int] = defaultdict(int)
+        self._sample_rates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, key: str) -> bool:
+        """Whether the probe with the given key can emit a signal."""
+        sample_rate = self._sample_rates.get(key)
+        return sample_rate is None or random.random() < sample_rate  # nosec
+
+    def sample_rate(self, key: str) -> float:
+        """The current sample rate of the probe with the given key."""
+        return self._sample_rates.get(key, 1.0)
+
+    def record(self, key: str, duration_ns: int) -> None:
+        """Record the CPU time spent emitting a signal of the given probe."""
+        if not self.enabled:
+            return
+
+        self._costs[key] += duration_ns
+
+        now = monotonic_ns()
+        if now - self._window_start_ns >= self._window_ns and self._lock.acquire(False):
+            try:
+                self._rollover(now)
+            finally:
+                self._lock.release()
+
+    def _rollover(self, now: int) -> None:
+        elapsed = now - self._window_start_ns
+        if elapsed <= 0:
+            return
+
+        costs, self._costs = self._costs, defaultdict(int)
+        self._window_start_ns = now
+
+        share = sum(costs.values()) / elapsed
+        self.share = self.SMOOTHING * share + (1.0 - self.SMOOTHING) * self.share
+
+        if self.share > self.max_share:
+            # Sample down the probes that took time in the last window in
+            # proportion to the excess overhead.
+            factor = self.max_share / self.share
+            for key, cost in costs.items():
+                if not cost:
+                    continue
+                sample_rate = max(self.sample_rate(key) * factor, self.MIN_SAMPLE_RATE)
+                self._sample_rates[key] = sample_rate
+                log.debug("Probe %s sampled down to %f (overhead estimate: %f)", key, sample_rate, self.share)
+                if self.on_degraded is not None:
+                    self.on_degraded(key, sample_rate)
+
+        elif self.share < self.max_share * self.RECOVERY_THRESHOLD:
+            for key, sample_rate in list(self._sample_rates.items()):
+                sample_rate = min(sample_rate * 2.0, 1.0)
+                if sample_rate < 1.0:
+                    self._sample_rates[key] = sample_rate
+                    continue
+
+                del self._sample_rates[key]
+                log.debug("Probe %s no longer sampled (overhead estimate: %f)", key, self.share)
+                if self.on_restored is not None:
+                    self.on_restored(key, sample_rate)
+
+    def discard(self, key: str) -> None:
+        """Forget the state of the probe with the given key."""
+        self._sample_rates.pop(key, None)
+        self._costs.pop(key, None)
@@ -7,6 +7,7 @@ from typing import Tuple
 
 from ddtrace.debugging._encoding import BufferedEncoder
 from ddtrace.debugging._metrics import metrics
+from ddtrace.debugging._probe.model import Probe
 from ddtrace.debugging._signal.model import LogSignal
 from ddtrace.debugging._signal.model import Signal
 from ddtrace.debugging._signal.model import SignalState
@@ -89,13 +90,17 @@ class SignalCollector(object):
             log.debug("Encoder buffer full")
             meter.increment("encoder.buffer.full")
 
+    def skip(self, probe: Probe, cause: str) -> None:
+        """Record a probe trigger that was skipped before creating a signal."""
+        meter.increment("skip", tags={"cause": cause, "probe_id": probe.probe_id})
+
     def push(self, signal: Signal) -> None:
         if signal.state == SignalState.SKIP_COND:
-            meter.increment("skip", tags={"cause": "cond", "probe_id": signal.probe.probe_id})
+            self.skip(signal.probe, "cond")
         elif signal.state in {SignalState.SKIP_COND_ERROR, SignalState.COND_ERROR}:
-            meter.increment("skip", tags={"cause": "cond_error", "probe_id": signal.probe.probe_id})
+            self.skip(signal.probe, "cond_error")
         elif signal.state == SignalState.SKIP_RATE:
-            meter.increment("skip", tags={"cause": "rate", "probe_id": signal.probe.probe_id})
+            self.skip(signal.probe, "rate")
         elif signal.state == SignalState.DONE:
             meter.increment("signal", tags={"probe_id": signal.probe.probe_id})
 
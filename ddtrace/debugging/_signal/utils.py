@@ -18,6 +18,7 @@ from ddtrace.debugging._redaction import REDACTED_PLACEHOLDER
 from ddtrace.debugging._redaction import redact
 from ddtrace.debugging._redaction import redact_type
 from ddtrace.debugging._safety import get_fields
+from ddtrace.internal._stack import capture_stack as _capture_stack
 from ddtrace.internal.compat import BUILTIN_CONTAINER_TYPES
 from ddtrace.internal.compat import BUILTIN_MAPPNG_TYPES
 from ddtrace.internal.compat import BUILTIN_SIMPLE_TYPES
@@ -108,21 +109,14 @@ def serialize(
 
 
 def capture_stack(top_frame: FrameType, max_height: int = 4096) -> List[dict]:
-    frame: Optional[FrameType] = top_frame
-    stack = []
-    h = 0
-    while frame and h < max_height:
-        code = frame.f_code
-        stack.append(
-            {
-                "fileName": code.co_filename,
-                "function": code.co_name,
-                "lineNumber": frame.f_lineno,
-            }
-        )
-        frame = frame.f_back
-        h += 1
-    return stack
+    return [
+        {
+            "fileName": filename,
+            "function": name,
+            "lineNumber": lineno,
+        }
+        for filename, lineno, name, _ in _capture_stack(top_frame, max_height)
+    ]
 
 
 def capture_exc_info(exc_info: ExcInfoType) -> Optional[Dict[str, Any]]:
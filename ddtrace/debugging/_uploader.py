@@ -1,4 +1,8 @@
+import gzip
+from http.client import HTTPException
+from http.client import HTTPResponse
 from typing import Optional
+from typing import Tuple
 from urllib.parse import quote
 
 from ddtrace.debugging._config import di_config
@@ -8,7 +12,8 @@ from ddtrace.internal import compat
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.periodic import AwakeablePeriodicService
 from ddtrace.internal.runtime import container
-from ddtrace.internal.utils.http import connector
+from ddtrace.internal.utils.http import ConnectionType
+from ddtrace.internal.utils.http import get_connection
 from ddtrace.internal.utils.retry import fibonacci_backoff_with_jitter
 
 
@@ -20,12 +25,16 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
     """Logs intake uploader.
 
     This class implements an interface with the debugger logs intake for both
-    the debugger and the events platform.
+    the debugger and the events platform. Payloads are uploaded in batches of
+    about ``upload_batch_size`` bytes, compressed with gzip unless disabled,
+    over a connection that is kept alive across uploads.
     """
 
     ENDPOINT = di_config._intake_endpoint
 
     RETRY_ATTEMPTS = 3
+    MAX_BATCHES = 16
+    COMPRESSION_LEVEL = 6
 
     def __init__(self, queue: BufferedEncoder, interval: Optional[float] = None) -> None:
         super().__init__(interval or di_config.upload_flush_interval)
@@ -35,11 +44,15 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
             "Accept": "text/plain",
         }
 
+        self._compression = di_config.upload_compression
+        if self._compression:
+            self._headers["Content-Encoding"] = "gzip"
+
         container.update_headers_with_container_info(self._headers, container.get_container_info())
 
         if di_config._tags_in_qs and di_config.tags:
             self.ENDPOINT += f"?ddtags={quote(di_config.tags)}"
-        self._connect = connector(di_config._intake_url, timeout=di_config.upload_timeout)
+        self._conn: Optional[ConnectionType] = None
 
         # Make it retryable
         self._write_with_backoff = fibonacci_backoff_with_jitter(
@@ -54,25 +67,58 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
             self.interval,
         )
 
+    def _connection(self) -> ConnectionType:
+        if self._conn is None:
+            self._conn = get_connection(di_config._intake_url, timeout=di_config.upload_timeout)
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _send(self, body: bytes) -> Tuple[HTTPResponse, bytes]:
+        conn = self._connection()
+        conn.request(
+            "POST",
+            self.ENDPOINT,
+            body,
+            headers=self._headers,
+        )
+        resp = compat.get_connection_response(conn)
+        # Read the whole response so that the connection can be reused
+        data = resp.read()
+        if resp.will_close:
+            self._close()
+        return resp, data
+
     def _write(self, payload: bytes) -> None:
+        body = gzip.compress(payload, self.COMPRESSION_LEVEL) if self._compression else payload
         try:
-            with self._connect() as conn:
-                conn.request(
-                    "POST",
-                    self.ENDPOINT,
-                    payload,
-                    headers=self._headers,
-                )
-                resp = compat.get_connection_response(conn)
-                if not (200 <= resp.status < 300):
-                    log.error("Failed to upload payload: [%d] %r", resp.status, resp.read())
-                    meter.increment("upload.error", tags={"status": str(resp.status)})
-                else:
-                    meter.increment("upload.success")
-                    meter.distribution("upload.size", len(payload))
+            reused = self._conn is not None
+            try:
+                resp, data = self._send(body)
+            except (OSError, HTTPException):
+                self._close()
+                if not reused:
+                    raise
+                # The intake might have closed the kept-alive connection in the
+                # meantime, so send the payload once more on a new connection.
+                resp, data = self._send(body)
         except Exception:
+            # Start over with a new connection and let the caller retry
+            self._close()
             log.error("Failed to write payload", exc_info=True)
             meter.increment("error")
+            raise
+
+        if not (200 <= resp.status < 300):
+            log.error("Failed to upload payload: [%d] %r", resp.status, data)
+            meter.increment("upload.error", tags={"status": str(resp.status)})
+        else:
+            meter.increment("upload.success")
+            meter.distribution("upload.size", len(body))
+            meter.distribution("upload.uncompressed_size", len(payload))
 
     def upload(self) -> None:
         """Upload request."""
@@ -80,14 +126,21 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
 
     def periodic(self) -> None:
         """Upload the buffer content to the logs intake."""
-        count = self._queue.count
-        if count:
+        for _ in range(self.MAX_BATCHES):
+            count = self._queue.count
+            if not count:
+                break
+
             payload = self._queue.flush()
-            if payload is not None:
-                try:
-                    self._write_with_backoff(payload)
-                    meter.distribution("batch.cardinality", count)
-                except Exception:
-                    log.debug("Cannot upload logs payload", exc_info=True)
-
-    on_shutdown = periodic
+            if payload is None:
+                break
+
+            try:
+                self._write_with_backoff(payload)
+                meter.distribution("batch.cardinality", count - self._queue.count)
+            except Exception:
+                log.debug("Cannot upload logs payload", exc_info=True)
+
+    def on_shutdown(self) -> None:
+        self.periodic()
+        self._close()
@@ -0,0 +1,10 @@
+from types import FrameType
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+FrameInfo = Tuple[str, int, str, str]
+
+def capture_stack(frame: Optional[FrameType], max_depth: int = -1, crop: Optional[str] = None) -> List[FrameInfo]: ...
+def get_info_frame(cwd: str) -> Tuple[str, int]: ...
+def clear_cache() -> None: ...
@@ -0,0 +1,109 @@
+"""Native capture of Python stacks.
+
+Frames are returned as compact ``(filename, lineno, name, qualname)`` tuples.
+The tuple of a frame only depends on its code object and line number, so it is
+cached and the same tuple is returned for all the stacks that go through the
+same line.
+"""
+import os
+import sys
+
+
+cdef dict _frame_cache = {}
+cdef Py_ssize_t _MAX_FRAME_CACHE_SIZE = 4096
+
+cdef dict _library_cache = {}
+cdef str _library_cache_cwd = None
+cdef Py_ssize_t _MAX_LIBRARY_CACHE_SIZE = 4096
+
+cdef str DDTRACE_PREFIX = os.sep + "ddtrace" + os.sep
+cdef str TESTS_PREFIX = os.sep + "tests" + os.sep
+cdef str SITE_PACKAGES_PREFIX = os.sep + "site-packages" + os.sep
+
+
+cdef inline tuple _frame_info(frame):
+    code = frame.f_code
+    lineno = frame.f_lineno
+    # Code objects are not always hashable (e.g. instrumented code can hold
+    # unhashable constants), so they are cached by identity. The cache holds a
+    # reference to the code object so that its id cannot be reused.
+    key = (id(code), lineno)
+    entry = _frame_cache.get(key)
+    if entry is None or (<tuple>entry)[0] is not code:
+        if len(_frame_cache) >= _MAX_FRAME_CACHE_SIZE:
+            _frame_cache.clear()
+        name = code.co_name
+        entry = (code, (code.co_filename, 0 if lineno is None else lineno, name, getattr(code, "co_qualname", name)))
+        _frame_cache[key] = entry
+    return <tuple>(<tuple>entry)[1]
+
+
+cpdef list capture_stack(frame, Py_ssize_t max_depth=-1, str crop=None):
+    """Capture the stack starting from the given frame, innermost frame first.
+
+    :param frame: The top frame of the stack.
+    :param max_depth: The maximum number of frames to capture, or -1 for no limit.
+    :param crop: If a frame of a function with this name is found, the frames
+        above it and the frame itself are not part of the stack.
+    :return: The list of ``(filename, lineno, name, qualname)`` tuples of the stack.
+    """
+    cdef list stack = []
+    cdef Py_ssize_t depth = 0
+
+    while frame is not None:
+        if crop is not None and frame.f_code.co_name == crop:
+            # Drop the frames above the cropping point
+            stack = []
+            depth = 0
+            crop = None
+        elif max_depth < 0 or depth < max_depth:
+            stack.append(_frame_info(frame))
+            depth += 1
+        elif crop is None:
+            break
+        frame = frame.f_back
+
+    return stack
+
+
+cdef bint _is_library(str filename, str cwd):
+    global _library_cache_cwd
+
+    if cwd is not _library_cache_cwd:
+        _library_cache.clear()
+        _library_cache_cwd = cwd
+
+    result = _library_cache.get(filename)
+    if result is None:
+        if len(_library_cache) >= _MAX_LIBRARY_CACHE_SIZE:
+            _library_cache.clear()
+        result = (
+            (DDTRACE_PREFIX in filename and TESTS_PREFIX not in filename)
+            or SITE_PACKAGES_PREFIX in filename
+            or cwd not in filename
+        )
+        _library_cache[filename] = result
+    return result
+
+
+cpdef tuple get_info_frame(str cwd):
+    """Get the filename and line number of the first frame of the caller stack
+    that is part of the application, that is not part of ddtrace or of an
+    installed package and is under ``cwd``.
+
+    :return: The ``(filename, lineno)`` tuple of the frame, or ``("", -1)`` if
+        there is none.
+    """
+    # Cython functions have no frame: the current frame is the one of the caller
+    frame = sys._getframe(0)
+    while frame is not None:
+        info = _frame_info(frame)
+        if not _is_library(info[0], cwd):
+            return info[0], info[1]
+        frame = frame.f_back
+    return "", -1
+
+
+cpdef void clear_cache():
+    _frame_cache.clear()
+    _library_cache.clear()
@@ -141,6 +141,13 @@ except ImportError:
         return int(_process_time() * 1e9)
 
 
+try:
+    from time import thread_time_ns
+except ImportError:
+    # The CPU time of the current thread is not available on all platforms
+    thread_time_ns = process_time_ns
+
+
 main_thread = threading.main_thread()
 
 
@@ -38,6 +38,12 @@ extern "C"
     void ddup_push_release(Datadog::Sample* sample, int64_t release_time, int64_t count);
     void ddup_push_alloc(Datadog::Sample* sample, int64_t size, int64_t count);
     void ddup_push_heap(Datadog::Sample* sample, int64_t size);
+    void ddup_push_gc(Datadog::Sample* sample,
+                      int64_t gc_time,
+                      int64_t count,
+                      int64_t collected,
+                      int64_t uncollectable);
+    void ddup_push_gc_generation(Datadog::Sample* sample, int64_t generation);
     void ddup_push_lock_name(Datadog::Sample* sample, std::string_view lock_name);
     void ddup_push_threadinfo(Datadog::Sample* sample,
                               int64_t thread_id,
@@ -44,7 +44,8 @@ namespace Datadog {
     X(trace_resource_container, "trace resource container")                                                            \
     X(trace_endpoint, "trace endpoint")                                                                                \
     X(class_name, "class name")                                                                                        \
-    X(lock_name, "lock name")
+    X(lock_name, "lock name")                                                                                          \
+    X(gc_generation, "gc generation")
 
 #define X_ENUM(a, b) a,
 #define X_STR(a, b) b,
@@ -50,9 +50,11 @@ class Sample
     bool push_release(int64_t lock_time, int64_t count);
     bool push_alloc(int64_t size, int64_t count);
     bool push_heap(int64_t size);
+    bool push_gc(int64_t gc_time, int64_t count, int64_t collected, int64_t uncollectable);
 
     // Adds metadata to sample
     bool push_lock_name(std::string_view lock_name);
+    bool push_gc_generation(int64_t generation);
     bool push_threadinfo(int64_t thread_id, int64_t thread_native_id, std::string_view thread_name);
     bool push_task_id(int64_t task_id);
     bool push_task_name(std::string_view task_name);
@@ -11,7 +11,8 @@ enum SampleType : unsigned int
     LockRelease = 1 << 4,
     Allocation = 1 << 5,
     Heap = 1 << 6,
-    All = CPU | Wall | Exception | LockAcquire | LockRelease | Allocation | Heap
+    GC = 1 << 7,
+    All = CPU | Wall | Exception | LockAcquire | LockRelease | Allocation | Heap | GC
 };
 
 // Every Sample object has a corresponding `values` vector, since libdatadog expects contiguous values per sample.
@@ -30,6 +31,10 @@ struct ValueIndex
     unsigned short alloc_space;
     unsigned short alloc_count;
     unsigned short heap_space;
+    unsigned short gc_time;
+    unsigned short gc_count;
+    unsigned short gc_collected;
+    unsigned short gc_uncollectable;
 };
 
 } // namespace Datadog
@@ -171,6 +171,22 @@ ddup_push_heap(Datadog::Sample* sample, int64_t size) // cppcheck-suppress unuse
     sample->push_heap(size);
 }
 
+void
+ddup_push_gc(Datadog::Sample* sample,
+             int64_t gc_time,
+             int64_t count,
+             int64_t collected,
+             int64_t uncollectable) // cppcheck-suppress unusedFunction
+{
+    sample->push_gc(gc_time, count, collected, uncollectable);
+}
+
+void
+ddup_push_gc_generation(Datadog::Sample* sample, int64_t generation) // cppcheck-suppress unusedFunction
+{
+    sample->push_gc_generation(generation);
+}
+
 void
 ddup_push_lock_name(Datadog::Sample* sample, std::string_view lock_name) // cppcheck-suppress unusedFunction
 {
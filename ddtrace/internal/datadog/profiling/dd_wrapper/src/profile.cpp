@@ -89,6 +89,12 @@ Datadog::Profile::setup_samplers()
     if (0U != (type_mask & SampleType::Heap)) {
         val_idx.heap_space = get_value_idx("heap-space", "bytes");
     }
+    if (0U != (type_mask & SampleType::GC)) {
+        val_idx.gc_time = get_value_idx("gc-time", "nanoseconds");
+        val_idx.gc_count = get_value_idx("gc-collections", "count");
+        val_idx.gc_collected = get_value_idx("gc-collected", "count");
+        val_idx.gc_uncollectable = get_value_idx("gc-uncollectable", "count");
+    }
 
     // Whatever the first sampler happens to be is the default "period" for the profile
     // The value of 1 is a pointless default.
@@ -217,6 +217,35 @@ Datadog::Sample::push_heap(int64_t size)
     return false;
 }
 
+bool
+Datadog::Sample::push_gc(int64_t gc_time,
+                         int64_t count,
+                         int64_t collected,
+                         int64_t uncollectable) // NOLINT (bugprone-easily-swappable-parameters)
+{
+    if (gc_time < 0 || count < 0 || collected < 0 || uncollectable < 0) {
+        std::cout << "bad push gc (params)" << std::endl;
+        return false;
+    }
+
+    if (0U != (type_mask & SampleType::GC)) {
+        values[profile_state.val().gc_time] += gc_time;
+        values[profile_state.val().gc_count] += count;
+        values[profile_state.val().gc_collected] += collected;
+        values[profile_state.val().gc_uncollectable] += uncollectable;
+        return true;
+    }
+    std::cout << "bad push gc" << std::endl;
+    return false;
+}
+
+bool
+Datadog::Sample::push_gc_generation(int64_t generation)
+{
+    push_label(ExportLabelKey::gc_generation, generation);
+    return true;
+}
+
 bool
 Datadog::Sample::push_lock_name(std::string_view lock_name)
 {
@@ -62,6 +62,14 @@ except Exception as e:
         def push_heap(self, value):  # type: (int) -> None
             pass
 
+        @not_implemented
+        def push_gc(self, value, count, collected, uncollectable):  # type: (int, int, int, int) -> None
+            pass
+
+        @not_implemented
+        def push_gc_generation(self, generation):  # type: (int) -> None
+            pass
+
         @not_implemented
         def push_lock_name(self, lock_name):  # type: (str) -> None
             pass
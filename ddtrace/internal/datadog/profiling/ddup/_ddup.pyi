@@ -22,6 +22,8 @@ class SampleHandle:
     def push_release(self, value: int, count: int) -> None: ...
     def push_alloc(self, value: int, count: int) -> None: ...
     def push_heap(self, value: int) -> None: ...
+    def push_gc(self, value: int, count: int, collected: int, uncollectable: int) -> None: ...
+    def push_gc_generation(self, generation: int) -> None: ...
     def push_lock_name(self, lock_name: StringType) -> None: ...
     def push_frame(self, name: StringType, filename: StringType, address: int, line: int) -> None: ...
     def push_threadinfo(self, thread_id: int, thread_native_id: int, thread_name: StringType) -> None: ...
@@ -53,6 +53,8 @@ cdef extern from "interface.hpp":
     void ddup_push_release(Sample *sample, int64_t release_time, int64_t count)
     void ddup_push_alloc(Sample *sample, int64_t size, int64_t count)
     void ddup_push_heap(Sample *sample, int64_t size)
+    void ddup_push_gc(Sample *sample, int64_t gc_time, int64_t count, int64_t collected, int64_t uncollectable)
+    void ddup_push_gc_generation(Sample *sample, int64_t generation)
     void ddup_push_lock_name(Sample *sample, string_view lock_name)
     void ddup_push_threadinfo(Sample *sample, int64_t thread_id, int64_t thread_native_id, string_view thread_name)
     void ddup_push_task_id(Sample *sample, int64_t task_id)
@@ -201,6 +203,20 @@ cdef class SampleHandle:
         if self.ptr is not NULL:
             ddup_push_heap(self.ptr, clamp_to_int64_unsigned(value))
 
+    def push_gc(self, value: int, count: int, collected: int, uncollectable: int) -> None:
+        if self.ptr is not NULL:
+            ddup_push_gc(
+                    self.ptr,
+                    clamp_to_int64_unsigned(value),
+                    clamp_to_int64_unsigned(count),
+                    clamp_to_int64_unsigned(collected),
+                    clamp_to_int64_unsigned(uncollectable),
+            )
+
+    def push_gc_generation(self, generation: int) -> None:
+        if self.ptr is not NULL:
+            ddup_push_gc_generation(self.ptr, clamp_to_int64_unsigned(generation))
+
     def push_lock_name(self, lock_name: StringType) -> None:
         if self.ptr is not NULL:
             lock_name_bytes = ensure_binary_or_empty(lock_name)
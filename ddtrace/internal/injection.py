@@ -1,4 +1,5 @@
 from collections import deque
+from types import CodeType
 from types import FunctionType
 from typing import Any  # noqa:F401
 from typing import Callable  # noqa:F401
@@ -134,15 +135,13 @@ def _eject_hook(code: Bytecode, hook: HookType, line: int, arg: Any) -> None:
         del code[i : i + len(_INJECT_HOOK_OPCODES)]
 
 
-def inject_hooks(f: FunctionType, hooks: List[HookInfoType]) -> List[HookInfoType]:
-    """Bulk-inject a list of hooks into a function.
-
-    Hooks are specified via a list of tuples, where each tuple contains the hook
-    itself, the line number and the identifying argument passed to the hook.
+def inject_hooks_in_code(code: CodeType, hooks: List[HookInfoType]) -> Tuple[CodeType, List[HookInfoType]]:
+    """Bulk-inject a list of hooks into a code object with a single rewrite.
 
-    Returns the list of hooks that failed to be injected.
+    Returns the new code object, or the given one if no hooks could be injected,
+    and the list of hooks that failed to be injected.
     """
-    abstract_code = Bytecode.from_code(f.__code__)
+    abstract_code = Bytecode.from_code(code)
 
     failed = []
     for hook, line, arg in hooks:
@@ -152,7 +151,23 @@ def inject_hooks(f: FunctionType, hooks: List[HookInfoType]) -> List[HookInfoTyp
             failed.append((hook, line, arg))
 
     if len(failed) < len(hooks):
-        f.__code__ = abstract_code.to_code()
+        code = abstract_code.to_code()
+
+    return code, failed
+
+
+def inject_hooks(f: FunctionType, hooks: List[HookInfoType]) -> List[HookInfoType]:
+    """Bulk-inject a list of hooks into a function.
+
+    Hooks are specified via a list of tuples, where each tuple contains the hook
+    itself, the line number and the identifying argument passed to the hook.
+
+    Returns the list of hooks that failed to be injected.
+    """
+    code, failed = inject_hooks_in_code(f.__code__, hooks)
+
+    if len(failed) < len(hooks):
+        f.__code__ = code
 
     return failed
 
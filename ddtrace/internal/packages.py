@@ -183,6 +183,91 @@ def _package_for_root_module_mapping() -> t.Optional[t.Dict[str, Distribution]]:
         return None
 
 
+class _PackageIndex(object):
+    """Path-prefix trie mapping the location of top-level modules to their
+    distribution.
+
+    Lookups walk the parts of a resolved path and return the distribution of
+    the deepest matching prefix, so their cost does not depend on the number
+    of installed distributions.
+    """
+
+    _DIST = None  # Key of the distribution stored in a trie node
+
+    def __init__(self):
+        # type: () -> None
+        self._root = {}  # type: t.Dict[t.Optional[str], t.Any]
+
+    def add(self, path, dist):
+        # type: (Path, Distribution) -> None
+        node = self._root
+        for part in path.parts:
+            node = node.setdefault(part, {})
+        node.setdefault(self._DIST, dist)
+
+    def lookup(self, path):
+        # type: (Path) -> t.Optional[Distribution]
+        node = self._root
+        dist = None
+        for part in path.parts:
+            try:
+                node = node[part]
+            except KeyError:
+                break
+            dist = node.get(self._DIST, dist)
+        return dist
+
+
+@callonce
+def _package_index() -> t.Optional[_PackageIndex]:
+    try:
+        import importlib.metadata as metadata
+    except ImportError:
+        import importlib_metadata as metadata  # type: ignore[no-redef]
+
+    try:
+        index = _PackageIndex()
+        seen = set()
+
+        for dist in metadata.distributions():
+            if dist is None or dist.files is None:
+                continue
+
+            d = Distribution(name=dist.metadata["name"], version=dist.version, path=None)
+            base = Path(dist.locate_file("")).resolve()
+            roots = set()
+            for f in dist.files:
+                if len(f.parts) < 2:
+                    # Single-file module at the top level of the distribution
+                    roots.add(f.parts[0])
+                    continue
+                root = f.parts[0]
+                if root.endswith(".dist-info") or root.endswith(".egg-info") or root == "..":
+                    continue
+                # Index the first two levels so that namespace packages shared
+                # by several distributions resolve to the right one.
+                roots.add(root)
+                if len(f.parts) > 2:
+                    roots.add("/".join(f.parts[:2]))
+
+            for root in roots:
+                path = base.joinpath(*root.split("/"))
+                if path in seen:
+                    # The first distribution that claims a location wins
+                    continue
+                seen.add(path)
+                index.add(path, d)
+
+        return index
+
+    except Exception:
+        LOG.warning(
+            "Unable to build package index, please report this to https://github.com/DataDog/dd-trace-py/issues",
+            exc_info=True,
+        )
+        return None
+
+
 @callonce
 def _third_party_packages() -> set:
     from gzip import decompress
@@ -196,13 +281,23 @@ def _third_party_packages() -> set:
 
 @cached()
 def filename_to_package(filename: t.Union[str, Path]) -> t.Optional[Distribution]:
+    path = (Path(filename) if isinstance(filename, str) else filename).resolve()
+
+    index = _package_index()
+    if index is not None:
+        package = index.lookup(path)
+        if package is not None:
+            return package
+
+    # Fall back to resolving the root module via the import paths for files
+    # that are not located within the installation directory of a
+    # distribution.
     mapping = _package_for_root_module_mapping()
     if mapping is None:
         return None
 
     try:
-        path = Path(filename) if isinstance(filename, str) else filename
-        return mapping.get(_root_module(path.resolve()))
+        return mapping.get(_root_module(path))
     except ValueError:
         return None
 
@@ -237,6 +237,15 @@ class BudgetRateLimiterWithJitter(object):
             self.budget -= 1.0
             return f(*args, **kwargs) if f is not None else None
 
+        self._exceed()
+
+        if self.raise_on_exceed:
+            raise RateLimitExceeded()
+        else:
+            return RateLimitExceeded
+
+    def _exceed(self):
+        # type: () -> None
         if self.on_exceed is not None:
             if not self.call_once:
                 self.on_exceed()
@@ -244,10 +253,20 @@ class BudgetRateLimiterWithJitter(object):
                 self.on_exceed()
                 self._on_exceed_called = True
 
-        if self.raise_on_exceed:
-            raise RateLimitExceeded()
-        else:
-            return RateLimitExceeded
+    def exceeded(self):
+        # type: () -> bool
+        """Check whether the next call is certain to exceed the rate limit.
+
+        The budget is not consumed, so this can be used to skip the work that
+        precedes a call to ``limit`` when the call would be rejected anyway.
+        The accrued budget is estimated with the maximum jitter, so a call might
+        still be rejected when this returns ``False``.
+        """
+        if self.budget + self.limit_rate * (compat.monotonic() - self.last_time) * 1.5 >= 1.0:
+            return False
+
+        self._exceed()
+        return True
 
     def __call__(self, f):
         # type: (Callable[..., Any]) -> Callable[..., Any]
@@ -0,0 +1,119 @@
+"""
+On-disk cache of the symbols of modules.
+
+Extracting the symbols of a module requires walking all the classes, functions
+and code objects that it defines, on every process start. The JSON scope of a
+module is stored under a key made of the module source, its path and name, the
+symbol extraction code and the Python version, so that the symbols of a module
+that did not change are read back from the cache on the next start instead of
+being extracted again.
+
+The cache is disabled unless ``_DD_SYMBOL_DATABASE_CACHE_DIR`` is set.
+"""
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from types import ModuleType
+from typing import Optional
+
+from ddtrace.internal.logger import get_logger
+from ddtrace.internal.module import origin
+from ddtrace.settings.symbol_db import config as symdb_config
+
+
+log = get_logger(__name__)
+
+_SUFFIX = ".symdb.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _fingerprint() -> bytes:
+    """Identify the symbol extraction code and the Python version."""
+    from ddtrace import __version__
+
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update(sys.implementation.cache_tag.encode())
+    # Development versions of the extraction code can change without a version bump
+    with open(os.path.join(os.path.dirname(__file__), "symbols.py"), "rb") as source_file:
+        digest.update(source_file.read())
+    return digest.digest()
+
+
+def cache_key(module: ModuleType) -> Optional[str]:
+    """
+    Return the key of the symbols of the given module, or None if the cache is
+    disabled or the module has no source file.
+    """
+    if not symdb_config._cache_dir:
+        return None
+
+    module_origin = origin(module)
+    if module_origin is None:
+        return None
+
+    module_path = str(module_origin)
+    try:
+        with open(module_path, "rb") as source_file:
+            source = source_file.read()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(_fingerprint())
+    digest.update(module.__name__.encode())
+    digest.update(b"\x00")
+    digest.update(module_path.encode(errors="surrogateescape"))
+    digest.update(b"\x00")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(symdb_config._cache_dir, key[:2], key + _SUFFIX)
+
+
+def load(key: Optional[str]) -> Optional[dict]:
+    """Look up the JSON scope of a module."""
+    if key is None:
+        return None
+
+    try:
+        with open(_cache_path(key), "rb") as cache_file:
+            scope = json.loads(cache_file.read())
+    except OSError:
+        return None
+    except ValueError:
+        log.debug("Invalid symbol cache entry %s", key, exc_info=True)
+        return None
+
+    return scope if isinstance(scope, dict) else None
+
+
+def store(key: Optional[str], scope: dict) -> None:
+    """
+    Store the JSON scope of a module.
+
+    The entry is written to a temporary file first and then moved in place, so
+    that concurrent processes never read a partial entry.
+    """
+    if key is None:
+        return
+
+    path = _cache_path(key)
+    try:
+        data = json.dumps(scope).encode("utf-8")
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        log.debug("Cannot write symbol cache entry %s", path, exc_info=True)
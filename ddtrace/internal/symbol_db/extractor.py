@@ -0,0 +1,144 @@
+"""
+Extraction of module symbols in a separate process.
+
+The modules that are already imported when the Symbol DB uploader is installed
+can be many, and extracting their symbols in the application process adds to
+its startup time and memory. The extractor imports these modules again in a
+subprocess with a low scheduling priority, where they are normally loaded from
+the bytecode cache written by the application, and extracts their symbols
+there. The JSON scopes are streamed back to the application process, one per
+line, to be uploaded.
+
+The subprocess shares the on-disk symbol cache with the application process,
+if it is enabled.
+
+Importing the modules again runs their top-level code again, in the
+subprocess, together with any side effect it has, e.g. opening connections,
+writing files or starting processes. This is why the extraction is only
+offloaded when ``_DD_SYMBOL_DATABASE_OFFLOAD`` is set.
+"""
+import importlib
+import json
+import os
+import subprocess  # nosec
+import sys
+import threading
+import typing as t
+
+import ddtrace
+from ddtrace.internal.logger import get_logger
+
+
+log = get_logger(__name__)
+
+NICENESS = 10
+
+_BOOTSTRAP_DIR = os.path.join(os.path.dirname(ddtrace.__file__), "bootstrap")
+
+
+def _env() -> t.Dict[str, str]:
+    env = dict(os.environ)
+
+    # Do not bootstrap ddtrace in the subprocess
+    python_path = [_ for _ in env.get("PYTHONPATH", "").split(os.pathsep) if _ and _ != _BOOTSTRAP_DIR]
+    if python_path:
+        env["PYTHONPATH"] = os.pathsep.join(python_path)
+    else:
+        env.pop("PYTHONPATH", None)
+
+    return env
+
+
+def _scopes(lines: t.Iterable[bytes]) -> t.Iterator[dict]:
+    for line in lines:
+        try:
+            scope = json.loads(line)
+        except ValueError:
+            log.debug("[PID %d] SymDB: Invalid scope from extractor", os.getpid(), exc_info=True)
+            continue
+        if isinstance(scope, dict):
+            yield scope
+
+
+class ScopeExtractor:
+    """Extract the symbols of modules in a subprocess.
+
+    :param modules: The names of the modules to extract the symbols of.
+    :param on_scopes: Called from a background thread with an iterator over
+        the JSON scopes of the modules, as they are extracted.
+    """
+
+    def __init__(self, modules: t.List[str], on_scopes: t.Callable[[t.Iterator[dict]], None]) -> None:
+        self.modules = modules
+        self.on_scopes = on_scopes
+
+        self._process: t.Optional[subprocess.Popen] = None
+        self._thread: t.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._process = subprocess.Popen(  # nosec
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_env(),
+        )
+        self._thread = threading.Thread(target=self._run, name="ddtrace:symdb-extractor", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        process = t.cast(subprocess.Popen, self._process)
+        try:
+            request = {"path": [_ for _ in sys.path if _ != _BOOTSTRAP_DIR], "modules": self.modules}
+            with process.stdin as stdin:  # type: ignore[union-attr]
+                stdin.write(json.dumps(request).encode("utf-8"))
+            with process.stdout as stdout:  # type: ignore[union-attr]
+                self.on_scopes(_scopes(stdout))
+        except Exception:
+            log.debug("[PID %d] SymDB: Symbol extraction failed", os.getpid(), exc_info=True)
+        finally:
+            process.wait()
+
+    def join(self, timeout: t.Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+
+
+def main() -> None:
+    if hasattr(os, "nice"):
+        try:
+            os.nice(NICENESS)
+        except OSError:
+            pass
+
+    # Modules might print to the standard output while being imported, so we
+    # keep it for the scopes and redirect everything else to the standard
+    # error.
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    request = json.load(sys.stdin)
+    sys.path[:] = request["path"]
+
+    from ddtrace.internal.symbol_db.symbols import module_scope
+
+    with out:
+        for name in request["modules"]:
+            try:
+                scope = module_scope(importlib.import_module(name))
+            except (Exception, SystemExit):
+                continue
+
+            if scope is not None:
+                out.write(json.dumps(scope))
+                out.write("\n")
+                out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from dataclasses import field
 import dis
 from enum import Enum
+import gzip
 import http
 from inspect import CO_VARARGS
 from inspect import CO_VARKEYWORDS
@@ -34,6 +35,7 @@ from ddtrace.internal.module import origin
 from ddtrace.internal.packages import is_stdlib
 from ddtrace.internal.runtime import get_runtime_id
 from ddtrace.internal.safety import _isinstance
+from ddtrace.internal.symbol_db import cache as scope_cache
 from ddtrace.internal.utils.cache import cached
 from ddtrace.internal.utils.http import FormData
 from ddtrace.internal.utils.http import connector
@@ -43,6 +45,10 @@ from ddtrace.internal.utils.inspection import undecorated
 from ddtrace.settings.symbol_db import config as symdb_config
 
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ddtrace.internal.symbol_db.extractor import ScopeExtractor
+
+
 log = get_logger(__name__)
 
 SOF = 0
@@ -454,9 +460,33 @@ class Scope:
         return t.cast(Scope, cls._get_from(module, ScopeData(module_origin, set())))
 
 
+def module_scope(module: ModuleType) -> t.Optional[dict]:
+    """Get the JSON scope of a module.
+
+    The scope is read from the on-disk cache if the module did not change
+    since it was last extracted.
+    """
+    key = scope_cache.cache_key(module)
+    scope = scope_cache.load(key)
+    if scope is not None:
+        log.debug("[PID %d] SymDB: Using cached scope for module %s", os.getpid(), module.__name__)
+        return scope
+
+    extracted = Scope.from_module(module)
+    if extracted is None:
+        return None
+
+    scope = extracted.to_json()
+    scope_cache.store(key, scope)
+
+    return scope
+
+
 class ScopeContext:
-    def __init__(self, scopes: t.Optional[t.List[Scope]] = None) -> None:
-        self._scopes: t.List[Scope] = scopes if scopes is not None else []
+    COMPRESSION_LEVEL = 6
+
+    def __init__(self, scopes: t.Optional[t.List[dict]] = None) -> None:
+        self._scopes: t.List[dict] = scopes if scopes is not None else []
 
         self._event_data = {
             "ddsource": "python",
@@ -465,6 +495,9 @@ class ScopeContext:
         }
 
     def add_scope(self, scope: Scope) -> None:
+        self._scopes.append(scope.to_json())
+
+    def add_scope_json(self, scope: dict) -> None:
         self._scopes.append(scope)
 
     def to_json(self) -> dict:
@@ -474,9 +507,27 @@ class ScopeContext:
             "env": config.env or "",
             "version": config.version or "",
             "language": "python",
-            "scopes": [_.to_json() for _ in self._scopes],
+            "scopes": self._scopes,
         }
 
+    def _file(self) -> FormData:
+        data = json.dumps(self.to_json())
+
+        if symdb_config._compression:
+            return FormData(
+                name="file",
+                filename="symdb_export.json.gz",
+                data=gzip.compress(data.encode("utf-8"), self.COMPRESSION_LEVEL),
+                content_type="gzip",
+            )
+
+        return FormData(
+            name="file",
+            filename="symdb_export.json",
+            data=data,
+            content_type="json",
+        )
+
     def upload(self) -> http.client.HTTPResponse:
         body, headers = multipart(
             parts=[
@@ -486,12 +537,7 @@ class ScopeContext:
                     data=json.dumps(self._event_data),
                     content_type="json",
                 ),
-                FormData(
-                    name="file",
-                    filename="symdb_export.json",
-                    data=json.dumps(self.to_json()),
-                    content_type="json",
-                ),
+                self._file(),
             ]
         )
 
@@ -525,26 +571,53 @@ class SymbolDatabaseUploader(BaseModuleWatchdog):
     def __init__(self) -> None:
         super().__init__()
 
+        self._extractor: t.Optional["ScopeExtractor"] = None
+
         # Look for all the modules that are already imported when this is
         # installed and upload the symbols that are marked for inclusion.
-        context = ScopeContext()
-        for module in (_ for _ in list(sys.modules.values()) if is_module_included(_)):
+        modules = [_ for _ in list(sys.modules.values()) if is_module_included(_)]
+
+        if symdb_config._offload:
+            # The main module cannot be imported again in a subprocess.
+            offloaded = [_.__name__ for _ in modules if _.__name__ != "__main__"]
+            if offloaded:
+                from ddtrace.internal.symbol_db.extractor import ScopeExtractor
+
+                try:
+                    extractor = ScopeExtractor(offloaded, self._upload_scopes)
+                    extractor.start()
+                    self._extractor = extractor
+                    modules = [_ for _ in modules if _.__name__ == "__main__"]
+                except Exception:
+                    log.debug("[PID %d] SymDB: Cannot offload symbol extraction", os.getpid(), exc_info=True)
+
+        self._upload_scopes(self._module_scopes(modules))
+
+    @staticmethod
+    def _module_scopes(modules: t.List[ModuleType]) -> t.Iterator[dict]:
+        for module in modules:
             try:
-                scope = Scope.from_module(module)
+                scope = module_scope(module)
             except Exception:
                 log.debug("Cannot get symbol scope for module %s", module.__name__, exc_info=True)
                 continue
 
             if scope is not None:
-                log.debug("[PID %d] SymDB: Adding Symbol DB module scope %r", os.getpid(), scope.name)
-                context.add_scope(scope)
+                log.debug("[PID %d] SymDB: Adding Symbol DB module scope %r", os.getpid(), scope["name"])
+                yield scope
+
+    @classmethod
+    def _upload_scopes(cls, scopes: t.Iterator[dict]) -> None:
+        context = ScopeContext()
+        for scope in scopes:
+            context.add_scope_json(scope)
 
             # Batching: send at most 100 module scopes at a time
             n = len(context)
-            if n >= self.__scope_limit__:
+            if n >= cls.__scope_limit__:
                 log.debug("[PID %d] SymDB: Flushing batch of %d module scopes", os.getpid(), n)
                 try:
-                    self._upload_context(context)
+                    cls._upload_context(context)
                 except Exception:
                     log.error(
                         "[PID %d] SymDB: Failed to upload symbols context with %d scopes", os.getpid(), n, exc_info=True
@@ -553,7 +626,7 @@ class SymbolDatabaseUploader(BaseModuleWatchdog):
                 context = ScopeContext()
 
         try:
-            self._upload_context(context)
+            cls._upload_context(context)
         except Exception:
             log.error(
                 "[PID %d] SymDB: Failed to upload symbols context with %d scopes",
@@ -567,10 +640,18 @@ class SymbolDatabaseUploader(BaseModuleWatchdog):
             log.debug("[PID %d] SymDB: Excluding imported module %s from symbol database", os.getpid(), module.__name__)
             return
 
-        scope = Scope.from_module(module)
+        scope = module_scope(module)
         if scope is not None:
             self._upload_context(ScopeContext([scope]))
 
+    @classmethod
+    def uninstall(cls) -> None:
+        instance = cls._instance
+        if isinstance(instance, cls) and instance._extractor is not None:
+            instance._extractor.stop()
+
+        super().uninstall()
+
     @staticmethod
     def _upload_context(context: ScopeContext) -> None:
         if not context:
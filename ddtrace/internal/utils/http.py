@@ -430,24 +430,30 @@ def parse_form_multipart(body: str, headers: Optional[Dict] = None) -> Dict[str,
 class FormData:
     name: str
     filename: str
-    data: str
+    data: Union[str, bytes]
     content_type: str
 
 
 def multipart(parts: List[FormData]) -> Tuple[bytes, dict]:
-    from email.mime.application import MIMEApplication
-    from email.mime.multipart import MIMEMultipart
+    """Encode the given parts as a multipart/form-data body.
 
-    msg = MIMEMultipart("form-data")
-    del msg["MIME-Version"]
-
-    for part in parts:
-        app = MIMEApplication(part.data, part.content_type, lambda _: _)
-        app.add_header("Content-Disposition", "form-data", name=part.name, filename=part.filename)
-        del app["MIME-Version"]
-        msg.attach(app)
+    The data of a part can be binary, e.g. a compressed file, and is sent as
+    is, without any transfer encoding.
+    """
+    from uuid import uuid4
 
-    # Split headers and body
-    headers, _, body = msg.as_string().partition("\n\n")
+    boundary = uuid4().hex
 
-    return body.encode("utf-8"), dict(_.split(": ") for _ in headers.splitlines())
+    body = bytearray()
+    for part in parts:
+        body += (
+            f"--{boundary}\r\n"
+            f"Content-Type: application/{part.content_type}\r\n"
+            f'Content-Disposition: form-data; name="{part.name}"; filename="{part.filename}"\r\n'
+            "\r\n"
+        ).encode("utf-8")
+        body += part.data.encode("utf-8") if isinstance(part.data, str) else part.data
+        body += b"\r\n"
+    body += f"--{boundary}--\r\n".encode("utf-8")
+
+    return bytes(body), {"Content-Type": f'multipart/form-data; boundary="{boundary}"'}
@@ -1,8 +1,12 @@
 # -*- encoding: utf-8 -*-
+import _thread
+from collections import deque
 from functools import partial
+import random
 import sys
 from types import ModuleType  # noqa:F401
 import typing  # noqa:F401
+import weakref
 
 from ddtrace.internal.module import ModuleWatchdog
 from ddtrace.internal.utils import get_argument_value
@@ -26,6 +30,180 @@ def _task_get_name(task):
     return "Task-%d" % id(task)
 
 
+class _TaskRegistry(object):
+    """The pending tasks of an event loop.
+
+    Tasks are registered by the task factory of the loop and removed as soon
+    as they are done, so sampling them does not require scanning all the tasks
+    of the process.
+
+    The registry is updated from the loop thread, and sampled from the stack
+    collector thread. Tasks that are garbage collected are removed by weakref
+    callbacks that can run on any thread, even while the registry is being
+    updated, so they are only queued and removed by the next update.
+    """
+
+    __slots__ = ("_refs", "_index", "_collected", "_lock", "stacks")
+
+    def __init__(self):
+        # type: (...) -> None
+        self._refs = []  # type: typing.List[typing.Tuple[int, weakref.ref]]
+        self._index = {}  # type: typing.Dict[int, int]
+        self._collected = deque()  # type: typing.Deque[int]
+        # DEV: Not a threading.Lock, which the lock collector would profile
+        self._lock = _thread.allocate_lock()
+        # Stacks of suspended tasks, maintained by the stack collector
+        self.stacks = {}  # type: typing.Dict[int, typing.Any]
+
+    def __len__(self):
+        # type: (...) -> int
+        with self._lock:
+            self._remove_collected()
+            return len(self._refs)
+
+    def add(self, task):
+        # type: (typing.Any) -> None
+        task_id = id(task)
+        collected = self._collected
+        with self._lock:
+            self._remove_collected()
+            # Pending tasks that are not referenced anymore are garbage collected without ever being done
+            self._index[task_id] = len(self._refs)
+            self._refs.append((task_id, weakref.ref(task, lambda _: collected.append(task_id))))
+        task.add_done_callback(lambda _: self.discard(task_id))
+
+    def discard(self, task_id):
+        # type: (int) -> None
+        with self._lock:
+            self._remove(task_id)
+            self._remove_collected()
+
+    def _remove_collected(self):
+        # type: (...) -> None
+        collected = self._collected
+        while collected:
+            self._remove(collected.popleft())
+
+    def _remove(self, task_id):
+        # type: (int) -> None
+        position = self._index.pop(task_id, None)
+        if position is None:
+            return
+        self.stacks.pop(task_id, None)
+        last = self._refs.pop()
+        if position < len(self._refs):
+            # Move the last task in the freed slot
+            self._refs[position] = last
+            self._index[last[0]] = position
+
+    def sample(self, max_tasks):
+        # type: (int) -> typing.Tuple[typing.List[typing.Any], float]
+        """Return a random subset of at most ``max_tasks`` tasks.
+
+        :return: The tasks and the weight to apply to each of them.
+        """
+        with self._lock:
+            self._remove_collected()
+
+            refs = self._refs
+            ntasks = len(refs)
+            if ntasks <= max_tasks:
+                positions = range(ntasks)  # type: typing.Iterable[int]
+                weight = 1.0
+            else:
+                positions = random.sample(range(ntasks), max_tasks)
+                weight = ntasks / max_tasks
+
+            refs = [refs[position][1] for position in positions]
+
+        tasks = []
+        for ref in refs:
+            task = ref()
+            if task is not None:
+                tasks.append(task)
+        return tasks, weight
+
+
+class _RegistryTaskFactory(object):
+    """Task factory that records the tasks it creates in a registry."""
+
+    __slots__ = ("factory", "registry")
+
+    def __init__(self, factory):
+        # type: (typing.Optional[typing.Callable[..., typing.Any]]) -> None
+        self.factory = factory
+        self.registry = _TaskRegistry()
+
+    def __call__(self, loop, coro, **kwargs):
+        if self.factory is None:
+            task = sys.modules["asyncio"].Task(coro, loop=loop, **kwargs)
+        else:
+            task = self.factory(loop, coro, **kwargs)
+        try:
+            self.registry.add(task)
+        except Exception:
+            pass  # nosec
+        return task
+
+
+# Whether the task factory of new event loops is replaced
+_TASK_REGISTRY_ENABLED = True
+# Loops whose task factory was replaced by the profiler
+_TASK_FACTORY_LOOPS = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _install_task_factory(loop):
+    # type: (typing.Any) -> None
+    if not _TASK_REGISTRY_ENABLED:
+        return
+    try:
+        factory = loop.get_task_factory()
+        if not isinstance(factory, _RegistryTaskFactory):
+            loop.set_task_factory(_RegistryTaskFactory(factory))
+            _TASK_FACTORY_LOOPS.add(loop)
+    except Exception:
+        pass  # nosec
+
+
+def enable_task_registry():
+    # type: (...) -> None
+    """Replace the task factory of the event loops set from now on."""
+    global _TASK_REGISTRY_ENABLED
+
+    _TASK_REGISTRY_ENABLED = True
+
+
+def disable_task_registry():
+    # type: (...) -> None
+    """Restore the original task factory of the event loops."""
+    global _TASK_REGISTRY_ENABLED
+
+    _TASK_REGISTRY_ENABLED = False
+    for loop in list(_TASK_FACTORY_LOOPS):
+        try:
+            factory = loop.get_task_factory()
+            # Leave the factory alone if it was replaced after ours
+            if isinstance(factory, _RegistryTaskFactory):
+                loop.set_task_factory(factory.factory)
+        except Exception:
+            pass  # nosec
+    _TASK_FACTORY_LOOPS.clear()
+
+
+def get_task_registry(loop):
+    # type: (typing.Any) -> typing.Optional[_TaskRegistry]
+    """Return the task registry of a loop.
+
+    If the task factory of the loop has been replaced after the profiler
+    installed its own, ``None`` is returned as the registry is incomplete.
+    """
+    try:
+        factory = loop.get_task_factory()
+    except Exception:
+        return None
+    return factory.registry if isinstance(factory, _RegistryTaskFactory) else None
+
+
 @ModuleWatchdog.after_module_imported("asyncio")
 def _(asyncio):
     # type: (ModuleType) -> None
@@ -57,6 +235,7 @@ def _(asyncio):
             loop = get_argument_value(args, kwargs, 1, "loop")
             if loop is not None:
                 THREAD_LINK.link_object(loop)
+                _install_task_factory(loop)
 
 
 def get_event_loop_for_thread(thread_id):
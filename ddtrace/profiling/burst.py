@@ -0,0 +1,175 @@
+# -*- encoding: utf-8 -*-
+"""Burst profiling.
+
+In burst mode, the collectors of the profiler are dormant until a burst is
+requested, either through remote configuration, a POSIX signal or the
+:meth:`ddtrace.profiling.Profiler.burst` method. The collectors then run for a
+bounded window of time, the profile is uploaded and they go dormant again.
+"""
+import logging
+import os
+import signal
+import threading
+import typing  # noqa:F401
+import weakref
+
+import attr
+
+from ddtrace.internal import compat
+from ddtrace.internal import periodic
+from ddtrace.internal.remoteconfig._connectors import PublisherSubscriberConnector
+from ddtrace.internal.remoteconfig._publishers import RemoteConfigPublisher
+from ddtrace.internal.remoteconfig._pubsub import PubSub
+from ddtrace.internal.remoteconfig._subscribers import RemoteConfigSubscriber
+from ddtrace.settings.profiling import config
+
+
+LOG = logging.getLogger(__name__)
+
+REMOTE_CONFIG_PRODUCT = "PROFILING"
+
+_controllers = weakref.WeakSet()  # type: weakref.WeakSet[BurstController]
+
+
+@attr.s(eq=False)
+class BurstController(periodic.PeriodicService):
+    """Activate the collectors of a profiler for bounded windows of time.
+
+    Requests are only recorded by :meth:`trigger`, which makes it safe to call
+    from a signal handler. The collectors are started and stopped from the
+    controller thread.
+    """
+
+    activate = attr.ib(type=typing.Callable[[], None])
+    deactivate = attr.ib(type=typing.Callable[[], None])
+    duration = attr.ib(type=float, default=config.burst.duration)
+    _interval = attr.ib(type=float, default=1.0)
+    _requested = attr.ib(init=False, default=None, repr=False, type=typing.Optional[float])
+    _deadline = attr.ib(init=False, default=None, repr=False, type=typing.Optional[float])
+
+    @property
+    def active(self):
+        # type: (...) -> bool
+        return self._deadline is not None
+
+    def trigger(self, duration=None):
+        # type: (typing.Optional[float]) -> None
+        """Request a burst.
+
+        :param duration: The duration of the burst in seconds. Requesting a
+            burst while one is running extends it.
+        """
+        self._requested = self.duration if duration is None else duration
+
+    def _start_service(self):
+        # type: (...) -> None
+        super(BurstController, self)._start_service()
+        _controllers.add(self)
+
+    def _stop_service(self):
+        # type: (...) -> None
+        _controllers.discard(self)
+        super(BurstController, self)._stop_service()
+
+    def periodic(self):
+        # type: (...) -> None
+        requested, self._requested = self._requested, None
+        now = compat.monotonic()
+
+        if requested is not None:
+            deadline = now + requested
+            if self._deadline is None:
+                LOG.debug("Starting a profiling burst of %.1f seconds", requested)
+                self._deadline = deadline
+                self.activate()
+            else:
+                self._deadline = max(self._deadline, deadline)
+        elif self._deadline is not None and now >= self._deadline:
+            LOG.debug("Profiling burst is over")
+            self._deadline = None
+            self.deactivate()
+
+
+def trigger(duration=None):
+    # type: (typing.Optional[float]) -> None
+    """Request a burst from all the running profilers."""
+    for controller in list(_controllers):
+        controller.trigger(duration)
+
+
+def _signal_handler(signum, frame):
+    trigger()
+
+
+_previous_signal_handler = None  # type: typing.Any
+
+
+def install_signal_handler(name):
+    # type: (str) -> None
+    """Request a burst when the process receives the signal ``name``."""
+    global _previous_signal_handler
+
+    if not name or threading.current_thread() is not threading.main_thread():
+        # Signal handlers can only be installed from the main thread
+        return
+
+    try:
+        signum = getattr(signal, name.upper())
+        previous = signal.signal(signum, _signal_handler)
+    except (AttributeError, ValueError, OSError):
+        LOG.warning("Invalid profiling burst signal %r", name)
+        return
+
+    if previous is not _signal_handler:
+        _previous_signal_handler = (signum, previous)
+
+
+def uninstall_signal_handler():
+    # type: (...) -> None
+    global _previous_signal_handler
+
+    if _previous_signal_handler is None or threading.current_thread() is not threading.main_thread():
+        return
+
+    signum, previous = _previous_signal_handler
+    _previous_signal_handler = None
+    try:
+        if signal.getsignal(signum) is _signal_handler:
+            signal.signal(signum, previous)
+    except (ValueError, OSError):
+        pass
+
+
+def _rc_callback(data, test_tracer=None):
+    for metadata, rc_config in zip(data["metadata"], data["config"]):
+        if metadata is None or not isinstance(rc_config, dict):
+            continue
+
+        burst = rc_config.get("profiling_burst")
+        if not burst:
+            continue
+
+        duration = burst.get("duration") if isinstance(burst, dict) else None
+        LOG.debug("[PID %d] Profiling burst requested by remote configuration", os.getpid())
+        try:
+            trigger(float(duration) if duration is not None else None)
+        except (TypeError, ValueError):
+            LOG.warning("Invalid profiling burst duration %r", duration)
+
+
+class ProfilingBurstAdapter(PubSub):
+    __publisher_class__ = RemoteConfigPublisher
+    __subscriber_class__ = RemoteConfigSubscriber
+    __shared_data__ = PublisherSubscriberConnector()
+
+    def __init__(self):
+        self._publisher = self.__publisher_class__(self.__shared_data__)
+        self._subscriber = self.__subscriber_class__(self.__shared_data__, _rc_callback, REMOTE_CONFIG_PRODUCT)
+
+
+def enable_remote_configuration():
+    # type: (...) -> None
+    from ddtrace.internal.remoteconfig.worker import remoteconfig_poller
+
+    if remoteconfig_poller.get_registered(REMOTE_CONFIG_PRODUCT) is None:
+        remoteconfig_poller.register(REMOTE_CONFIG_PRODUCT, ProfilingBurstAdapter())
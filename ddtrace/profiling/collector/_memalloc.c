@@ -31,8 +31,8 @@ static memalloc_context_t global_memalloc_ctx;
 /* Allocation tracker */
 typedef struct
 {
-    /* List of traceback */
-    traceback_array_t allocs;
+    /* List of sampled allocations */
+    sample_array_t allocs;
     /* Total number of allocations */
     uint64_t alloc_count;
 } alloc_tracker_t;
@@ -62,10 +62,11 @@ memalloc_add_event(memalloc_context_t* ctx, void* ptr, size_t size)
         /* set a barrier so we don't loop as getting a traceback allocates memory */
         memalloc_set_reentrant(true);
         /* Buffer is not full, fill it */
-        traceback_t* tb = memalloc_get_traceback(ctx->max_nframe, ptr, size, ctx->domain);
+        sample_t sample;
+        bool captured = memalloc_get_sample(ctx->max_nframe, ptr, size, ctx->domain, &sample);
         memalloc_set_reentrant(false);
-        if (tb)
-            traceback_array_append(&global_alloc_tracker->allocs, tb);
+        if (captured)
+            sample_array_append(&global_alloc_tracker->allocs, sample);
     } else {
         /* Sampling mode using a reservoir sampling algorithm: replace a random
          * traceback with this one */
@@ -74,12 +75,13 @@ memalloc_add_event(memalloc_context_t* ctx, void* ptr, size_t size)
         if (r < ctx->max_events) {
             /* set a barrier so we don't loop as getting a traceback allocates memory */
             memalloc_set_reentrant(true);
-            /* Replace a random traceback with this one */
-            traceback_t* tb = memalloc_get_traceback(ctx->max_nframe, ptr, size, ctx->domain);
+            /* Replace a random sample with this one */
+            sample_t sample;
+            bool captured = memalloc_get_sample(ctx->max_nframe, ptr, size, ctx->domain, &sample);
             memalloc_set_reentrant(false);
-            if (tb) {
-                traceback_free(global_alloc_tracker->allocs.tab[r]);
-                global_alloc_tracker->allocs.tab[r] = tb;
+            if (captured) {
+                sample_free(global_alloc_tracker->allocs.tab[r]);
+                global_alloc_tracker->allocs.tab[r] = sample;
             }
         }
     }
@@ -155,14 +157,14 @@ alloc_tracker_new()
 {
     alloc_tracker_t* alloc_tracker = PyMem_RawMalloc(sizeof(alloc_tracker_t));
     alloc_tracker->alloc_count = 0;
-    traceback_array_init(&alloc_tracker->allocs);
+    sample_array_init(&alloc_tracker->allocs);
     return alloc_tracker;
 }
 
 static void
 alloc_tracker_free(alloc_tracker_t* alloc_tracker)
 {
-    traceback_array_wipe(&alloc_tracker->allocs);
+    sample_array_wipe(&alloc_tracker->allocs);
     PyMem_RawFree(alloc_tracker);
 }
 
@@ -198,8 +200,8 @@ memalloc_start(PyObject* Py_UNUSED(module), PyObject* args)
 
     global_memalloc_ctx.max_nframe = (uint16_t)max_nframe;
 
-    if (max_events < 1 || max_events > TRACEBACK_ARRAY_MAX_COUNT) {
-        PyErr_Format(PyExc_ValueError, "the number of events must be in range [1; %lu]", TRACEBACK_ARRAY_MAX_COUNT);
+    if (max_events < 1 || max_events > SAMPLE_ARRAY_MAX_COUNT) {
+        PyErr_Format(PyExc_ValueError, "the number of events must be in range [1; %lu]", SAMPLE_ARRAY_MAX_COUNT);
         return NULL;
     }
 
@@ -257,11 +259,11 @@ memalloc_stop(PyObject* Py_UNUSED(module), PyObject* Py_UNUSED(args))
     }
 
     PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &global_memalloc_ctx.pymem_allocator_obj);
-    memalloc_tb_deinit();
     alloc_tracker_free(global_alloc_tracker);
     global_alloc_tracker = NULL;
 
     memalloc_heap_tracker_deinit();
+    memalloc_tb_deinit();
 
     Py_RETURN_NONE;
 }
@@ -270,7 +272,11 @@ PyDoc_STRVAR(memalloc_heap_py__doc__,
              "heap($module, /)\n"
              "--\n"
              "\n"
-             "Get the sampled heap representation.\n");
+             "Get the sampled heap representation.\n"
+             "\n"
+             "Returns a tuple with 2 items:\n"
+             "1. a list of (traceback ID, thread ID, size) samples\n"
+             "2. a dict mapping traceback IDs to (stack, total number of frames)\n");
 static PyObject*
 memalloc_heap_py(PyObject* Py_UNUSED(module), PyObject* Py_UNUSED(args))
 {
@@ -288,14 +294,33 @@ typedef struct
     uint32_t seq_index;
 } IterEventsState;
 
+static PyObject*
+alloc_tracker_tracebacks(alloc_tracker_t* alloc_tracker)
+{
+    PyObject* tracebacks = PyDict_New();
+    if (tracebacks == NULL)
+        return NULL;
+
+    for (SAMPLE_ARRAY_COUNT_TYPE i = 0; i < alloc_tracker->allocs.count; i++) {
+        if (memalloc_tracebacks_add(tracebacks, alloc_tracker->allocs.tab[i].traceback) < 0) {
+            Py_DECREF(tracebacks);
+            return NULL;
+        }
+    }
+
+    return tracebacks;
+}
+
 PyDoc_STRVAR(iterevents__doc__,
              "iter_events()\n"
              "--\n"
              "\n"
-             "Returns a tuple with 3 items:\n:"
-             "1. an iterator of memory allocation traced so far\n"
+             "Returns a tuple with 4 items:\n:"
+             "1. an iterator of memory allocation traced so far, as\n"
+             "   (traceback ID, thread ID, size, domain) tuples\n"
              "2. the number of items in the iterator\n"
              "3. the total number of allocations since last reset\n"
+             "4. a dict mapping traceback IDs to (stack, total number of frames)\n"
              "\n"
              "Also reset the traces of memory blocks allocated by Python.");
 static PyObject*
@@ -311,14 +336,21 @@ iterevents_new(PyTypeObject* type, PyObject* Py_UNUSED(args), PyObject* Py_UNUSE
         return NULL;
 
     iestate->alloc_tracker = global_alloc_tracker;
-    /* reset the current traceback list */
+    /* reset the current sample list */
     global_alloc_tracker = alloc_tracker_new();
     iestate->seq_index = 0;
 
-    PyObject* iter_and_count = PyTuple_New(3);
+    PyObject* tracebacks = alloc_tracker_tracebacks(iestate->alloc_tracker);
+    if (tracebacks == NULL) {
+        Py_DECREF(iestate);
+        return NULL;
+    }
+
+    PyObject* iter_and_count = PyTuple_New(4);
     PyTuple_SET_ITEM(iter_and_count, 0, (PyObject*)iestate);
     PyTuple_SET_ITEM(iter_and_count, 1, PyLong_FromUnsignedLong(iestate->alloc_tracker->allocs.count));
     PyTuple_SET_ITEM(iter_and_count, 2, PyLong_FromUnsignedLongLong(iestate->alloc_tracker->alloc_count));
+    PyTuple_SET_ITEM(iter_and_count, 3, tracebacks);
 
     return iter_and_count;
 }
@@ -334,19 +366,20 @@ static PyObject*
 iterevents_next(IterEventsState* iestate)
 {
     if (iestate->seq_index < iestate->alloc_tracker->allocs.count) {
-        traceback_t* tb = iestate->alloc_tracker->allocs.tab[iestate->seq_index];
+        sample_t* sample = &iestate->alloc_tracker->allocs.tab[iestate->seq_index];
         iestate->seq_index++;
 
-        PyObject* tb_size_domain = PyTuple_New(3);
-        PyTuple_SET_ITEM(tb_size_domain, 0, traceback_to_tuple(tb));
-        PyTuple_SET_ITEM(tb_size_domain, 1, PyLong_FromSize_t(tb->size));
+        PyObject* tb_size_domain = PyTuple_New(4);
+        PyTuple_SET_ITEM(tb_size_domain, 0, PyLong_FromUnsignedLongLong(sample->traceback->id));
+        PyTuple_SET_ITEM(tb_size_domain, 1, PyLong_FromUnsignedLong(sample->thread_id));
+        PyTuple_SET_ITEM(tb_size_domain, 2, PyLong_FromSize_t(sample->size));
 
         /* Domain name */
-        if (tb->domain == PYMEM_DOMAIN_OBJ) {
-            PyTuple_SET_ITEM(tb_size_domain, 2, object_string);
+        if (sample->domain == PYMEM_DOMAIN_OBJ) {
+            PyTuple_SET_ITEM(tb_size_domain, 3, object_string);
             Py_INCREF(object_string);
         } else {
-            PyTuple_SET_ITEM(tb_size_domain, 2, Py_None);
+            PyTuple_SET_ITEM(tb_size_domain, 3, Py_None);
             Py_INCREF(Py_None);
         }
 
@@ -6,10 +6,19 @@ from .. import event
 FrameType = event.DDFrame
 StackType = event.StackTraceType
 
-# (stack, nframe, thread_id)
-TracebackType = typing.Tuple[StackType, int, int]
+# (stack, nframe)
+TracebackType = typing.Tuple[StackType, int]
+
+# Interned tracebacks, by traceback ID
+TracebacksType = typing.Dict[int, TracebackType]
 
 def start(max_nframe: int, max_events: int, heap_sample_size: int) -> None: ...
 def stop() -> None: ...
-def heap() -> typing.List[typing.Tuple[TracebackType, int]]: ...
-def iter_events() -> typing.Iterator[typing.Tuple[TracebackType, int]]: ...
+
+# (traceback ID, thread ID, size)
+def heap() -> typing.Tuple[typing.List[typing.Tuple[int, int, int]], TracebacksType]: ...
+
+# (traceback ID, thread ID, size, domain)
+def iter_events() -> (
+    typing.Tuple[typing.Iterator[typing.Tuple[int, int, int, typing.Optional[str]]], int, int, TracebacksType]
+): ...
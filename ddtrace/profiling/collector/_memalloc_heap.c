@@ -13,7 +13,7 @@ typedef struct
     /* Current sample size of the heap profiler in bytes */
     uint32_t current_sample_size;
     /* Tracked allocations */
-    traceback_array_t allocs;
+    sample_array_t allocs;
     /* Allocated memory counter in bytes */
     uint32_t allocated_memory;
     /* True if the heap tracker is frozen */
@@ -21,7 +21,7 @@ typedef struct
     /* Contains the ongoing heap allocation/deallocation while frozen */
     struct
     {
-        traceback_array_t allocs;
+        sample_array_t allocs;
         ptr_array_t frees;
     } freezer;
 } heap_tracker_t;
@@ -41,8 +41,8 @@ heap_tracker_next_sample_size(uint32_t sample_size)
 static void
 heap_tracker_init(heap_tracker_t* heap_tracker)
 {
-    traceback_array_init(&heap_tracker->allocs);
-    traceback_array_init(&heap_tracker->freezer.allocs);
+    sample_array_init(&heap_tracker->allocs);
+    sample_array_init(&heap_tracker->freezer.allocs);
     ptr_array_init(&heap_tracker->freezer.frees);
     heap_tracker->allocated_memory = 0;
     heap_tracker->frozen = false;
@@ -53,8 +53,8 @@ heap_tracker_init(heap_tracker_t* heap_tracker)
 static void
 heap_tracker_wipe(heap_tracker_t* heap_tracker)
 {
-    traceback_array_wipe(&heap_tracker->allocs);
-    traceback_array_wipe(&heap_tracker->freezer.allocs);
+    sample_array_wipe(&heap_tracker->allocs);
+    sample_array_wipe(&heap_tracker->freezer.allocs);
     ptr_array_wipe(&heap_tracker->freezer.frees);
 }
 
@@ -67,24 +67,24 @@ heap_tracker_freeze(heap_tracker_t* heap_tracker)
 static void
 heap_tracker_untrack_thawed(heap_tracker_t* heap_tracker, void* ptr)
 {
-    /* This search is O(n) where `n` is the number of tracked traceback,
+    /* This search is O(n) where `n` is the number of tracked samples,
        which is linearly linked to the heap size. This search could probably be
        optimized in a couple of ways:
 
-       - sort the traceback in allocs by ptr so we can find the ptr in O(log2 n)
+       - sort the samples in allocs by ptr so we can find the ptr in O(log2 n)
        - use a Bloom filter?
 
        That being said, we start iterating at the end of the array because most
        of the time this is where the untracked ptr is (the most recent object
        get de-allocated first usually). This might be a good enough
        trade-off. */
-    for (TRACEBACK_ARRAY_COUNT_TYPE i = heap_tracker->allocs.count; i > 0; i--) {
-        traceback_t** tb = &heap_tracker->allocs.tab[i - 1];
+    for (SAMPLE_ARRAY_COUNT_TYPE i = heap_tracker->allocs.count; i > 0; i--) {
+        sample_t* sample = &heap_tracker->allocs.tab[i - 1];
 
-        if (ptr == (*tb)->ptr) {
-            /* Free the traceback */
-            traceback_free(*tb);
-            traceback_array_remove(&heap_tracker->allocs, tb);
+        if (ptr == sample->ptr) {
+            /* Release the traceback */
+            sample_free(*sample);
+            sample_array_remove(&heap_tracker->allocs, sample);
             break;
         }
     }
@@ -94,7 +94,7 @@ static void
 heap_tracker_thaw(heap_tracker_t* heap_tracker)
 {
     /* Add the frozen allocs at the end */
-    traceback_array_splice(&heap_tracker->allocs,
+    sample_array_splice(&heap_tracker->allocs,
                            heap_tracker->allocs.count,
                            0,
                            heap_tracker->freezer.allocs.tab,
@@ -166,7 +166,7 @@ memalloc_heap_track(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorD
     /* Check if we can add more samples: the sum of the freezer + alloc tracker
      cannot be greater than what the alloc tracker can handle: when the alloc
      tracker is thawed, all the allocs in the freezer will be moved there!*/
-    if ((global_heap_tracker.freezer.allocs.count + global_heap_tracker.allocs.count) >= TRACEBACK_ARRAY_MAX_COUNT)
+    if ((global_heap_tracker.freezer.allocs.count + global_heap_tracker.allocs.count) >= SAMPLE_ARRAY_MAX_COUNT)
         return false;
 
     /* Avoid loops */
@@ -174,14 +174,15 @@ memalloc_heap_track(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorD
         return false;
 
     memalloc_set_reentrant(true);
-    traceback_t* tb = memalloc_get_traceback(max_nframe, ptr, global_heap_tracker.allocated_memory, domain);
+    sample_t sample;
+    bool captured = memalloc_get_sample(max_nframe, ptr, global_heap_tracker.allocated_memory, domain, &sample);
     memalloc_set_reentrant(false);
 
-    if (tb) {
+    if (captured) {
         if (global_heap_tracker.frozen)
-            traceback_array_append(&global_heap_tracker.freezer.allocs, tb);
+            sample_array_append(&global_heap_tracker.freezer.allocs, sample);
         else
-            traceback_array_append(&global_heap_tracker.allocs, tb);
+            sample_array_append(&global_heap_tracker.allocs, sample);
 
         /* Reset the counter to 0 */
         global_heap_tracker.allocated_memory = 0;
@@ -201,17 +202,32 @@ memalloc_heap()
     heap_tracker_freeze(&global_heap_tracker);
 
     PyObject* heap_list = PyList_New(global_heap_tracker.allocs.count);
+    PyObject* tracebacks = PyDict_New();
+    PyObject* result = NULL;
 
-    for (TRACEBACK_ARRAY_COUNT_TYPE i = 0; i < global_heap_tracker.allocs.count; i++) {
-        traceback_t* tb = global_heap_tracker.allocs.tab[i];
+    if (heap_list == NULL || tracebacks == NULL)
+        goto exit;
 
-        PyObject* tb_and_size = PyTuple_New(2);
-        PyTuple_SET_ITEM(tb_and_size, 0, traceback_to_tuple(tb));
-        PyTuple_SET_ITEM(tb_and_size, 1, PyLong_FromSize_t(tb->size));
-        PyList_SET_ITEM(heap_list, i, tb_and_size);
+    for (SAMPLE_ARRAY_COUNT_TYPE i = 0; i < global_heap_tracker.allocs.count; i++) {
+        sample_t* sample = &global_heap_tracker.allocs.tab[i];
+
+        if (memalloc_tracebacks_add(tracebacks, sample->traceback) < 0)
+            goto exit;
+
+        PyObject* sample_tuple = PyTuple_New(3);
+        PyTuple_SET_ITEM(sample_tuple, 0, PyLong_FromUnsignedLongLong(sample->traceback->id));
+        PyTuple_SET_ITEM(sample_tuple, 1, PyLong_FromUnsignedLong(sample->thread_id));
+        PyTuple_SET_ITEM(sample_tuple, 2, PyLong_FromSize_t(sample->size));
+        PyList_SET_ITEM(heap_list, i, sample_tuple);
     }
 
+    result = PyTuple_Pack(2, heap_list, tracebacks);
+
+exit:
+    Py_XDECREF(heap_list);
+    Py_XDECREF(tracebacks);
+
     heap_tracker_thaw(&global_heap_tracker);
 
-    return heap_list;
+    return result;
 }
@@ -18,6 +18,29 @@ static PyObject* empty_string = NULL;
 
 #define TRACEBACK_SIZE(NFRAME) (sizeof(traceback_t) + sizeof(frame_t) * (NFRAME - 1))
 
+/* Hash-consing table of the tracebacks referenced by samples.
+
+   Allocation sites are very repetitive, so samples with identical stacks share
+   the same refcounted traceback. The table is never freed as tracebacks might
+   still be referenced by event iterators once the module is stopped; entries
+   are removed when their last sample is freed. All accesses happen with the
+   GIL held. */
+typedef struct
+{
+    /* Buckets of tracebacks chained by `traceback_t.next` */
+    traceback_t** buckets;
+    /* Number of buckets, always a power of 2 */
+    size_t nbuckets;
+    /* Number of tracebacks in the table */
+    size_t count;
+    /* Identifier of the next traceback added to the table */
+    uint64_t next_id;
+} traceback_table_t;
+
+#define TRACEBACK_TABLE_INITIAL_NBUCKETS 1024
+
+static traceback_table_t traceback_table = { NULL, 0, 0, 1 };
+
 static PyObject* ddframe_class = NULL;
 
 bool
@@ -68,6 +91,13 @@ memalloc_tb_init(uint16_t max_nframe)
         PyUnicode_InternInPlace(&empty_string);
     }
 
+    if (traceback_table.buckets == NULL) {
+        traceback_table.buckets = PyMem_RawCalloc(TRACEBACK_TABLE_INITIAL_NBUCKETS, sizeof(traceback_t*));
+        if (traceback_table.buckets == NULL)
+            return -1;
+        traceback_table.nbuckets = TRACEBACK_TABLE_INITIAL_NBUCKETS;
+    }
+
     /* Allocate a buffer that can handle the largest traceback possible.
        This will be used a temporary buffer when converting stack traces. */
     traceback_buffer = PyMem_RawMalloc(TRACEBACK_SIZE(max_nframe));
@@ -84,16 +114,138 @@ memalloc_tb_deinit(void)
     PyMem_RawFree(traceback_buffer);
 }
 
-void
-traceback_free(traceback_t* tb)
+static void
+traceback_release_frames(traceback_t* tb)
 {
     for (uint16_t nframe = 0; nframe < tb->nframe; nframe++) {
         Py_DECREF(tb->frames[nframe].filename);
         Py_DECREF(tb->frames[nframe].name);
     }
+}
+
+static Py_uhash_t
+traceback_hash(traceback_t* tb)
+{
+    /* FNV-1a over the frame identities: the filename and name objects are
+       referenced by the traceback, so their addresses are stable. The hash is
+       computed on 64 bits and folded into a Py_uhash_t, which is only 32 bits
+       wide on 32-bit builds. */
+    uint64_t hash = 14695981039346656037ULL;
+
+    hash = (hash ^ tb->total_nframe) * 1099511628211ULL;
+    for (uint16_t nframe = 0; nframe < tb->nframe; nframe++) {
+        frame_t* frame = &tb->frames[nframe];
+        hash = (hash ^ (uint64_t)(uintptr_t)frame->filename) * 1099511628211ULL;
+        hash = (hash ^ (uint64_t)(uintptr_t)frame->name) * 1099511628211ULL;
+        hash = (hash ^ frame->lineno) * 1099511628211ULL;
+    }
+
+    return (Py_uhash_t)(hash ^ (hash >> 32));
+}
+
+static bool
+traceback_equal(traceback_t* tb1, traceback_t* tb2)
+{
+    if (tb1->hash != tb2->hash || tb1->nframe != tb2->nframe || tb1->total_nframe != tb2->total_nframe)
+        return false;
+
+    for (uint16_t nframe = 0; nframe < tb1->nframe; nframe++) {
+        frame_t* f1 = &tb1->frames[nframe];
+        frame_t* f2 = &tb2->frames[nframe];
+        if (f1->filename != f2->filename || f1->name != f2->name || f1->lineno != f2->lineno)
+            return false;
+    }
+
+    return true;
+}
+
+static void
+traceback_table_grow(void)
+{
+    size_t nbuckets = traceback_table.nbuckets << 1;
+    traceback_t** buckets = PyMem_RawCalloc(nbuckets, sizeof(traceback_t*));
+
+    /* Keep the current buckets if we can't grow: lookups just get slower */
+    if (buckets == NULL)
+        return;
+
+    for (size_t i = 0; i < traceback_table.nbuckets; i++) {
+        traceback_t* tb = traceback_table.buckets[i];
+        while (tb) {
+            traceback_t* next = tb->next;
+            traceback_t** bucket = &buckets[tb->hash & (nbuckets - 1)];
+            tb->next = *bucket;
+            *bucket = tb;
+            tb = next;
+        }
+    }
+
+    PyMem_RawFree(traceback_table.buckets);
+    traceback_table.buckets = buckets;
+    traceback_table.nbuckets = nbuckets;
+}
+
+/* Return the interned version of the traceback in `traceback_buffer`, with a
+   new reference. */
+static traceback_t*
+traceback_intern(void)
+{
+    traceback_buffer->hash = traceback_hash(traceback_buffer);
+
+    traceback_t** bucket = &traceback_table.buckets[traceback_buffer->hash & (traceback_table.nbuckets - 1)];
+
+    for (traceback_t* tb = *bucket; tb != NULL; tb = tb->next) {
+        if (traceback_equal(tb, traceback_buffer)) {
+            /* The interned traceback already holds references to the frames */
+            traceback_release_frames(traceback_buffer);
+            tb->refcount++;
+            return tb;
+        }
+    }
+
+    size_t traceback_size = TRACEBACK_SIZE(traceback_buffer->nframe);
+    traceback_t* traceback = PyMem_RawMalloc(traceback_size);
+
+    if (traceback == NULL) {
+        traceback_release_frames(traceback_buffer);
+        return NULL;
+    }
+
+    memcpy(traceback, traceback_buffer, traceback_size);
+    traceback->id = traceback_table.next_id++;
+    traceback->refcount = 1;
+    traceback->next = *bucket;
+    *bucket = traceback;
+
+    if (++traceback_table.count > traceback_table.nbuckets)
+        traceback_table_grow();
+
+    return traceback;
+}
+
+void
+traceback_decref(traceback_t* tb)
+{
+    if (--tb->refcount > 0)
+        return;
+
+    /* Unlink the traceback from the table */
+    traceback_t** link = &traceback_table.buckets[tb->hash & (traceback_table.nbuckets - 1)];
+    while (*link != tb)
+        link = &(*link)->next;
+    *link = tb->next;
+    traceback_table.count--;
+
+    traceback_release_frames(tb);
     PyMem_RawFree(tb);
 }
 
+void
+sample_free(sample_t sample)
+{
+    traceback_decref(sample.traceback);
+}
+
 /* Convert PyFrameObject to a frame_t that we can store in memory */
 static void
 memalloc_convert_frame(PyFrameObject* pyframe, frame_t* frame)
@@ -163,22 +315,16 @@ memalloc_frame_to_traceback(PyFrameObject* pyframe, uint16_t max_nframe)
 #endif
     }
 
-    size_t traceback_size = TRACEBACK_SIZE(traceback_buffer->nframe);
-    traceback_t* traceback = PyMem_RawMalloc(traceback_size);
-
-    if (traceback)
-        memcpy(traceback, traceback_buffer, traceback_size);
-
-    return traceback;
+    return traceback_intern();
 }
 
-traceback_t*
-memalloc_get_traceback(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorDomain domain)
+bool
+memalloc_get_sample(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorDomain domain, sample_t* sample)
 {
     PyThreadState* tstate = PyThreadState_Get();
 
     if (tstate == NULL)
-        return NULL;
+        return false;
 
 #ifdef _PY39_AND_LATER
     PyFrameObject* pyframe = PyThreadState_GetFrame(tstate);
@@ -187,25 +333,26 @@ memalloc_get_traceback(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocat
 #endif
 
     if (pyframe == NULL)
-        return NULL;
+        return false;
 
     traceback_t* traceback = memalloc_frame_to_traceback(pyframe, max_nframe);
 
     if (traceback == NULL)
-        return NULL;
+        return false;
 
-    traceback->size = size;
-    traceback->ptr = ptr;
+    sample->traceback = traceback;
+    sample->size = size;
+    sample->ptr = ptr;
 
 #ifdef _PY37_AND_LATER
-    traceback->thread_id = PyThread_get_thread_ident();
+    sample->thread_id = PyThread_get_thread_ident();
 #else
-    traceback->thread_id = tstate->thread_id;
+    sample->thread_id = tstate->thread_id;
 #endif
 
-    traceback->domain = domain;
+    sample->domain = domain;
 
-    return traceback;
+    return true;
 }
 
 PyObject*
@@ -243,9 +390,33 @@ traceback_to_tuple(traceback_t* tb)
         PyTuple_SET_ITEM(stack, nframe, frame_tuple);
     }
 
-    PyObject* tuple = PyTuple_New(3);
+    PyObject* tuple = PyTuple_New(2);
     PyTuple_SET_ITEM(tuple, 0, stack);
     PyTuple_SET_ITEM(tuple, 1, PyLong_FromUnsignedLong(tb->total_nframe));
-    PyTuple_SET_ITEM(tuple, 2, PyLong_FromUnsignedLong(tb->thread_id));
     return tuple;
 }
+
+/* Add the Python representation of the traceback to the `tracebacks` dict,
+   keyed by traceback ID, unless it is already there. Each traceback is
+   converted once no matter how many samples reference it.
+
+   Returns 0 on success, -1 on error. */
+int
+memalloc_tracebacks_add(PyObject* tracebacks, traceback_t* tb)
+{
+    PyObject* id = PyLong_FromUnsignedLongLong(tb->id);
+    if (id == NULL)
+        return -1;
+
+    int found = PyDict_Contains(tracebacks, id);
+    if (found != 0) {
+        Py_DECREF(id);
+        return found < 0 ? -1 : 0;
+    }
+
+    PyObject* tuple = traceback_to_tuple(tb);
+    int ret = PyDict_SetItem(tracebacks, id, tuple);
+    Py_DECREF(id);
+    Py_DECREF(tuple);
+    return ret;
+}
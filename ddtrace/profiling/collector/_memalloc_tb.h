@@ -23,20 +23,20 @@ typedef struct
 #pragma pack(pop)
 #endif
 
-typedef struct
+typedef struct traceback_s
 {
+    /* Next traceback in the same bucket of the traceback table */
+    struct traceback_s* next;
+    /* Unique identifier of the traceback */
+    uint64_t id;
+    /* Hash of the frames of the traceback */
+    Py_uhash_t hash;
+    /* Number of samples referencing this traceback */
+    uint32_t refcount;
     /* Total number of frames in the traceback */
     uint16_t total_nframe;
     /* Number of frames in the traceback */
     uint16_t nframe;
-    /* Memory pointer allocated */
-    void* ptr;
-    /* Memory size allocated in bytes */
-    size_t size;
-    /* Domain allocated */
-    PyMemAllocatorDomain domain;
-    /* Thread ID */
-    unsigned long thread_id;
     /* List of frames, top frame first */
     frame_t frames[1];
 } traceback_t;
@@ -44,6 +44,21 @@ typedef struct
 /* The maximum number of frames we can store in `traceback_t.nframe` */
 #define TRACEBACK_MAX_NFRAME UINT16_MAX
 
+/* A sampled allocation. Identical stacks share the same interned traceback. */
+typedef struct
+{
+    /* Memory pointer allocated */
+    void* ptr;
+    /* Memory size allocated in bytes */
+    size_t size;
+    /* Interned traceback of the allocation */
+    traceback_t* traceback;
+    /* Thread ID */
+    unsigned long thread_id;
+    /* Domain allocated */
+    PyMemAllocatorDomain domain;
+} sample_t;
+
 bool
 memalloc_ddframe_class_init();
 
@@ -53,18 +68,24 @@ void
 memalloc_tb_deinit();
 
 void
-traceback_free(traceback_t* tb);
+traceback_decref(traceback_t* tb);
+
+bool
+memalloc_get_sample(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorDomain domain, sample_t* sample);
 
-traceback_t*
-memalloc_get_traceback(uint16_t max_nframe, void* ptr, size_t size, PyMemAllocatorDomain domain);
+void
+sample_free(sample_t sample);
 
 PyObject*
 traceback_to_tuple(traceback_t* tb);
 
-/* The maximum number of events we can store in `traceback_array_t.count` */
-#define TRACEBACK_ARRAY_MAX_COUNT UINT16_MAX
-#define TRACEBACK_ARRAY_COUNT_TYPE uint16_t
+int
+memalloc_tracebacks_add(PyObject* tracebacks, traceback_t* tb);
+
+/* The maximum number of events we can store in `sample_array_t.count` */
+#define SAMPLE_ARRAY_MAX_COUNT UINT16_MAX
+#define SAMPLE_ARRAY_COUNT_TYPE uint16_t
 
-DO_ARRAY(traceback_t*, traceback, TRACEBACK_ARRAY_COUNT_TYPE, traceback_free)
+DO_ARRAY(sample_t, sample, SAMPLE_ARRAY_COUNT_TYPE, sample_free)
 
 #endif
@@ -5,3 +5,6 @@ def get_task(
     thread_id: int,
 ) -> typing.Tuple[typing.Optional[int], typing.Optional[str], typing.Optional[types.FrameType]]: ...
 def list_tasks() -> typing.List[typing.Tuple[int, str, types.FrameType]]: ...
+def sample_tasks(
+    thread_id: int, max_tasks: int, max_nframes: int
+) -> typing.List[typing.Tuple[int, str, typing.List, int, float]]: ...
@@ -1,3 +1,4 @@
+import random
 import sys
 from types import ModuleType
 import weakref
@@ -6,6 +7,7 @@ from ddtrace.vendor.wrapt.importer import when_imported
 
 from .. import _asyncio
 from .. import _threading
+from . import _traceback
 
 
 _gevent_tracer = None
@@ -99,6 +101,27 @@ cpdef get_task(thread_id):
     return task_id, task_name, frame
 
 
+cdef _list_greenlets(thread_id):
+    if _gevent_tracer is None:
+        return []
+
+    if not type(_threading.get_thread_by_id(thread_id)).__name__.endswith("_MainThread"):
+        return []
+
+    # Under normal circumstances, the Hub is running in the main thread.
+    # Python will only ever have a single instance of a _MainThread
+    # class, so if we find it we attribute all the greenlets to it.
+    return [
+        (
+            greenlet_id,
+            _threading.get_thread_name(greenlet_id),
+            greenlet.gr_frame
+        )
+        for greenlet_id, greenlet in dict(_gevent_tracer.greenlets).items()
+        if not greenlet.dead
+    ]
+
+
 cpdef list_tasks(thread_id):
     # type: (...) -> typing.List[typing.Tuple[int, str, types.FrameType]]
     """Return the list of running tasks.
@@ -108,24 +131,7 @@ cpdef list_tasks(thread_id):
 
     :return: [(task_id, task_name, task_frame), ...]"""
 
-    tasks = []
-
-    if _gevent_tracer is not None:
-        if type(_threading.get_thread_by_id(thread_id)).__name__.endswith("_MainThread"):
-            # Under normal circumstances, the Hub is running in the main thread.
-            # Python will only ever have a single instance of a _MainThread
-            # class, so if we find it we attribute all the greenlets to it.
-            tasks.extend(
-                [
-                    (
-                        greenlet_id,
-                        _threading.get_thread_name(greenlet_id),
-                        greenlet.gr_frame
-                    )
-                    for greenlet_id, greenlet in dict(_gevent_tracer.greenlets).items()
-                    if not greenlet.dead
-                ]
-            )
+    tasks = _list_greenlets(thread_id)
 
     loop = _asyncio.get_event_loop_for_thread(thread_id)
     if loop is not None:
@@ -137,3 +143,65 @@ cpdef list_tasks(thread_id):
         ])
 
     return tasks
+
+
+cdef _task_frames(registry, task_id, frame, max_nframes):
+    # A suspended coroutine has no caller and does not execute until it is
+    # resumed: its stack can be reused as long as it has not moved.
+    if registry is None or frame.f_back is not None:
+        if registry is not None:
+            registry.stacks.pop(task_id, None)
+        return _traceback.pyframe_to_frames(frame, max_nframes)
+
+    key = (id(frame), frame.f_lasti)
+    cached = registry.stacks.get(task_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    frames = _traceback.pyframe_to_frames(frame, max_nframes)
+    registry.stacks[task_id] = (key, frames)
+    return frames
+
+
+cpdef sample_tasks(thread_id, max_tasks, max_nframes):
+    # type: (...) -> typing.List[typing.Tuple[int, str, typing.List, int, float]]
+    """Return the stacks of a random subset of the running tasks.
+
+    At most ``max_tasks`` asyncio tasks are returned for the thread. Each
+    task comes with the weight to apply to its sample so that the totals
+    account for the tasks that were not sampled.
+
+    :return: [(task_id, task_name, frames, nframes, weight), ...]"""
+
+    tasks = []
+
+    for task_id, task_name, task_frame in _list_greenlets(thread_id):
+        if task_frame is not None:
+            frames, nframes = _traceback.pyframe_to_frames(task_frame, max_nframes)
+            tasks.append((task_id, task_name, frames, nframes, 1.0))
+
+    loop = _asyncio.get_event_loop_for_thread(thread_id)
+    if loop is None:
+        return tasks
+
+    registry = _asyncio.get_task_registry(loop)
+    if registry is not None:
+        sampled, weight = registry.sample(max_tasks)
+    else:
+        sampled = list(_asyncio.all_tasks(loop))
+        if len(sampled) > max_tasks:
+            weight = len(sampled) / max_tasks
+            sampled = random.sample(sampled, max_tasks)
+        else:
+            weight = 1.0
+
+    for task in sampled:
+        task_frame = _asyncio_task_get_frame(task)
+        # Ignore tasks with no frames; nothing to show.
+        if task_frame is None:
+            continue
+        task_id = id(task)
+        frames, nframes = _task_frames(registry, task_id, task_frame, max_nframes)
+        tasks.append((task_id, _asyncio._task_get_name(task), frames, nframes, weight))
+
+    return tasks
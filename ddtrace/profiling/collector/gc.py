@@ -0,0 +1,126 @@
+# -*- encoding: utf-8 -*-
+import _thread
+import gc
+import sys
+import typing
+
+import attr
+
+from ddtrace.internal import compat
+from ddtrace.internal.datadog.profiling import ddup
+from ddtrace.profiling import _threading
+from ddtrace.profiling import collector
+from ddtrace.profiling import event
+from ddtrace.profiling.collector import _traceback
+from ddtrace.settings.profiling import config
+
+
+@event.event_class
+class GCEvent(event.StackBasedEvent):
+    """A collection of the cyclic garbage collector."""
+
+    generation = attr.ib(default=0, type=int)
+    """The oldest generation collected."""
+
+    duration_ns = attr.ib(default=0, type=int)
+    """The duration of the collection in nanoseconds."""
+
+    collected = attr.ib(default=0, type=int)
+    """The number of objects collected."""
+
+    uncollectable = attr.ib(default=0, type=int)
+    """The number of objects found to be uncollectable."""
+
+
+@attr.s
+class GCCollector(collector.Collector):
+    """Record the pauses caused by the cyclic garbage collector.
+
+    The stack attached to each collection is the one of the thread whose
+    allocation triggered it.
+    """
+
+    nframes = attr.ib(type=int, default=config.max_frames)
+    endpoint_collection_enabled = attr.ib(type=bool, default=config.endpoint_collection)
+    export_libdd_enabled = attr.ib(type=bool, default=config.export.libdd_enabled)
+
+    tracer = attr.ib(default=None)
+
+    _callback = attr.ib(init=False, default=None, repr=False, eq=False)
+    _started_at = attr.ib(init=False, default=None, repr=False, type=typing.Optional[int])
+
+    def __attrs_post_init__(self):
+        # type: (...) -> None
+        # Check if libdd is available, if not, disable the feature
+        if self.export_libdd_enabled and not ddup.is_available:
+            self.export_libdd_enabled = False
+
+    def _start_service(self):
+        # type: (...) -> None
+        """Start collecting garbage collector pauses."""
+        self._callback = self._on_gc
+        gc.callbacks.append(self._callback)
+        super(GCCollector, self)._start_service()
+
+    def _stop_service(self):
+        # type: (...) -> None
+        """Stop collecting garbage collector pauses."""
+        super(GCCollector, self)._stop_service()
+        try:
+            gc.callbacks.remove(self._callback)
+        except ValueError:
+            pass
+        self._callback = self._started_at = None
+
+    def _on_gc(self, phase, info):
+        # type: (str, typing.Dict[str, int]) -> None
+        # DEV: the garbage collector runs with the GIL held and cannot be
+        # re-entered, so the start and stop phases always come in pairs.
+        if phase == "start":
+            self._started_at = compat.monotonic_ns()
+            return
+
+        started_at = self._started_at
+        if started_at is None:
+            # The collector was started during a collection
+            return
+        self._started_at = None
+
+        try:
+            duration_ns = compat.monotonic_ns() - started_at
+
+            thread_id = _thread.get_ident()
+            thread_name = _threading.get_thread_name(thread_id)
+            # The caller frame is the one that triggered the collection
+            frames, nframes = _traceback.pyframe_to_frames(sys._getframe(1), self.nframes)
+
+            if self.export_libdd_enabled:
+                handle = ddup.SampleHandle()
+                handle.push_gc(duration_ns, 1, info["collected"], info["uncollectable"])
+                handle.push_gc_generation(info["generation"])
+                handle.push_threadinfo(thread_id, _threading.get_thread_native_id(thread_id), thread_name)
+
+                if self.tracer is not None:
+                    handle.push_span(self.tracer.current_span(), self.endpoint_collection_enabled)
+                for frame in frames:
+                    handle.push_frame(frame.function_name, frame.file_name, 0, frame.lineno)
+                handle.flush_sample()
+            else:
+                event = GCEvent(
+                    frames=frames,
+                    nframes=nframes,
+                    thread_id=thread_id,
+                    thread_name=thread_name,
+                    thread_native_id=_threading.get_thread_native_id(thread_id),
+                    generation=info["generation"],
+                    duration_ns=duration_ns,
+                    collected=info["collected"],
+                    uncollectable=info["uncollectable"],
+                )
+
+                if self.tracer is not None:
+                    event.set_trace_info(self.tracer.current_span(), self.endpoint_collection_enabled)
+
+                self.recorder.push_event(event)
+        except Exception:
+            pass  # nosec
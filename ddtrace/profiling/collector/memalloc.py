@@ -105,28 +105,37 @@ class MemoryCollector(collector.PeriodicCollector):
         thread_id_ignore_set = self._get_thread_id_ignore_set()
 
         try:
-            events = _memalloc.heap()
+            samples, tracebacks = _memalloc.heap()
         except RuntimeError:
             # DEV: This can happen if either _memalloc has not been started or has been stopped.
             LOG.debug("Unable to collect heap events from process %d", os.getpid(), exc_info=True)
             return tuple()
 
+        # Samples sharing the same allocation site and thread are reported as a
+        # single event so that the cost of the snapshot scales with the number
+        # of unique sites rather than with the number of live samples.
+        sizes = {}  # type: typing.Dict[typing.Tuple[int, int], int]
+        for traceback_id, thread_id, size in samples:
+            if not self.ignore_profiler or thread_id not in thread_id_ignore_set:
+                key = (traceback_id, thread_id)
+                sizes[key] = sizes.get(key, 0) + size
+
         if self._export_libdd_enabled:
-            for (frames, nframes, thread_id), size in events:
-                if not self.ignore_profiler or thread_id not in thread_id_ignore_set:
-                    handle = ddup.SampleHandle()
-                    handle.push_heap(size)
-                    handle.push_threadinfo(
-                        thread_id, _threading.get_thread_native_id(thread_id), _threading.get_thread_name(thread_id)
-                    )
-                    try:
-                        for frame in frames:
-                            handle.push_frame(frame.function_name, frame.file_name, 0, frame.lineno)
-                        handle.flush_sample()
-                    except AttributeError:
-                        # DEV: This might happen if the memalloc sofile is unlinked and relinked without module
-                        #      re-initialization.
-                        LOG.debug("Invalid state detected in memalloc module, suppressing profile")
+            for (traceback_id, thread_id), size in sizes.items():
+                frames, _ = tracebacks[traceback_id]
+                handle = ddup.SampleHandle()
+                handle.push_heap(size)
+                handle.push_threadinfo(
+                    thread_id, _threading.get_thread_native_id(thread_id), _threading.get_thread_name(thread_id)
+                )
+                try:
+                    for frame in frames:
+                        handle.push_frame(frame.function_name, frame.file_name, 0, frame.lineno)
+                    handle.flush_sample()
+                except AttributeError:
+                    # DEV: This might happen if the memalloc sofile is unlinked and relinked without module
+                    #      re-initialization.
+                    LOG.debug("Invalid state detected in memalloc module, suppressing profile")
             return tuple()
         else:
             return (
@@ -135,13 +144,12 @@ class MemoryCollector(collector.PeriodicCollector):
                         thread_id=thread_id,
                         thread_name=_threading.get_thread_name(thread_id),
                         thread_native_id=_threading.get_thread_native_id(thread_id),
-                        frames=frames,
-                        nframes=nframes,
+                        frames=tracebacks[traceback_id][0],
+                        nframes=tracebacks[traceback_id][1],
                         size=size,
                         sample_size=self.heap_sample_size,
                     )
-                    for (frames, nframes, thread_id), size in events
-                    if not self.ignore_profiler or thread_id not in thread_id_ignore_set
+                    for (traceback_id, thread_id), size in sizes.items()
                 ),
             )
 
@@ -150,7 +158,7 @@ class MemoryCollector(collector.PeriodicCollector):
         # _memalloc buffer to our Recorder. This is fine for now, but we might want to store the nanoseconds
         # timestamp in C and then return it via iter_events.
         try:
-            events_iter, count, alloc_count = _memalloc.iter_events()
+            events_iter, count, alloc_count, tracebacks = _memalloc.iter_events()
         except RuntimeError:
             # DEV: This can happen if either _memalloc has not been started or has been stopped.
             LOG.debug("Unable to collect memory events from process %d", os.getpid(), exc_info=True)
@@ -163,9 +171,10 @@ class MemoryCollector(collector.PeriodicCollector):
         thread_id_ignore_set = self._get_thread_id_ignore_set()
 
         if self._export_libdd_enabled:
-            for (frames, nframes, thread_id), size, _domain in events:
+            for traceback_id, thread_id, size, _domain in events:
                 if thread_id in thread_id_ignore_set:
                     continue
+                frames, _ = tracebacks[traceback_id]
                 handle = ddup.SampleHandle()
                 handle.push_alloc(int((ceil(size) * alloc_count) / count), count)  # Roundup to help float precision
                 handle.push_threadinfo(
@@ -181,19 +190,20 @@ class MemoryCollector(collector.PeriodicCollector):
                     LOG.debug("Invalid state detected in memalloc module, suppressing profile")
             return tuple()
         else:
+            # Events with the same traceback share the same frames
             return (
                 tuple(
                     MemoryAllocSampleEvent(
                         thread_id=thread_id,
                         thread_name=_threading.get_thread_name(thread_id),
                         thread_native_id=_threading.get_thread_native_id(thread_id),
-                        frames=frames,
-                        nframes=nframes,
+                        frames=tracebacks[traceback_id][0],
+                        nframes=tracebacks[traceback_id][1],
                         size=size,
                         capture_pct=capture_pct,
                         nevents=alloc_count,
                     )
-                    for (frames, nframes, thread_id), size, domain in events
+                    for traceback_id, thread_id, size, domain in events
                     if not self.ignore_profiler or thread_id not in thread_id_ignore_set
                 ),
             )
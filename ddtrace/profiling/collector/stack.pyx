@@ -288,7 +288,9 @@ cdef collect_threads(thread_id_ignore_list, thread_time, thread_span_links) with
     )
 
 
-cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_time, thread_span_links, collect_endpoint):
+cdef stack_collect(
+    ignore_profiler, thread_time, max_nframes, max_tasks, interval, wall_time, thread_span_links, collect_endpoint
+):
     # Do not use `threading.enumerate` to not mess with locking (gevent!)
     thread_id_ignore_list = {
         thread_id
@@ -312,21 +314,14 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
             # Effectively we would be discarding a negligible number of samples.
             continue
 
-        tasks = _task.list_tasks(thread_id)
-
-        # Inject wall time for all running tasks
-        for task_id, task_name, task_pyframes in tasks:
-
-            # Ignore tasks with no frames; nothing to show.
-            if task_pyframes is None:
-                continue
-
-            frames, nframes = _traceback.pyframe_to_frames(task_pyframes, max_nframes)
+        tasks = _task.sample_tasks(thread_id, max_tasks, max_nframes)
 
+        # Inject wall time for the sampled running tasks
+        for task_id, task_name, frames, nframes, weight in tasks:
             if nframes:
                 if use_libdd:
                     handle = ddup.SampleHandle()
-                    handle.push_walltime(wall_time, 1)
+                    handle.push_walltime(int(wall_time * weight), 1)
                     handle.push_threadinfo(thread_id, thread_native_id, thread_name)
                     handle.push_task_id(task_id)
                     handle.push_task_name(task_name)
@@ -343,7 +338,7 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
                             task_id=task_id,
                             task_name=task_name,
                             nframes=nframes, frames=frames,
-                            wall_time_ns=wall_time,
+                            wall_time_ns=int(wall_time * weight),
                             sampling_period=int(interval * 1e9),
                         )
                     )
@@ -464,6 +459,7 @@ class StackCollector(collector.PeriodicCollector):
 
     max_time_usage_pct = attr.ib(type=float, default=config.max_time_usage_pct)
     nframes = attr.ib(type=int, default=config.max_frames)
+    max_tasks = attr.ib(type=int, default=config.stack.max_tasks)
     ignore_profiler = attr.ib(type=bool, default=config.ignore_profiler)
     endpoint_collection_enabled = attr.ib(default=None)
     tracer = attr.ib(default=None)
@@ -477,6 +473,11 @@ class StackCollector(collector.PeriodicCollector):
         if value <= 0 or value > 100:
             raise ValueError("Max time usage percent must be greater than 0 and smaller or equal to 100")
 
+    @max_tasks.validator
+    def _check_max_tasks(self, attribute, value):
+        if value <= 0:
+            raise ValueError("Max tasks must be greater than 0")
+
     def _init(self):
         # type: (...) -> None
         self._thread_time = _ThreadTime()
@@ -532,6 +533,7 @@ class StackCollector(collector.PeriodicCollector):
                 self.ignore_profiler,
                 self._thread_time,
                 self.nframes,
+                self.max_tasks,
                 self.interval,
                 wall_time,
                 self._thread_span_links,
@@ -19,6 +19,7 @@ from ddtrace.profiling import event
 from ddtrace.profiling import exporter
 from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import _lock
+from ddtrace.profiling.collector import gc
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.collector import threading
@@ -114,7 +115,6 @@ else:
     from ddtrace.profiling.exporter import pprof_3_pb2 as pprof_pb2  # type: ignore[no-redef]
 
 
-_ITEMGETTER_ZERO = operator.itemgetter(0)
 _ITEMGETTER_ONE = operator.itemgetter(1)
 _ATTRGETTER_ID = operator.attrgetter("id")
 
@@ -446,27 +446,42 @@ class _PprofConverter(object):
 
         self._location_values[location_key]["exception-samples"] = len(events)
 
-    def _build_libraries(self) -> typing.List[Package]:
-        return [
-            Package(
-                {
-                    "name": lib.name,
-                    "kind": "library",
-                    "version": lib.version,
-                    "paths": [lib_and_filename[1] for lib_and_filename in libs_and_filenames],
-                }
-            )
-            for lib, libs_and_filenames in groupby(
-                {
-                    _
-                    for _ in (
-                        (packages.filename_to_package(filename), filename)
-                        for filename, lineno, funcname in self._locations
-                    )
-                    if _[0] is not None
-                }, _ITEMGETTER_ZERO
-            )
-        ] + STDLIB
+    def convert_gc_event(
+        self,
+        thread_id: str,
+        thread_native_id: str,
+        thread_name: str,
+        local_root_span_id: str,
+        span_id: str,
+        trace_resource: str,
+        trace_type: str,
+        frames: HashableStackTraceType,
+        nframes: int,
+        generation: str,
+        events: typing.List[gc.GCEvent],
+    ) -> None:
+        location_key = (
+            self._to_locations(frames, nframes),
+            (
+                ("thread id", thread_id),
+                ("thread native id", thread_native_id),
+                ("thread name", thread_name),
+                ("local root span id", local_root_span_id),
+                ("span id", span_id),
+                ("trace endpoint", trace_resource),
+                ("trace type", trace_type),
+                ("gc generation", generation),
+                ("class name", frames[0][3] if frames else ""),
+            ),
+        )
+
+        self._location_values[location_key]["gc-collections"] = len(events)
+        self._location_values[location_key]["gc-time"] = sum(e.duration_ns for e in events)
+        self._location_values[location_key]["gc-collected"] = sum(e.collected for e in events)
+        self._location_values[location_key]["gc-uncollectable"] = sum(e.uncollectable for e in events)
+
+    def _filenames(self) -> typing.Set[str]:
+        return {filename for filename, lineno, funcname in self._locations}
 
     def _build_profile(
         self,
@@ -566,11 +581,63 @@ StackExceptionEventGroupKey = typing.NamedTuple(
 )
 
 
+GCEventGroupKey = typing.NamedTuple(
+    "GCEventGroupKey",
+    [
+        ("thread_id", str),
+        ("thread_native_id", str),
+        ("thread_name", str),
+        ("local_root_span_id", str),
+        ("span_id", str),
+        ("trace_resource", str),
+        ("trace_type", str),
+        ("frames", HashableStackTraceType),
+        ("nframes", int),
+        ("generation", str),
+    ],
+)
+
+
 @attr.s
 class PprofExporter(exporter.Exporter):
     """Export recorder events to pprof format."""
 
     enable_code_provenance = attr.ib(default=True, type=bool)
+    # The distribution of each filename is resolved only once per process,
+    # but each export only reports the libraries of its own filenames.
+    MAX_FILENAME_PACKAGES = 1 << 16
+    _filename_packages = attr.ib(
+        init=False, factory=dict, repr=False, type=typing.Dict[str, typing.Optional[packages.Distribution]]
+    )
+
+    def _build_libraries(self, filenames: typing.Set[str]) -> typing.List[Package]:
+        filename_packages = self._filename_packages
+        if len(filename_packages) > self.MAX_FILENAME_PACKAGES:
+            filename_packages.clear()
+
+        library_paths = {}  # type: typing.Dict[packages.Distribution, typing.List[str]]
+        for filename in filenames:
+            try:
+                lib = filename_packages[filename]
+            except KeyError:
+                lib = filename_packages[filename] = packages.filename_to_package(filename)
+            if lib is not None:
+                try:
+                    library_paths[lib].append(filename)
+                except KeyError:
+                    library_paths[lib] = [filename]
+
+        return [
+            Package(
+                {
+                    "name": lib.name,
+                    "kind": "library",
+                    "version": lib.version,
+                    "paths": paths,
+                }
+            )
+            for lib, paths in library_paths.items()
+        ] + [Package(lib, paths=list(lib["paths"])) for lib in STDLIB]
 
     def _stack_event_group_key(self, event: event.StackBasedEvent) -> StackEventGroupKey:
         return StackEventGroupKey(
@@ -640,6 +707,25 @@ class PprofExporter(exporter.Exporter):
     ]:
         return groupby(events, self._stack_exception_group_key)
 
+    def _gc_event_group_key(self, event: gc.GCEvent) -> GCEventGroupKey:
+        return GCEventGroupKey(
+            _none_to_str(event.thread_id),
+            _none_to_str(event.thread_native_id),
+            _get_thread_name(event.thread_id, event.thread_name),
+            _none_to_str(event.local_root_span_id),
+            _none_to_str(event.span_id),
+            self._get_event_trace_resource(event),
+            _none_to_str(event.trace_type),
+            tuple(event.frames),
+            event.nframes,
+            str(event.generation),
+        )
+
+    def _group_gc_events(
+        self, events: typing.Iterable[gc.GCEvent]
+    ) -> typing.Iterator[typing.Tuple[GCEventGroupKey, typing.Iterator[gc.GCEvent]]]:
+        return groupby(events, self._gc_event_group_key)
+
     def _get_event_trace_resource(self, event: event.StackBasedEvent) -> str:
         trace_resource = ""
         # Do not export trace_resource for non Web spans for privacy concerns.
@@ -775,6 +861,37 @@ class PprofExporter(exporter.Exporter):
                 list(typing.cast(typing.Iterator[stack_event.StackExceptionSampleEvent], se_events)),
             )
 
+        for (
+            (
+                thread_id,
+                thread_native_id,
+                thread_name,
+                local_root_span_id,
+                span_id,
+                trace_resource,
+                trace_type,
+                frames,
+                nframes,
+                generation,
+            ),
+            gc_events,
+        ) in self._group_gc_events(
+            events.get(gc.GCEvent, [])  # type: ignore[call-overload]
+        ):
+            converter.convert_gc_event(
+                thread_id,
+                thread_native_id,
+                thread_name,
+                local_root_span_id,
+                span_id,
+                trace_resource,
+                trace_type,
+                frames,
+                nframes,
+                generation,
+                list(typing.cast(typing.Iterator[gc.GCEvent], gc_events)),
+            )
+
         if memalloc._memalloc:
             for (
                 (
@@ -825,6 +942,10 @@ class PprofExporter(exporter.Exporter):
             ("alloc-samples", "count"),
             ("alloc-space", "bytes"),
             ("heap-space", "bytes"),
+            ("gc-collections", "count"),
+            ("gc-time", "nanoseconds"),
+            ("gc-collected", "count"),
+            ("gc-uncollectable", "count"),
         )
 
         profile = converter._build_profile(
@@ -837,7 +958,7 @@ class PprofExporter(exporter.Exporter):
 
         # Build profile first to get location filled out
         if self.enable_code_provenance:
-            libs = converter._build_libraries()
+            libs = self._build_libraries(converter._filenames())
         else:
             libs = []
 
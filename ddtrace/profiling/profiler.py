@@ -12,17 +12,20 @@ import attr
 import ddtrace
 from ddtrace.internal import agent
 from ddtrace.internal import atexit
+from ddtrace.internal import compat
 from ddtrace.internal import forksafe
 from ddtrace.internal import service
 from ddtrace.internal import uwsgi
 from ddtrace.internal import writer
 from ddtrace.internal.datadog.profiling import ddup
 from ddtrace.internal.module import ModuleWatchdog
+from ddtrace.profiling import _asyncio
 from ddtrace.profiling import collector
 from ddtrace.profiling import exporter  # noqa:F401
 from ddtrace.profiling import recorder
 from ddtrace.profiling import scheduler
 from ddtrace.profiling.collector import asyncio
+from ddtrace.profiling.collector import gc
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack
 from ddtrace.profiling.collector import stack_event
@@ -44,6 +47,15 @@ class Profiler(object):
     def __init__(self, *args, **kwargs):
         self._profiler = _ProfilerInstance(*args, **kwargs)
 
+    def burst(self, duration=None):
+        """Profile for a bounded window of time.
+
+        This is only available when the profiler runs in burst mode.
+
+        :param duration: The duration of the burst in seconds.
+        """
+        self._profiler.burst(duration)
+
     def start(self, stop_on_exit=True, profile_children=True):
         """Start the profiler.
 
@@ -117,12 +129,15 @@ class _ProfilerInstance(service.Service):
     _memory_collector_enabled = attr.ib(type=bool, default=config.memory.enabled)
     _stack_collector_enabled = attr.ib(type=bool, default=config.stack.enabled)
     _lock_collector_enabled = attr.ib(type=bool, default=config.lock.enabled)
+    _gc_collector_enabled = attr.ib(type=bool, default=config.gc.enabled)
     enable_code_provenance = attr.ib(type=bool, default=config.code_provenance)
     endpoint_collection_enabled = attr.ib(type=bool, default=config.endpoint_collection)
+    burst_enabled = attr.ib(type=bool, default=config.burst.enabled)
 
     _recorder = attr.ib(init=False, default=None)
     _collectors = attr.ib(init=False, default=None)
     _collectors_on_import = attr.ib(init=False, default=None, eq=False)
+    _burst = attr.ib(init=False, default=None, eq=False)
     _scheduler = attr.ib(init=False, default=None, type=Union[scheduler.Scheduler, scheduler.ServerlessScheduler])
     _lambda_function_name = attr.ib(
         init=False, factory=lambda: os.environ.get("AWS_LAMBDA_FUNCTION_NAME"), type=Optional[str]
@@ -186,6 +201,10 @@ class _ProfilerInstance(service.Service):
                 configured_features.append("stack")
         if self._lock_collector_enabled:
             configured_features.append("lock")
+        if self._gc_collector_enabled:
+            configured_features.append("gc")
+        if self.burst_enabled:
+            configured_features.append("burst")
         if self._memory_collector_enabled:
             configured_features.append("mem")
         if config.heap.sample_size > 0:
@@ -231,6 +250,7 @@ class _ProfilerInstance(service.Service):
                     config.enabled = False
                     config.export.libdd_required = False
                     config.lock.enabled = False
+                    config.gc.enabled = False
                     config.memory.enabled = False
                     config.stack.enabled = False
                     return []
@@ -281,6 +301,7 @@ class _ProfilerInstance(service.Service):
                         r,
                         tracer=self.tracer,
                         endpoint_collection_enabled=self.endpoint_collection_enabled,
+                        **({"max_time_usage_pct": config.burst.max_time_usage_pct} if self.burst_enabled else {}),
                     )  # type: ignore[call-arg]
                 )
                 LOG.debug("Profiling collector (stack) initialized")
@@ -294,7 +315,7 @@ class _ProfilerInstance(service.Service):
                 with self._service_lock:
                     col = collector_class(r, tracer=self.tracer)
 
-                    if self.status == service.ServiceStatus.RUNNING:
+                    if self.status == service.ServiceStatus.RUNNING and (self._burst is None or self._burst.active):
                         # The profiler is already running so we need to start the collector
                         try:
                             col.start()
@@ -319,6 +340,15 @@ class _ProfilerInstance(service.Service):
         if self._memory_collector_enabled:
             self._collectors.append(memalloc.MemoryCollector(r))
 
+        if self._gc_collector_enabled:
+            self._collectors.append(
+                gc.GCCollector(
+                    r,
+                    tracer=self.tracer,
+                    endpoint_collection_enabled=self.endpoint_collection_enabled,
+                )  # type: ignore[call-arg]
+            )
+
         exporters = self._build_default_exporters()
 
         if exporters or self._export_libdd_enabled:
@@ -332,6 +362,11 @@ class _ProfilerInstance(service.Service):
                 before_flush=self._collectors_snapshot,
             )
 
+        if self.burst_enabled:
+            from ddtrace.profiling import burst
+
+            self._burst = burst.BurstController(activate=self._start_collectors, deactivate=self._stop_burst)
+
     def _collectors_snapshot(self):
         for c in self._collectors:
             try:
@@ -353,21 +388,75 @@ class _ProfilerInstance(service.Service):
             }
         )
 
-    def _start_service(self):
+    def _start_collectors(self):
         # type: (...) -> None
-        """Start the profiler."""
+        if self._burst is not None:
+            # Discard anything that might have been recorded while dormant
+            self._recorder.reset()
+            if self._scheduler is not None:
+                self._scheduler._last_export = compat.time_ns()
+
         collectors = []
-        for col in self._collectors:
+        for col in list(self._collectors):
             try:
                 col.start()
             except collector.CollectorUnavailable:
                 LOG.debug("Collector %r is unavailable, disabling", col)
+            except service.ServiceStatusError:
+                # Started concurrently when its module got imported
+                collectors.append(col)
             except Exception:
                 LOG.error("Failed to start collector %r, disabling.", col, exc_info=True)
             else:
                 collectors.append(col)
         self._collectors = collectors
 
+    def _stop_collectors(self, join=True):
+        # type: (bool) -> None
+        for col in reversed(self._collectors):
+            try:
+                col.stop()
+            except service.ServiceStatusError:
+                # It's possible some collector failed to start, ignore failure to stop
+                pass
+
+        if join:
+            for col in reversed(self._collectors):
+                col.join()
+
+    def _stop_burst(self):
+        # type: (...) -> None
+        """Upload the profile of a burst and put the collectors back to sleep."""
+        if self._scheduler is not None:
+            # Do not stop the collectors before flushing, they might be needed (snapshot)
+            self._scheduler.flush()
+        self._stop_collectors()
+
+    def burst(self, duration=None):
+        # type: (Optional[float]) -> None
+        if self._burst is None:
+            raise RuntimeError("The profiler is not running in burst mode")
+        self._burst.trigger(duration)
+
+    def _start_service(self):
+        # type: (...) -> None
+        """Start the profiler."""
+        _asyncio.enable_task_registry()
+
+        if self._burst is not None:
+            # The collectors stay dormant until a burst is requested
+            from ddtrace.profiling import burst
+
+            self._burst.start()
+            burst.install_signal_handler(config.burst.signal)
+            try:
+                burst.enable_remote_configuration()
+            except Exception:
+                LOG.debug("Failed to enable profiling burst remote configuration", exc_info=True)
+            return
+
+        self._start_collectors()
+
         if self._scheduler is not None:
             self._scheduler.start()
 
@@ -385,7 +474,18 @@ class _ProfilerInstance(service.Service):
                 except ValueError:
                     pass
 
-        if self._scheduler is not None:
+        if self._burst is not None:
+            from ddtrace.profiling import burst
+
+            burst.uninstall_signal_handler()
+            self._burst.stop()
+            # Wait for a possibly running burst activation or upload to be over
+            if join:
+                self._burst.join()
+            if flush and self._burst.active and self._scheduler is not None:
+                # Do not stop the collectors before flushing, they might be needed (snapshot)
+                self._scheduler.flush()
+        elif self._scheduler is not None:
             self._scheduler.stop()
             # Wait for the export to be over: export might need collectors (e.g., for snapshot) so we can't stop
             # collectors before the possibly running flush is finished.
@@ -395,16 +495,9 @@ class _ProfilerInstance(service.Service):
                 # Do not stop the collectors before flushing, they might be needed (snapshot)
                 self._scheduler.flush()
 
-        for col in reversed(self._collectors):
-            try:
-                col.stop()
-            except service.ServiceStatusError:
-                # It's possible some collector failed to start, ignore failure to stop
-                pass
+        self._stop_collectors(join)
 
-        if join:
-            for col in reversed(self._collectors):
-                col.join()
+        _asyncio.disable_task_registry()
 
     def visible_events(self):
         return not self._export_libdd_enabled
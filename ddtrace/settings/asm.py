@@ -89,7 +89,9 @@ class ASMConfig(Env):
         + r"[\-]{5}[^\-]+[\-]{5}END[a-z\s]+PRIVATE\sKEY|ssh-rsa\s*[a-z0-9\/\.+]{100,}",
     )
     _iast_lazy_taint = Env.var(bool, IAST.LAZY_TAINT, default=False)
+    _iast_patch_cache_dir = Env.var(str, IAST.PATCH_CACHE_DIR, default="")
     _deduplication_enabled = Env.var(bool, "_DD_APPSEC_DEDUPLICATION_ENABLED", default=True)
+    _waf_batching = Env.var(bool, "_DD_APPSEC_WAF_BATCHING_ENABLED", default=False)
 
     # default will be set to True once the feature is GA. For now it's always False
     # _ep_enabled = Env.var(bool, EXPLOIT_PREVENTION.EP_ENABLED, default=False)
@@ -123,11 +125,13 @@ class ASMConfig(Env):
         "_iast_redaction_name_pattern",
         "_iast_redaction_value_pattern",
         "_iast_lazy_taint",
+        "_iast_patch_cache_dir",
         "_ep_stack_trace_enabled",
         "_ep_max_stack_traces",
         "_ep_max_stack_trace_depth",
         "_asm_config_keys",
         "_deduplication_enabled",
+        "_waf_batching",
     ]
     _iast_redaction_numeral_pattern = Env.var(
         str,
@@ -13,6 +13,7 @@ from ddtrace.version import get_version
 
 DEFAULT_MAX_PROBES = 100
 DEFAULT_GLOBAL_RATE_LIMIT = 100.0
+DEFAULT_MAX_OVERHEAD = 10.0  # percent
 
 
 def _derive_tags(c):
@@ -79,6 +80,15 @@ class DynamicInstrumentationConfig(En):
         help="Maximum size in bytes of a single configuration payload that can be handled per request",
     )
 
+    max_overhead = En.v(
+        float,
+        "max_overhead",
+        default=DEFAULT_MAX_OVERHEAD,
+        help_type="Float",
+        help="Maximum CPU time, in percent of the wall time, that probes are allowed to spend emitting signals before "
+        "being sampled down. A non-positive value disables the limit",
+    )
+
     upload_timeout = En.v(
         int,
         "upload.timeout",
@@ -95,6 +105,22 @@ class DynamicInstrumentationConfig(En):
         help="Interval in seconds for flushing the dynamic logs upload queue",
     )
 
+    upload_batch_size = En.v(
+        int,
+        "upload.batch_size",
+        default=1 << 20,  # 1 MB
+        help_type="Integer",
+        help="Target size in bytes of the uncompressed dynamic logs payloads uploaded in a single request",
+    )
+
+    upload_compression = En.v(
+        bool,
+        "upload.compression",
+        default=True,
+        help_type="Boolean",
+        help="Compress the dynamic logs payloads with gzip before uploading them",
+    )
+
     diagnostics_interval = En.v(
         int,
         "diagnostics.interval",
@@ -103,6 +129,15 @@ class DynamicInstrumentationConfig(En):
         help="Interval in seconds for periodically emitting probe diagnostic messages",
     )
 
+    diagnostics_deduplication = En.v(
+        bool,
+        "diagnostics.deduplication",
+        default=True,
+        help_type="Boolean",
+        help="Emit each probe diagnostic message only once per diagnostics interval across the worker processes "
+        "forked from the same parent process",
+    )
+
     redacted_identifiers = En.v(
         set,
         "redacted_identifiers",
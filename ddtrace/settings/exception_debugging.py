@@ -12,5 +12,14 @@ class ExceptionDebuggingConfig(En):
         help="Enable automatic capturing of exception debugging information",
     )
 
+    capture_interval = En.v(
+        float,
+        "capture_interval_seconds",
+        default=3600.0,  # 1 hour
+        help_type="Float",
+        help="Minimum interval in seconds between two captures of the same exception. Spans of repeated "
+        "exceptions link to the snapshots of the earlier capture. A non-positive value captures every exception",
+    )
+
 
 config = ExceptionDebuggingConfig()
@@ -190,6 +190,15 @@ class ProfilingConfig(En):
             help="Whether to enable the stack profiler",
         )
 
+        max_tasks = En.v(
+            int,
+            "max_tasks",
+            default=256,
+            help_type="Integer",
+            help="The maximum number of asyncio tasks sampled per thread at each collection."
+            " Samples are weighted to account for the tasks that are not collected",
+        )
+
         class V2(En):
             __item__ = __prefix__ = "v2"
 
@@ -214,6 +223,17 @@ class ProfilingConfig(En):
             help="Whether to enable the lock profiler",
         )
 
+    class GC(En):
+        __item__ = __prefix__ = "gc"
+
+        enabled = En.v(
+            bool,
+            "enabled",
+            default=False,
+            help_type="Boolean",
+            help="Whether to enable the garbage collector pause profiler",
+        )
+
     class Memory(En):
         __item__ = __prefix__ = "memory"
 
@@ -253,6 +273,41 @@ class ProfilingConfig(En):
         )
         sample_size = En.d(int, _derive_default_heap_sample_size)
 
+    class Burst(En):
+        __item__ = __prefix__ = "burst"
+
+        enabled = En.v(
+            bool,
+            "enabled",
+            default=False,
+            help_type="Boolean",
+            help="Whether to keep the collectors dormant until a profiling burst is requested",
+        )
+
+        duration = En.v(
+            float,
+            "duration",
+            default=30.0,
+            help_type="Float",
+            help="The default duration of a profiling burst in seconds",
+        )
+
+        max_time_usage_pct = En.v(
+            float,
+            "max_time_usage_pct",
+            default=5.0,
+            help_type="Float",
+            help="The maximum percentage of wall time the stack collector can use during a profiling burst",
+        )
+
+        signal = En.v(
+            str,
+            "signal",
+            default="",
+            help_type="String",
+            help="The name of a POSIX signal, e.g. ``SIGUSR2``, that requests a profiling burst",
+        )
+
     class Export(En):
         __item__ = __prefix__ = "export"
 
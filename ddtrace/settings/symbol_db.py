@@ -34,5 +34,38 @@ class SymbolDatabaseConfig(En):
         help="Whether to force symbol uploads, regardless of RC signals",
     )
 
+    _cache_dir = En.v(
+        str,
+        "cache_dir",
+        default="",
+        private=True,
+        help_type="String",
+        help="Directory where the symbols of the uploaded modules are cached across restarts. Disabled if empty",
+    )
+
+    _compression = En.v(
+        bool,
+        "compression",
+        default=False,
+        private=True,
+        help_type="Boolean",
+        help="Whether to compress the symbols payloads with gzip before uploading them",
+    )
+
+    # WARNING: The subprocess imports the modules again, which runs any side
+    # effect of their top-level code a second time, e.g. opening connections,
+    # writing files or registering signal handlers. Only enable this for
+    # applications whose modules are safe to import more than once.
+    _offload = En.v(
+        bool,
+        "offload",
+        default=False,
+        private=True,
+        help_type="Boolean",
+        help="Whether to extract the symbols of the modules imported before the uploader is installed "
+        "in a low-priority subprocess. The subprocess imports these modules again, so the side effects of "
+        "their top-level code run a second time",
+    )
+
 
 config = SymbolDatabaseConfig()
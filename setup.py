@@ -425,17 +425,6 @@ if not IS_PYSTON:
         ),
     ]
     if platform.system() not in ("Windows", ""):
-        ext_modules.append(
-            Extension(
-                "ddtrace.appsec._iast._stacktrace",
-                # Sort source files for reproducibility
-                sources=[
-                    "ddtrace/appsec/_iast/_stacktrace.c",
-                ],
-                extra_compile_args=debug_compile_args,
-            )
-        )
-
         ext_modules.append(CMakeExtension("ddtrace.appsec._iast._taint_tracking._native", source_dir=IAST_DIR))
 
     if platform.system() == "Linux" and is_64_bit_python():
@@ -498,6 +487,11 @@ setup(
                 sources=["ddtrace/internal/_tagset.pyx"],
                 language="c",
             ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._stack",
+                sources=["ddtrace/internal/_stack.pyx"],
+                language="c",
+            ),
             Extension(
                 "ddtrace.internal._encoding",
                 ["ddtrace/internal/_encoding.pyx"],
@@ -505,6 +499,11 @@ setup(
                 libraries=encoding_libraries,
                 define_macros=encoding_macros,
             ),
+            Cython.Distutils.Extension(
+                "ddtrace.appsec._ddwaf._converter",
+                sources=["ddtrace/appsec/_ddwaf/_converter.pyx"],
+                language="c",
+            ),
             Cython.Distutils.Extension(
                 "ddtrace.profiling.collector.stack",
                 sources=["ddtrace/profiling/collector/stack.pyx"],
@@ -1,3 +1,5 @@
+import base64
+import gzip
 import json
 
 from hypothesis import given
@@ -122,3 +124,53 @@ def test_limits(obj, res):
 def test_scanners(obj, res):
     schema = build_schema(obj)
     assert equal_with_meta(schema, res)  # max_depth=18, max_girth=255, max_types_in_array=10
+
+
+def test_schema_encoding_cache():
+    import mock
+
+    from ddtrace.appsec._api_security.api_manager import APIManager
+    from ddtrace.appsec._constants import SPAN_DATA_NAMES
+
+    manager = APIManager()
+    root = mock.Mock(_meta={}, _local_root=None)
+    root.context.sampling_priority = 1
+    waf_addresses = {
+        SPAN_DATA_NAMES.REQUEST_METHOD: "GET",
+        SPAN_DATA_NAMES.REQUEST_ROUTE: "/users/<id>",
+        SPAN_DATA_NAMES.RESPONSE_STATUS: "200",
+        SPAN_DATA_NAMES.REQUEST_QUERY: {"name": "alice"},
+    }
+    env = mock.Mock(span=root, waf_addresses=waf_addresses)
+    schema = [{"name": [8]}]
+    pii_schema = [{"name": [8, {"category": "pii", "type": "passport_number"}]}]
+
+    with mock.patch("ddtrace.appsec._api_security.api_manager.call_waf_callback") as call_waf_callback, mock.patch(
+        "ddtrace.appsec._api_security.api_manager.gzip.compress", wraps=gzip.compress
+    ) as compress, mock.patch(
+        "ddtrace.appsec._utils._appsec_apisec_features_is_active", return_value=True
+    ), mock.patch.object(
+        manager, "_should_collect_schema", return_value=True
+    ):
+        call_waf_callback.return_value = mock.Mock(derivatives={"_dd.appsec.s.req.query": schema})
+        manager._schema_callback(env)
+        encoded = root._meta["_dd.appsec.s.req.query"]
+        assert json.loads(gzip.decompress(base64.b64decode(encoded))) == schema
+
+        # The WAF is called for every sample, but an unchanged schema is not encoded again
+        root._meta = {}
+        waf_addresses[SPAN_DATA_NAMES.REQUEST_QUERY] = {"name": "bob"}
+        call_waf_callback.return_value = mock.Mock(derivatives={"_dd.appsec.s.req.query": list(schema)})
+        manager._schema_callback(env)
+        assert call_waf_callback.call_count == 2
+        assert compress.call_count == 1
+        assert root._meta["_dd.appsec.s.req.query"] == encoded
+
+        # Schemas that depend on the values, like scanner results, are encoded again
+        root._meta = {}
+        waf_addresses[SPAN_DATA_NAMES.REQUEST_QUERY] = {"name": "C03005988"}
+        call_waf_callback.return_value = mock.Mock(derivatives={"_dd.appsec.s.req.query": pii_schema})
+        manager._schema_callback(env)
+        assert call_waf_callback.call_count == 3
+        assert compress.call_count == 2
+        assert json.loads(gzip.decompress(base64.b64decode(root._meta["_dd.appsec.s.req.query"]))) == pii_schema
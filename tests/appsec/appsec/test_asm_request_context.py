@@ -94,3 +94,53 @@ def test_asm_request_context_manager():
     assert _asm_request_context.get_headers() == {}
     assert _asm_request_context.get_value("callbacks", "block") is None
     assert not _asm_request_context.get_headers_case_sensitive()
+
+
+def _record_waf_calls():
+    calls = []
+
+    def waf_callable(custom_data=None, **kwargs):
+        calls.append(custom_data)
+
+    _asm_request_context.set_waf_callback(waf_callable)
+    return calls
+
+
+@pytest.mark.parametrize("integration", ["django", "wsgi", None])
+def test_waf_batching(integration):
+    with override_global_config({"_asm_enabled": True, "_waf_batching": True}):
+        with _asm_request_context.asm_request_context_manager():
+            _asm_request_context._get_asm_context().integration = integration
+            calls = _record_waf_calls()
+
+            assert _asm_request_context.defer_waf_callback(("REQUEST_HTTP_IP",)) is None
+            if integration != "django":
+                # the integration checks for blocking before running the WAF
+                assert calls == [{"REQUEST_HTTP_IP": None}]
+                return
+
+            assert calls == []
+            # other WAF runs do not flush the batch
+            _asm_request_context.call_waf_callback({"LFI_ADDRESS": "/etc/passwd"})
+            assert calls == [{"LFI_ADDRESS": "/etc/passwd"}]
+
+            # the run of a flush point evaluates every address, including the batched ones
+            _asm_request_context.call_waf_phase(_asm_request_context._PHASE_REQUEST_BODY)
+            assert calls[-1] is None
+
+            # nothing left to flush
+            _asm_request_context.flush_waf_batch()
+            assert len(calls) == 2
+
+            _asm_request_context.defer_waf_callback(("REQUEST_USER_ID",))
+            _asm_request_context.flush_waf_batch()
+            assert calls[-1] == {"REQUEST_USER_ID": None}
+
+
+def test_waf_batching_disabled():
+    with override_global_config({"_asm_enabled": True, "_waf_batching": False}):
+        with _asm_request_context.asm_request_context_manager():
+            _asm_request_context._get_asm_context().integration = "django"
+            calls = _record_waf_calls()
+            _asm_request_context.defer_waf_callback(("REQUEST_HTTP_IP",))
+            assert calls == [{"REQUEST_HTTP_IP": None}]
@@ -1,9 +1,14 @@
+import ctypes
 import sys
 
 from hypothesis import given
 from hypothesis import strategies as st
 import pytest
 
+from ddtrace.appsec._ddwaf._converter import ObjectStore
+from ddtrace.appsec._ddwaf.ddwaf_types import DDWAF_MAX_CONTAINER_DEPTH
+from ddtrace.appsec._ddwaf.ddwaf_types import DDWAF_MAX_CONTAINER_SIZE
+from ddtrace.appsec._ddwaf.ddwaf_types import DDWAF_MAX_STRING_LENGTH
 from ddtrace.appsec._ddwaf.ddwaf_types import _observator
 from ddtrace.appsec._ddwaf.ddwaf_types import ddwaf_object
 
@@ -27,6 +32,15 @@ def test_ddwaf_objects_wrapper(obj, kwargs):
     del obj
 
 
+@given(obj=PYTHON_OBJECTS)
+def test_native_objects(obj):
+    store = ObjectStore(DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH)
+    native = ddwaf_object.from_address(store.convert(obj))
+    obs = _observator()
+    assert repr(native.struct) == repr(ddwaf_object(obj, observator=obs).struct)
+    assert store.truncation == obs.truncation
+
+
 class _AnyObject:
     cst = "1048A9B04F0EDC"
 
@@ -79,6 +93,72 @@ def test_limits(obj, res, trunc):
     assert dd_obj.struct == res
     assert obs.truncation == trunc
 
+    store = ObjectStore(1, 1, 3)
+    assert ddwaf_object.from_address(store.convert(obj)).struct == res
+    assert store.truncation == trunc
+
+
+def test_native_objects_cache():
+    store = ObjectStore(DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH)
+    body = "b" * 5000
+    query = {"q": "1"}
+
+    first = ddwaf_object.from_address(store.convert({"body": body, "query": query}, cache=True))
+    assert first.struct == {"body": "b" * 4095, "query": {"q": "1"}}
+    assert store.truncation == 1
+
+    store.truncation = 0
+    second = ddwaf_object.from_address(store.convert({"body": body}, cache=True))
+    assert second.struct == {"body": "b" * 4095}
+    # The truncation of the reused conversion is reported again
+    assert store.truncation == 1
+
+    # A new value for the address is converted again
+    third = ddwaf_object.from_address(store.convert({"body": "c"}, cache=True))
+    assert third.struct == {"body": "c"}
+
+
+def test_native_objects_cache_container():
+    store = ObjectStore(DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH)
+    query = {"q": ["1", 2, None]}
+
+    first = ddwaf_object.from_address(store.convert({"query": query}, cache=True))
+    second = ddwaf_object.from_address(store.convert({"query": query}, cache=True))
+    assert second.struct == first.struct == {"query": {"q": ["1", 2, None]}}
+    # The unchanged container is not converted again
+    assert ctypes.addressof(second.value.array[0].value.array.contents) == ctypes.addressof(
+        first.value.array[0].value.array.contents
+    )
+
+    # An equal container given as a new object is converted again
+    third = ddwaf_object.from_address(store.convert({"query": dict(query)}, cache=True))
+    assert third.struct == first.struct
+    assert ctypes.addressof(third.value.array[0].value.array.contents) != ctypes.addressof(
+        first.value.array[0].value.array.contents
+    )
+
+
+def test_native_objects_cache_mutated_container():
+    store = ObjectStore(DDWAF_MAX_CONTAINER_SIZE, DDWAF_MAX_CONTAINER_DEPTH, DDWAF_MAX_STRING_LENGTH)
+    body = {"a": ["b"]}
+
+    first = ddwaf_object.from_address(store.convert({"body": body}, cache=True))
+    assert first.struct == {"body": {"a": ["b"]}}
+
+    # The same container modified in place must not be seen as unchanged
+    body["a"].append("<script>")
+    body["c"] = "d"
+    second = ddwaf_object.from_address(store.convert({"body": body}, cache=True))
+    assert second.struct == {"body": {"a": ["b", "<script>"], "c": "d"}}
+
+    # Values comparing equal but of a different type are not converted the same way
+    body["c"] = True
+    third = ddwaf_object.from_address(store.convert({"body": body}, cache=True))
+    assert third.struct["body"]["c"] is True
+    body["c"] = 1
+    fourth = ddwaf_object.from_address(store.convert({"body": body}, cache=True))
+    assert type(fourth.struct["body"]["c"]) is int
+
 
 if __name__ == "__main__":
     import atheris
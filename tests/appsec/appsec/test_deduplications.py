@@ -0,0 +1,94 @@
+import mock
+
+from ddtrace.appsec._deduplications import DecayingBloomFilter
+from ddtrace.appsec._deduplications import probabilistic_deduplication
+from tests.utils import override_global_config
+
+
+def test_decaying_bloom_filter():
+    bloom_filter = DecayingBloomFilter(bits=1 << 12, hashes=3)
+    assert bloom_filter.memory == 1 << 10
+    assert bloom_filter.false_positive_rate() == 0.0
+
+    assert bloom_filter.add(hash("first"), 3600.0) == (False, False)
+    assert bloom_filter.add(hash("first"), 3600.0) == (True, False)
+    assert bloom_filter.add(hash("second"), 3600.0) == (False, False)
+    assert 0.0 < bloom_filter.false_positive_rate() < 1e-6
+
+    bloom_filter.clear()
+    assert bloom_filter.add(hash("first"), 3600.0) == (False, False)
+
+
+def test_decaying_bloom_filter_rotation():
+    bloom_filter = DecayingBloomFilter()
+
+    with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=0.0):
+        bloom_filter.clear()
+        assert bloom_filter.add(hash("hot"), 10.0) == (False, False)
+
+    # After half the time lapse, hashes are still remembered from the previous generation
+    with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=6.0):
+        assert bloom_filter.add(hash("hot"), 10.0) == (True, True)
+
+    # After another half time lapse, hashes are forgotten even if they were seen again
+    with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=12.0):
+        assert bloom_filter.add(hash("hot"), 10.0) == (False, True)
+        assert bloom_filter.add(hash("new"), 10.0) == (False, False)
+
+    # Nothing is remembered after a full time lapse
+    with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=30.0):
+        assert bloom_filter.add(hash("new"), 10.0) == (False, True)
+
+
+def test_decaying_bloom_filter_false_positive_rate():
+    bloom_filter = DecayingBloomFilter()
+
+    for i in range(5000):
+        bloom_filter.add(hash("vulnerability %d" % i), 3600.0)
+
+    assert all(hash("vulnerability %d" % i) in bloom_filter for i in range(5000))
+    false_positives = sum(hash("other %d" % i) in bloom_filter for i in range(5000))
+    # The estimation is close to the observed rate
+    assert false_positives / 5000 < 3 * bloom_filter.false_positive_rate() + 0.001
+    assert bloom_filter.false_positive_rate() < 0.01
+
+
+def test_probabilistic_deduplication():
+    calls = []
+
+    @probabilistic_deduplication
+    def report(*args):
+        calls.append(args)
+        return True
+
+    with override_global_config(dict(_deduplication_enabled=True)):
+        assert report("SQL_INJECTION", "SELECT 1") is True
+        assert report("SQL_INJECTION", "SELECT 1") is None
+        assert report("SQL_INJECTION", "SELECT 2") is True
+    assert calls == [("SQL_INJECTION", "SELECT 1"), ("SQL_INJECTION", "SELECT 2")]
+
+    with override_global_config(dict(_deduplication_enabled=False)):
+        assert report("SQL_INJECTION", "SELECT 1") is True
+
+    report._reset_cache()
+    with override_global_config(dict(_deduplication_enabled=True)):
+        assert report("SQL_INJECTION", "SELECT 1") is True
+
+
+def test_probabilistic_deduplication_hot_hash_expires():
+    @probabilistic_deduplication
+    def report(*args):
+        return True
+
+    report._time_lapse = 10.0
+    with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=0.0):
+        report._reset_cache()
+    reported = []
+    with override_global_config(dict(_deduplication_enabled=True)):
+        for current in range(21):
+            with mock.patch("ddtrace.appsec._deduplications.monotonic", return_value=float(current)):
+                if report("SQL_INJECTION", "SELECT 1"):
+                    reported.append(current)
+
+    # A hash seen continuously is reported again after each time lapse
+    assert reported == [0, 10, 20]
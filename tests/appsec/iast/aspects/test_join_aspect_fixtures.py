@@ -165,23 +165,15 @@ class TestOperatorJoinReplacement(object):
         result = mod.do_join(string_input, it)
         ranges = get_tainted_ranges(result)
         assert result == "aaaa-joiner-bbbb-joiner-cccc-joiner-dddd-joiner-eeee-joiner-ffff-joiner-gggg"
+        # Adjacent ranges from the same source are merged
         pos = 0
         for results in (
-            "aaaa",
-            "-joiner-",
-            "-joiner-",
-            "cccc",
-            "-joiner-",
-            "dddd",
-            "-joiner-",
-            "eeee",
-            "-joiner-",
-            "ffff",
-            "-joiner-",
-            "gggg",
+            "aaaa-joiner-",
+            "-joiner-cccc-joiner-dddd-joiner-eeee-joiner-ffff-joiner-gggg",
         ):
             assert result[ranges[pos].start : (ranges[pos].start + ranges[pos].length)] == results
             pos += 1
+        assert len(ranges) == pos
 
     def test_string_join_tuple(self):  # type: () -> None
         # Not tainted
@@ -244,9 +236,9 @@ class TestOperatorJoinReplacement(object):
         assert result == "abcdeabcdeabcde"
 
         ranges = get_tainted_ranges(result)
-        assert result[ranges[0].start : (ranges[0].start + ranges[0].length)] == "abcde"
-        assert result[ranges[1].start : (ranges[1].start + ranges[1].length)] == "abcde"
-        assert result[ranges[2].start : (ranges[2].start + ranges[2].length)] == "abcde"
+        # Adjacent ranges from the same source are merged
+        assert len(ranges) == 1
+        assert result[ranges[0].start : (ranges[0].start + ranges[0].length)] == "abcdeabcdeabcde"
 
     def test_string_join_args_kwargs(self):
         # type: () -> None
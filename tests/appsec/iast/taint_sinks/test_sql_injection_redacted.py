@@ -276,7 +276,7 @@ def test_scrub_cache(tracer):
         oce.reconfigure()
         with tracer.trace("test1") as span:
             oce.acquire_request(span)
-            VulnerabilityBase._redacted_report_cache = LFUCache()
+            VulnerabilityBase._redacted_evidence_cache = LFUCache()
             SqlInjection.report(evidence_value=valueParts1, sources=[s1])
             span_report1 = core.get_item(IAST.CONTEXT_KEY, span=span)
             assert span_report1, "no report: check that get_info_frame is not skipping this frame"
@@ -289,10 +289,10 @@ def test_scrub_cache(tracer):
                     {"value": ":{SHA1}'"},
                 ],
             )
-            assert len(VulnerabilityBase._redacted_report_cache) == 1
+            assert len(VulnerabilityBase._redacted_evidence_cache) == 1
         oce.release_request()
 
-        # Should be the same report object
+        # Same evidence and sources, the redaction is cached but each span gets its own report
         with tracer.trace("test2") as span:
             oce.acquire_request(span)
             SqlInjection.report(evidence_value=valueParts1_copy1, sources=[s1])
@@ -306,9 +306,9 @@ def test_scrub_cache(tracer):
                     {"value": ":{SHA1}'"},
                 ],
             )
-            assert id(span_report1) == id(span_report2)
-            assert span_report1 is span_report2
-            assert len(VulnerabilityBase._redacted_report_cache) == 1
+            assert span_report1 is not span_report2
+            assert span_report1.sources == span_report2.sources
+            assert len(VulnerabilityBase._redacted_evidence_cache) == 1
         oce.release_request()
 
         # Different report, other valueParts
@@ -327,7 +327,7 @@ def test_scrub_cache(tracer):
             )
             assert id(span_report1) != id(span_report3)
             assert span_report1 is not span_report3
-            assert len(VulnerabilityBase._redacted_report_cache) == 2
+            assert len(VulnerabilityBase._redacted_evidence_cache) == 2
         oce.release_request()
 
         # Different report, other source
@@ -346,7 +346,7 @@ def test_scrub_cache(tracer):
             )
             assert id(span_report1) != id(span_report4)
             assert span_report1 is not span_report4
-            assert len(VulnerabilityBase._redacted_report_cache) == 3
+            assert len(VulnerabilityBase._redacted_evidence_cache) == 3
         oce.release_request()
 
         # Same as previous so cache should not increase
@@ -365,7 +365,52 @@ def test_scrub_cache(tracer):
             )
             assert id(span_report1) != id(span_report5)
             assert span_report1 is not span_report5
-            assert id(span_report4) == id(span_report5)
-            assert span_report4 is span_report5
-            assert len(VulnerabilityBase._redacted_report_cache) == 3
+            assert span_report4 is not span_report5
+            assert span_report4.sources == span_report5.sources
+            assert len(VulnerabilityBase._redacted_evidence_cache) == 3
         oce.release_request()
+
+
+def test_scrub_cache_value_parts_order(tracer):
+    # These value parts have the same Evidence hash, as it ignores their order and duplicated parts cancel out
+    value_parts = [
+        [
+            {"value": "1", "source": 0},
+            {"value": "SELECT a FROM t WHERE x = '"},
+            {"value": "'"},
+        ],
+        [
+            {"value": "SELECT a FROM t WHERE x = '"},
+            {"value": "1", "source": 0},
+            {"value": "'"},
+        ],
+        [
+            {"value": "SELECT a FROM t WHERE x = '"},
+            {"value": "1", "source": 0},
+            {"value": "'"},
+            {"value": "'"},
+            {"value": "'"},
+        ],
+    ]
+    s1 = Source(origin="SomeOrigin", name="SomeName", value="1")
+
+    def redacted_value_parts(parts):
+        with tracer.trace("test") as span:
+            oce.acquire_request(span)
+            SqlInjection.report(evidence_value=copy.deepcopy(parts), sources=[s1])
+            span_report = core.get_item(IAST.CONTEXT_KEY, span=span)
+            oce.release_request()
+        return list(span_report.vulnerabilities)[0].evidence.valueParts
+
+    env = {"DD_IAST_REQUEST_SAMPLING": "100", "DD_IAST_ENABLED": "true"}
+    with override_global_config(dict(_deduplication_enabled=False)), override_env(env):
+        oce.reconfigure()
+        expected = []
+        for parts in value_parts:
+            VulnerabilityBase._redacted_evidence_cache = LFUCache()
+            expected.append(redacted_value_parts(parts))
+
+        VulnerabilityBase._redacted_evidence_cache = LFUCache()
+        for parts, redacted in zip(value_parts, expected):
+            assert redacted_value_parts(parts) == redacted
+        assert len(VulnerabilityBase._redacted_evidence_cache) == len(value_parts)
@@ -19,6 +19,7 @@ with override_env({"DD_IAST_ENABLED": "True"}):
     from ddtrace.appsec._iast._taint_tracking import debug_taint_map
     from ddtrace.appsec._iast._taint_tracking import get_range_by_hash
     from ddtrace.appsec._iast._taint_tracking import get_ranges
+    from ddtrace.appsec._iast._taint_tracking import interned_sources_size
     from ddtrace.appsec._iast._taint_tracking import is_notinterned_notfasttainted_unicode
     from ddtrace.appsec._iast._taint_tracking import num_objects_tainted
     from ddtrace.appsec._iast._taint_tracking import reset_context
@@ -441,3 +442,52 @@ def test_reset_objects():
     create_context()
 
     assert num_objects_tainted() == 0
+
+
+def test_interned_sources():
+    reset_context()
+    create_context()
+    assert interned_sources_size() == 0
+
+    a_1 = taint_pyobject(
+        "abc123", source_name="test_interned_sources", source_value="abc", source_origin=OriginType.PARAMETER
+    )
+    a_2 = taint_pyobject(
+        "def456", source_name="test_interned_sources", source_value="abc", source_origin=OriginType.PARAMETER
+    )
+    a_3 = taint_pyobject(
+        "ghi789", source_name="test_interned_sources", source_value="abc", source_origin=OriginType.HEADER
+    )
+    assert interned_sources_size() == 2
+    assert get_ranges(a_1)[0].source == get_ranges(a_2)[0].source
+    assert get_ranges(a_1)[0].source != get_ranges(a_3)[0].source
+
+    reset_context()
+    assert interned_sources_size() == 0
+
+
+def test_merge_adjacent_ranges():
+    create_context()
+    a_1 = taint_pyobject(
+        "abc", source_name="test_merge_adjacent_ranges", source_value="abc", source_origin=OriginType.PARAMETER
+    )
+    a_2 = taint_pyobject(
+        "def", source_name="test_merge_adjacent_ranges", source_value="abc", source_origin=OriginType.PARAMETER
+    )
+    a_3 = taint_pyobject(
+        "ghi", source_name="test_merge_adjacent_ranges", source_value="ghi", source_origin=OriginType.PARAMETER
+    )
+
+    result = add_aspect(add_aspect(a_1, a_2), a_3)
+    ranges = get_ranges(result)
+    assert [(r.start, r.length) for r in ranges] == [(0, 6), (6, 3)]
+    assert ranges[0].source == get_ranges(a_1)[0].source
+    assert ranges[1].source == get_ranges(a_3)[0].source
+
+    # Ranges separated by untainted text are kept apart
+    result = join_aspect("".join, 1, "-", [a_1, a_2])
+    assert [(r.start, r.length) for r in get_ranges(result)] == [(0, 3), (4, 3)]
+
+    # The ranges of the operands are left untouched
+    assert [(r.start, r.length) for r in get_ranges(a_1)] == [(0, 3)]
+    assert [(r.start, r.length) for r in get_ranges(a_2)] == [(0, 3)]
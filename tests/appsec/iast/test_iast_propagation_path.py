@@ -94,10 +94,10 @@ def test_propagation_path_1_origins_2_propagations(origin1, iast_span_defaults):
     assert sources[0].origin == OriginType.PATH
     assert sources[0].value == value_encoded
 
+    # Adjacent ranges from the same source are merged
     value_parts = [
         {"value": ANY},
-        {"source": 0, "value": value_encoded},
-        {"source": 0, "value": value_encoded},
+        {"source": 0, "value": value_encoded * 2},
         {"value": ".txt"},
     ]
     _assert_vulnerability(span_report, value_parts, "propagation_path_1_source_2_prop")
@@ -8,6 +8,7 @@ import mock
 import ddtrace.appsec._iast._loader
 import ddtrace.bootstrap.preload
 from tests.utils import override_env
+from tests.utils import override_global_config
 
 
 ASPECTS_MODULE = "ddtrace.appsec._iast._taint_tracking.aspects"
@@ -37,3 +38,58 @@ def test_patching_error():
         loader_compile.assert_called_once()
         loader_exec.assert_not_called()
         assert ASPECTS_MODULE not in sys.modules
+
+
+def test_patch_cache(tmp_path):
+    """
+    When the IAST patch cache is enabled, the patched code of a module is
+    reused the next time the module is imported.
+    """
+    fixture_module = "tests.appsec.iast.fixtures.loader"
+    ddtrace.appsec._iast._loader.IS_IAST_ENABLED = True
+
+    with override_env({"DD_IAST_ENABLED": "true"}), override_global_config(dict(_iast_patch_cache_dir=str(tmp_path))):
+        with mock.patch(
+            "ddtrace.appsec._iast._loader.astpatch_module", wraps=ddtrace.appsec._iast._loader.astpatch_module
+        ) as loader_astpatch, mock.patch("ddtrace.appsec._iast._loader.exec") as loader_exec:
+            importlib.reload(ddtrace.bootstrap.preload)
+            for _ in range(2):
+                sys.modules.pop(fixture_module, None)
+                importlib.import_module(fixture_module)
+
+        loader_astpatch.assert_called_once()
+        assert loader_exec.call_count == 2
+        first_code, second_code = (call.args[0] for call in loader_exec.call_args_list)
+        assert first_code == second_code
+        assert len(list(tmp_path.glob("*/*.iastc"))) == 1
+
+
+def test_patch_cache_entries(tmp_path):
+    from ddtrace.appsec._iast._ast import patch_cache
+
+    module = importlib.import_module("tests.appsec.iast.fixtures.loader")
+    code = compile("x = 1", "x.py", "exec")
+
+    with override_global_config(dict(_iast_patch_cache_dir="")):
+        assert patch_cache.cache_key(module) is None
+        assert patch_cache.load(None) == (False, None)
+
+    with override_global_config(dict(_iast_patch_cache_dir=str(tmp_path))):
+        key = patch_cache.cache_key(module)
+        assert key is not None
+        assert patch_cache.load(key) == (False, None)
+
+        patch_cache.store(key, None)
+        assert patch_cache.load(key) == (True, None)
+
+        patch_cache.store(key, code)
+        cached, cached_code = patch_cache.load(key)
+        assert cached and cached_code == code
+
+        # corrupted entries are ignored
+        entry = patch_cache._cache_path(key)
+        with open(entry, "r+b") as entry_file:
+            entry_file.truncate(10)
+        assert patch_cache.load(key) == (False, None)
+
+        assert not list(tmp_path.glob("*/*.tmp"))
@@ -1,5 +1,7 @@
 from time import sleep
 
+import mock
+
 from ddtrace.appsec._constants import IAST
 from ddtrace.appsec._iast import oce
 from ddtrace.appsec._iast._overhead_control_engine import MAX_REQUESTS
@@ -161,3 +163,73 @@ def test_oce_concurrent_requests(tracer, iast_span_defaults):
 
     # Ensures quota is always within bounds after multithreading scenario
     assert 0 <= oc._request_quota <= MAX_REQUESTS
+
+
+def test_oce_adaptive_route_sampling(iast_span_defaults):
+    from ddtrace.appsec._iast._overhead_control_engine import COLD_ROUTE_INTERVAL
+    from ddtrace.appsec._iast._overhead_control_engine import MIN_ROUTE_SAMPLING
+    from ddtrace.appsec._iast._overhead_control_engine import OverheadControl
+
+    oc = OverheadControl()
+    oc.reconfigure()
+    oc._adaptive = True
+
+    # New routes are always analyzed
+    assert oc.acquire_request(iast_span_defaults, "/hot/<id>") is True
+    oc.release_request("/hot/<id>", 0.0, set())
+    assert oc._routes["/hot/<id>"].rate == 0.5
+
+    # Routes without new vulnerabilities are analyzed less and less
+    for _ in range(20):
+        oc.release_request("/hot/<id>", 0.0, set())
+    assert oc._routes["/hot/<id>"].rate == MIN_ROUTE_SAMPLING
+
+    # A new vulnerability brings the route back to 100%
+    oc.release_request("/hot/<id>", 0.0, {("FAKE", "app.py", 10)})
+    assert oc._routes["/hot/<id>"].rate == 1.0
+    assert oc._routes["/hot/<id>"].fingerprints == {("FAKE", "app.py", 10)}
+
+    # The same vulnerability is not new anymore, even if reported by another request
+    oc.release_request("/hot/<id>", 0.0, {("FAKE", "app.py", 10)})
+    assert oc._routes["/hot/<id>"].rate == 0.5
+
+    # Cold routes are analyzed again
+    for _ in range(20):
+        oc.release_request("/hot/<id>", 0.0, set())
+    with mock.patch("ddtrace.appsec._iast._overhead_control_engine.random.random", return_value=0.5):
+        assert oc._sample_route(iast_span_defaults, "/hot/<id>") is False
+        oc._routes["/hot/<id>"].last_analyzed -= COLD_ROUTE_INTERVAL + 1
+        assert oc._sample_route(iast_span_defaults, "/hot/<id>") is True
+
+
+def test_oce_adaptive_unknown_route(iast_span_defaults):
+    from ddtrace.appsec._iast._overhead_control_engine import OverheadControl
+
+    oc = OverheadControl()
+    oc.reconfigure()
+    oc._adaptive = True
+
+    # Requests without a known route use the global sampling rate
+    with mock.patch.object(oc._sampler, "sample", return_value=False) as sample:
+        assert oc.acquire_request(iast_span_defaults, None) is False
+        sample.assert_called_once_with(iast_span_defaults)
+
+    # Requests without a resolved route do not create route states
+    oc.release_request(None, 0.0, set())
+    assert oc._routes == {}
+
+
+def test_oce_adaptive_cpu_budget(iast_span_defaults):
+    from ddtrace.appsec._iast._overhead_control_engine import OverheadControl
+
+    oc = OverheadControl()
+    oc.reconfigure()
+    oc._adaptive = True
+
+    assert oc.acquire_request(iast_span_defaults, "/expensive") is True
+    oc.release_request("/expensive", oc._cpu_budget + 10.0)
+
+    # The budget is exhausted for every route
+    assert oc.acquire_request(iast_span_defaults, "/expensive") is False
+    assert oc.acquire_request(iast_span_defaults, "/new") is False
+    assert oc._request_quota == MAX_REQUESTS
@@ -1,5 +1,6 @@
 import json
 
+import mock
 import pytest
 
 from ddtrace.appsec._constants import IAST
@@ -7,6 +8,7 @@ from ddtrace.appsec._iast._patch_modules import patch_iast
 from ddtrace.constants import SAMPLING_PRIORITY_KEY
 from ddtrace.constants import USER_KEEP
 from ddtrace.ext import SpanTypes
+from ddtrace.ext import http
 from ddtrace.internal import core
 from tests.utils import DummyTracer
 from tests.utils import override_env
@@ -56,3 +58,34 @@ def test_appsec_iast_processor_ensure_span_is_manual_keep(sampling_rate):
 
         assert len(json.loads(result)["vulnerabilities"]) == 1
         assert span.get_metric(SAMPLING_PRIORITY_KEY) is USER_KEEP
+
+
+def test_appsec_iast_processor_adaptive_route():
+    from ddtrace.appsec._iast import oce
+    from ddtrace.appsec._iast.processor import _REQUEST_ROUTE
+
+    with override_global_config(dict(_iast_enabled=True)), mock.patch.object(oce, "_adaptive", True):
+        oce.reconfigure()
+        tracer = DummyTracer(iast_enabled=True)
+        try:
+            with mock.patch.object(oce._sampler, "sample", return_value=False) as sample:
+                # The route template is resolved by the framework before the request span starts
+                with core.context_with_data("django.traced_get_response", route="users/<int:id>/"):
+                    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+                        span.set_tag_str(http.ROUTE, "users/<int:id>/")
+                assert _REQUEST_ROUTE.get() is None
+
+                # New routes are analyzed without using the global sampling rate
+                assert core.get_item(IAST.REQUEST_IAST_ENABLED, span=span)
+                sample.assert_not_called()
+                assert list(oce._routes) == ["users/<int:id>/"]
+                assert oce._routes["users/<int:id>/"].rate == 0.5
+
+                # Requests whose route is not resolved when they start use the global sampling rate
+                with core.context_with_data("wsgi.__call__", environ={"PATH_INFO": "/users/1"}):
+                    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+                        pass
+                assert not core.get_item(IAST.REQUEST_IAST_ENABLED, span=span)
+                sample.assert_called_once()
+        finally:
+            oce.reconfigure()
@@ -314,3 +314,62 @@ def test_taint_structure():
     d = {1: "foo"}
     tainted = taint_structure(d, OriginType.PARAMETER, OriginType.PARAMETER)
     assert is_pyobject_tainted(tainted[1])
+
+
+def test_lazy_taint_identity():
+    tainted_dict = LazyTaintDict(
+        {
+            "tr_key_001": ["tr_val_001", {"tr_key_002": "tr_val_002"}],
+            "tr_key_003": "tr_val_003",
+        },
+        origins=(OriginType.PARAMETER_NAME, OriginType.PARAMETER),
+    )
+
+    value = tainted_dict["tr_key_003"]
+    assert is_pyobject_tainted(value)
+    assert tainted_dict["tr_key_003"] is value
+    assert tainted_dict.get("tr_key_003") is value
+
+    nested_list = tainted_dict["tr_key_001"]
+    assert tainted_dict["tr_key_001"] is nested_list
+    assert nested_list[0] is nested_list[0]
+    nested_dict = nested_list[1]
+    assert nested_list[1] is nested_dict
+    assert nested_dict["tr_key_002"] is nested_dict["tr_key_002"]
+    assert is_pyobject_tainted(nested_dict["tr_key_002"])
+
+    # Replaced values are tainted again
+    tainted_dict["tr_key_003"] = "tr_val_004"
+    new_value = tainted_dict["tr_key_003"]
+    assert new_value == "tr_val_004"
+    assert is_pyobject_tainted(new_value)
+
+
+def test_lazy_taint_dict_views():
+    tainted_dict = LazyTaintDict(
+        {"tr_key_001": "tr_val_001", "tr_key_002": "tr_val_002"},
+        origins=(OriginType.PARAMETER_NAME, OriginType.PARAMETER),
+    )
+
+    assert len(tainted_dict.keys()) == len(tainted_dict.values()) == len(tainted_dict.items()) == 2
+    assert "tr_key_001" in tainted_dict.keys()
+    assert ("tr_key_002", "tr_val_002") in tainted_dict.items()
+    assert all(is_pyobject_tainted(k) for k in tainted_dict.keys())
+    assert all(is_pyobject_tainted(v) for v in tainted_dict.values())
+    assert list(reversed(tainted_dict)) == ["tr_key_002", "tr_key_001"]
+
+
+def test_lazy_taint_structure():
+    from ddtrace.appsec._iast._taint_tracking import get_tainted_ranges
+    from ddtrace.appsec._iast._taint_utils import lazy_taint_structure
+
+    tainted_dict = lazy_taint_structure({"key": "value"}, OriginType.BODY, OriginType.BODY)
+    assert isinstance(tainted_dict, LazyTaintDict)
+    assert get_tainted_ranges(tainted_dict["key"])[0].source.origin == OriginType.BODY
+
+    tainted_list = lazy_taint_structure(["value"], OriginType.BODY, OriginType.BODY)
+    assert isinstance(tainted_list, LazyTaintList)
+    assert get_tainted_ranges(tainted_list[0])[0].source.origin == OriginType.BODY
+
+    assert lazy_taint_structure(tainted_dict, OriginType.BODY, OriginType.BODY) is tainted_dict
+    assert is_pyobject_tainted(lazy_taint_structure("value", OriginType.BODY, OriginType.BODY))
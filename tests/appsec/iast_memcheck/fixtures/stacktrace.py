@@ -1,6 +1,6 @@
 import os
 
-from ddtrace.appsec._iast._stacktrace import get_info_frame
+from ddtrace.internal._stack import get_info_frame
 from tests.appsec.iast_memcheck._stacktrace_py import get_info_frame as get_info_frame_py
 
 
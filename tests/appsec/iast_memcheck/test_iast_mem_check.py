@@ -5,8 +5,8 @@ from pytest_memray import LeaksFilterFunction
 from pytest_memray import Stack
 
 from ddtrace.appsec._constants import IAST
-from ddtrace.appsec._iast._stacktrace import get_info_frame
 from ddtrace.internal import core
+from ddtrace.internal._stack import get_info_frame
 from tests.appsec.iast.aspects.conftest import _iast_patched_module
 from tests.appsec.iast_memcheck._stacktrace_py import get_info_frame as get_info_frame_py
 from tests.appsec.iast_memcheck.fixtures.stacktrace import func_1
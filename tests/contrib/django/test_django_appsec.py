@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import mock
 import pytest
 
 from ddtrace.appsec._constants import APPSEC
@@ -74,6 +75,37 @@ def test_request_block_request_callable(client, test_spans, tracer):
             assert result.headers["content-type"] == "text/json"
 
 
+@pytest.mark.parametrize("waf_batching", [True, False])
+def test_request_ipblock_waf_batching(client, test_spans, tracer, waf_batching):
+    from ddtrace.appsec._ddwaf import DDWaf
+
+    with override_global_config(
+        dict(_asm_enabled=True, _api_security_enabled=False, _waf_batching=waf_batching)
+    ), override_env(dict(DD_APPSEC_RULES=rules.RULES_GOOD_PATH)), mock.patch.object(
+        DDWaf, "run", autospec=True, side_effect=DDWaf.run
+    ) as waf_run:
+        root, result = _aux_appsec_get_root_span(
+            client, test_spans, tracer, url="/", headers={"HTTP_X_REAL_IP": rules._IP.BLOCKED}
+        )
+        # The request is blocked before the middlewares and the view run
+        assert result.status_code == 403
+        assert result.content == bytes(constants.BLOCKED_RESPONSE_JSON, "utf-8")
+        assert root.get_tag(http.STATUS_CODE) == "403"
+        assert [span.name for span in test_spans.spans] == ["django.request"]
+        assert waf_run.call_count == 1
+        test_spans.reset()
+        waf_run.reset_mock()
+
+        root, result = _aux_appsec_get_root_span(
+            client, test_spans, tracer, url="/", headers={"HTTP_X_REAL_IP": rules._IP.DEFAULT}
+        )
+        assert result.status_code == 200
+        assert "django.view" in [span.name for span in test_spans.spans]
+        # Runs of the request body and response phases and at the end of the request. With batching, the client IP is
+        # evaluated by the run of the request body phase instead of its own run.
+        assert waf_run.call_count == (3 if waf_batching else 4)
+
+
 _BLOCKED_USER = "123456"
 _ALLOWED_USER = "111111"
 
@@ -616,3 +616,32 @@ def test_django_header_injection(client, test_spans, tracer):
         }
         assert loaded["vulnerabilities"][0]["location"]["line"] == line
         assert loaded["vulnerabilities"][0]["location"]["path"] == TEST_FILE
+
+
+@pytest.mark.skipif(not python_supported_by_iast(), reason="Python version not supported by IAST")
+def test_django_iast_adaptive_sampling(client, test_spans, tracer):
+    route = "appsec/path-params/<int:year>/<str:month>/"
+    with override_global_config(dict(_iast_enabled=True)), mock.patch.object(oce, "_adaptive", True):
+        oce.reconfigure()
+        try:
+            with mock.patch.object(oce._sampler, "sample", return_value=True) as sample, mock.patch(
+                "ddtrace.appsec._iast._overhead_control_engine.random.random", return_value=0.3
+            ):
+                analyzed = []
+                for year in range(2020, 2024):
+                    root_span, response = _aux_appsec_get_root_span(
+                        client, test_spans, tracer, url="/appsec/path-params/%d/july/" % year
+                    )
+                    assert response.status_code == 200
+                    assert root_span.get_tag("http.route") == route
+                    analyzed.append(root_span.get_metric(IAST.ENABLED))
+                    test_spans.reset()
+
+            # The route template is resolved before the request starts, so requests to new paths of an already
+            # analyzed route are sampled with the decreasing rate of the route
+            assert analyzed == [1.0, 1.0, 0.0, 0.0]
+            sample.assert_not_called()
+            assert list(oce._routes) == [route]
+            assert oce._routes[route].rate == 0.25
+        finally:
+            oce.reconfigure()
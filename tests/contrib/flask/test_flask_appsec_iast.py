@@ -2,6 +2,7 @@ import json
 
 from flask import request
 from importlib_metadata import version
+import mock
 import pytest
 
 from ddtrace.appsec._constants import IAST
@@ -637,6 +638,32 @@ class FlaskAppSecIASTEnabledTestCase(BaseFlaskTestCase):
             # assert vulnerability["location"]["line"] == line
             # assert vulnerability["hash"] == hash_value
 
+    @pytest.mark.skipif(not python_supported_by_iast(), reason="Python version not supported by IAST")
+    def test_flask_iast_adaptive_sampling(self):
+        @self.app.route("/users/<int:user_id>/")
+        def user(user_id):
+            return "OK", 200
+
+        with override_global_config(dict(_iast_enabled=True)), mock.patch.object(oce, "_adaptive", True):
+            oce.reconfigure()
+            try:
+                with mock.patch.object(oce._sampler, "sample", return_value=True) as sample, mock.patch(
+                    "ddtrace.appsec._iast._overhead_control_engine.random.random", return_value=0.3
+                ):
+                    analyzed = []
+                    for user_id in range(4):
+                        resp = self.client.get("/users/%d/" % user_id)
+                        assert resp.status_code == 200
+                        analyzed.append(self.pop_spans()[0].get_metric(IAST.ENABLED))
+
+                # The route template is resolved before the request starts, so requests to new paths of an already
+                # analyzed route are sampled with the decreasing rate of the route
+                assert analyzed == [1.0, 1.0, 0.0, 0.0]
+                sample.assert_not_called()
+                assert list(oce._routes) == ["/users/<int:user_id>/"]
+            finally:
+                oce.reconfigure()
+
 
 class FlaskAppSecIASTDisabledTestCase(BaseFlaskTestCase):
     @pytest.fixture(autouse=True)
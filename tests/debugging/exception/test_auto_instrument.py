@@ -1,8 +1,11 @@
 from contextlib import contextmanager
+from time import sleep
 
+import mock
 import pytest
 
 import ddtrace
+from ddtrace.debugging._config import ed_config
 import ddtrace.debugging._exception.auto_instrument as auto_instrument
 from ddtrace.internal.rate_limiter import BudgetRateLimiterWithJitter as RateLimiter
 from tests.debugging.mocking import exception_debugging
@@ -160,3 +163,91 @@ class ExceptionDebuggingTestCase(TracerTestCase):
             self.assert_span_count(6)
             # no new snapshots
             assert len(d.test_queue) == 3
+
+    def test_debugger_exception_debugging_budget(self):
+        def a(v):
+            with self.trace("a"):
+                raise ValueError("hello", v)
+
+        with exception_debugging() as d:
+            # Exception replay is sampled out by the overhead budget
+            d._signal_budget._sample_rates[auto_instrument.BUDGET_KEY] = 0.0
+
+            with with_rate_limiter(RateLimiter(limit_rate=1, raise_on_exceed=False)):
+                with pytest.raises(ValueError):
+                    a(42)
+
+            self.assert_span_count(1)
+            assert not d.test_queue
+            assert self.spans[0].get_tag("error.debug_info_captured") is None
+
+    def test_debugger_exception_debugging_fingerprint(self):
+        def a(v):
+            with self.trace("a"):
+                raise ValueError("hello", v)
+
+        with exception_debugging() as d:
+            # The global rate limiter would not allow another capture
+            with with_rate_limiter(RateLimiter(limit_rate=1e-6, tau=1e6, raise_on_exceed=False)):
+                for i in range(10):
+                    with pytest.raises(ValueError):
+                        a(i)
+
+            self.assert_span_count(10)
+            # Only the first exception is captured
+            (snapshot,) = d.test_queue
+
+            # The spans of the repeated exceptions link to the first snapshot
+            for span in self.spans:
+                assert span.get_tag("error.debug_info_captured") == "true"
+                assert span.get_tag("_dd.debug.error.1.snapshot_id") == snapshot.uuid
+                assert span.get_tag("_dd.debug.error.exception_id") == str(snapshot.exc_id)
+
+    def test_debugger_exception_debugging_fingerprint_interval(self):
+        def a(v):
+            with self.trace("a"):
+                raise ValueError("hello", v)
+
+        with exception_debugging() as d, mock.patch.object(ed_config, "capture_interval", 0.1):
+            with with_rate_limiter(RateLimiter(limit_rate=1e6, raise_on_exceed=False)):
+                for i in range(2):
+                    with pytest.raises(ValueError):
+                        a(i)
+                    # The next exception is raised after the capture interval
+                    sleep(0.3)
+
+            self.assert_span_count(2)
+            snapshots = list(d.test_queue)
+            assert len(snapshots) == 2
+
+            # Each capture refers to its own exception
+            exc_ids = {str(snapshot.exc_id) for snapshot in snapshots}
+            assert len(exc_ids) == 2
+            for snapshot, span in zip(snapshots, self.spans):
+                exc_id = str(snapshot.exc_id)
+                assert span.get_tag("_dd.debug.error.exception_id") == exc_id
+                assert snapshot.probe.probe_id == exc_id
+                assert snapshot.message.endswith("(exception ID %s)" % exc_id)
+
+
+def test_exception_fingerprint():
+    def raise_at(line):
+        try:
+            if line:
+                raise ValueError("first line")
+            raise ValueError("second line")
+        except ValueError as e:
+            return e
+
+    def fingerprint(exc):
+        chain, _ = auto_instrument.unwind_exception_chain(exc, exc.__traceback__)
+        return auto_instrument.exception_fingerprint(chain)
+
+    assert fingerprint(raise_at(True)) == fingerprint(raise_at(True))
+    assert fingerprint(raise_at(True)) != fingerprint(raise_at(False))
+
+    try:
+        raise KeyError("other type")
+    except KeyError as e:
+        other = e
+    assert fingerprint(other) != fingerprint(raise_at(True))
@@ -29,7 +29,7 @@ class LineCollector(ModuleCollector):
     def on_collect(self, discovery: FunctionDiscovery) -> None:
         o = origin(discovery._module)
         status("[coverage] collecting lines from %s" % o)
-        _tracked_modules[o] = (discovery._module, {_ for _ in discovery.keys()})
+        _tracked_modules[o] = (discovery._module, set(discovery.lines()))
         LineCoverage.add_probes(
             [
                 create_snapshot_line_probe(
@@ -39,8 +39,8 @@ class LineCollector(ModuleCollector):
                     rate=0.0,
                     limits=expl_config.limits,
                 )
-                for line, functions in discovery.items()
-                for f in functions
+                for line in discovery.lines()
+                for f in discovery.at_line(line)
             ]
         )
 
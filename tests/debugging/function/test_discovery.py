@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 import pytest
 
 from ddtrace.debugging._function.discovery import FunctionDiscovery
@@ -12,7 +15,7 @@ def stuff_discovery():
 def test_abs_stuff():
     import tests.submod.absstuff as absstuff
 
-    assert sorted(FunctionDiscovery.from_module(absstuff).keys()) == [9, 13, 18, 21]
+    assert sorted(FunctionDiscovery.from_module(absstuff).lines()) == [9, 13, 18, 21]
 
 
 def test_function_discovery(stuff_discovery):
@@ -119,3 +122,66 @@ def test_discovery_after_external_wrapping(stuff):
 def test_property_non_function_getter(stuff_discovery):
     with pytest.raises(ValueError):
         stuff_discovery.by_name("PropertyStuff.foo")
+
+
+def test_line_index_cached_by_origin(stuff):
+    from ddtrace.debugging._function.discovery import line_index
+
+    index = line_index(stuff)
+    assert index is not None
+    discovery = FunctionDiscovery(stuff)
+    assert discovery._line_index is index
+    assert line_index(stuff) is index
+
+    # The index is filled with the code objects of the module functions
+    assert discovery.at_line(6)
+    assert ("modulestuff", 5) in index.at_line(6)
+    assert not index.at_line(1)
+
+
+def test_line_index_invalidated_by_mtime(stuff):
+    import os
+
+    from ddtrace.debugging._function.discovery import line_index
+
+    index = line_index(stuff)
+    assert index is not None
+    FunctionDiscovery(stuff).lines()
+
+    st = os.stat(index.path)
+    os.utime(index.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    try:
+        new_index = line_index(stuff)
+        assert new_index is not index
+        FunctionDiscovery(stuff).lines()
+        assert new_index.lines() == index.lines()
+    finally:
+        os.utime(index.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_function_discovery_lazy(stuff):
+    discovery = FunctionDiscovery(stuff)
+    assert discovery._collected is None
+
+    assert len(discovery.at_line(11)) == 3
+    assert discovery._collected
+
+    # All the line numbers are looked up when the mapping is enumerated
+    assert 11 in discovery
+    assert sorted(discovery.keys()) == discovery.lines()
+    assert dict(discovery.items())[11] == discovery.at_line(11)
+
+
+def test_function_discovery_source_changed(tmp_path, monkeypatch):
+    source = tmp_path / "discovery_source_changed.py"
+    source.write_text("def foo():\n    a = 42\n    return a\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("discovery_source_changed")
+    try:
+        # The source file changes after the module is imported
+        source.write_text("def foo():\n    return 0\n")
+
+        discovery = FunctionDiscovery(module)
+        assert discovery.at_line(3) == [module.foo]
+    finally:
+        del sys.modules["discovery_source_changed"]
@@ -1,5 +1,3 @@
-import sys
-
 import mock
 from mock.mock import call
 
@@ -194,9 +192,8 @@ def test_function_inject_wrap_commutativity():
         # Unwrapping
         store.unwrap(stuff.modulestuff)
 
-        assert stuff.modulestuff.__code__ is not code
-        if sys.version_info < (3, 12):
-            assert stuff.modulestuff.__code__ == code
+        # The function is back to its original code
+        assert stuff.modulestuff.__code__ is code
 
 
 def test_function_wrap_inject_commutativity():
@@ -221,6 +218,67 @@ def test_function_wrap_inject_commutativity():
         assert stuff.modulestuff.__code__ is not code
         store.eject_hook(stuff.modulestuff, hook, lo, 42)
 
-        assert stuff.modulestuff.__code__ is not code
-        if sys.version_info < (3, 12):
-            assert stuff.modulestuff.__code__ == code
+        # The function is back to its original code
+        assert stuff.modulestuff.__code__ is code
+
+
+def test_function_inject_eject_code_cache():
+    with FunctionStore() as store:
+        code = stuff.modulestuff.__code__
+        lo = min(linenos(stuff.modulestuff))
+        function = FunctionDiscovery.from_module(stuff).at_line(lo)[0]
+        hook = mock.Mock()()
+        hooks = [(hook, lo, "a"), (hook, lo, "b")]
+
+        assert not store.inject_hooks(function, hooks)
+        injected_code = stuff.modulestuff.__code__
+        stuff.modulestuff(None)
+        hook.assert_has_calls([mock.call("a"), mock.call("b")], any_order=True)
+
+        # Ejecting all the hooks restores the original code
+        assert not store.eject_hooks(stuff.modulestuff, hooks)
+        assert stuff.modulestuff.__code__ is code
+
+        # Injecting the same hooks again reuses the code object
+        assert not store.inject_hooks(function, hooks[:1])
+        assert not store.inject_hooks(function, hooks[1:])
+        assert stuff.modulestuff.__code__ is injected_code
+
+        # Only the injected hooks can be ejected
+        assert store.eject_hooks(stuff.modulestuff, [(hook, lo, mock.Mock(probe_id="unknown"))]) == {"unknown"}
+
+    assert stuff.modulestuff.__code__ is code
+
+
+def test_function_inject_eject_inject_wrapped():
+    with FunctionStore() as store:
+        code = stuff.modulestuff.__code__
+        lo = min(linenos(stuff.modulestuff))
+        function = FunctionDiscovery.from_module(stuff).at_line(lo)[0]
+        hook = mock.Mock()()
+
+        # Inject, then wrap and eject from the wrapped function
+        assert not store.inject_hooks(function, [(hook, lo, "L1")])
+        store.wrap(function, gen_wrapper(mock.Mock(), 42))
+        assert not store.eject_hooks(function, [(hook, lo, "L1")])
+        store.unwrap(function)
+
+        assert not store.inject_hooks(function, [(hook, lo, "L3")])
+        stuff.modulestuff(None)
+        hook.assert_called_once_with("L3")
+
+        assert not store.eject_hooks(function, [(hook, lo, "L3")])
+        assert stuff.modulestuff.__code__ is code
+
+        # Wrap and inject into the wrapped function, then unwrap and eject
+        hook.reset_mock()
+        store.wrap(function, gen_wrapper(mock.Mock(), 42))
+        assert not store.inject_hooks(function, [(hook, lo, "L1")])
+        store.unwrap(function)
+        assert not store.eject_hooks(function, [(hook, lo, "L1")])
+
+        assert not store.inject_hooks(function, [(hook, lo, "L3")])
+        stuff.modulestuff(None)
+        hook.assert_called_once_with("L3")
+
+    assert stuff.modulestuff.__code__ is code
@@ -79,3 +79,31 @@ def test_registry_location_error():
             },
         }
     ]
+
+
+def test_registry_sample_rate():
+    status_logger = DummyProbeStatusLogger("test")
+    registry = ProbeRegistry(status_logger)
+
+    probe = create_snapshot_line_probe(probe_id="probe-sampled", source_file=__file__, line=1)
+    registry.register(probe)
+    registry.set_emitting(probe)
+    status_logger.queue.clear()
+
+    # Only the changes between sampled and not sampled are reported
+    registry.set_sample_rate(probe.probe_id, 0.5)
+    registry.set_sample_rate(probe.probe_id, 0.25)
+    registry.set_sample_rate(probe.probe_id, 1.0)
+    # Unregistered probes are ignored
+    registry.set_sample_rate("exception-replay", 0.5)
+
+    assert [e["debugger"]["diagnostics"]["status"] for e in status_logger.queue] == ["WARNING", "EMITTING"]
+    status_logger.queue.clear()
+
+    registry.set_sample_rate(probe.probe_id, 0.5)
+    status_logger.queue.clear()
+    registry.log_probes_status()
+
+    (entry,) = status_logger.queue
+    assert entry["debugger"]["diagnostics"]["status"] == "WARNING"
+    assert entry["message"] == "Probe probe-sampled is sampled at 50.00% to stay within the overhead budget"
@@ -451,6 +451,53 @@ def test_multiple_configs(remote_config_worker):
         di_config.diagnostics_interval = old_interval
 
 
+def test_unchanged_configs_not_rebuilt(remote_config_worker):
+    events = []
+
+    def cb(e, ps):
+        events.append((e, frozenset({p.probe_id if isinstance(p, Probe) else p for p in ps})))
+
+    def metric_probe(probe_id, version):
+        return {
+            "id": probe_id,
+            "version": version,
+            "type": ProbeType.METRIC_PROBE,
+            "tags": ["foo:bar"],
+            "where": {"sourceFile": "tests/submod/stuff.p", "lines": ["36"]},
+            "metricName": "test.counter",
+            "kind": "COUNTER",
+        }
+
+    old_interval = di_config.diagnostics_interval
+    di_config.diagnostics_interval = float("inf")
+    try:
+        with mock.patch("ddtrace.debugging._probe.remoteconfig.build_probe", wraps=build_probe) as mock_build_probe:
+            adapter = SyncProbeRCAdapter(None, cb)
+            remoteconfig_poller.register("TEST", adapter, skip_enabled=True)
+
+            adapter.append_and_publish(metric_probe("probe1", 0), "", config_metadata("metricProbe_probe1"))
+            remoteconfig_poller._poll_data()
+
+            adapter.append_and_publish(metric_probe("probe2", 0), "", config_metadata("metricProbe_probe2"))
+            remoteconfig_poller._poll_data()
+
+            # Only the new configuration is parsed
+            assert [_[0][0]["id"] for _ in mock_build_probe.call_args_list] == ["probe1", "probe2"]
+
+            adapter.append_and_publish(metric_probe("probe1", 1), "", config_metadata("metricProbe_probe1"))
+            remoteconfig_poller._poll_data()
+
+            assert [_[0][0]["id"] for _ in mock_build_probe.call_args_list] == ["probe1", "probe2", "probe1"]
+
+        assert events == [
+            (ProbePollerEvent.NEW_PROBES, frozenset({"probe1"})),
+            (ProbePollerEvent.NEW_PROBES, frozenset({"probe2"})),
+            (ProbePollerEvent.MODIFIED_PROBES, frozenset({"probe1"})),
+        ]
+    finally:
+        di_config.diagnostics_interval = old_interval
+
+
 def test_log_probe_attributes_parsing():
     probe = build_probe(
         {
@@ -1,6 +1,8 @@
+import os
 import sys
 import typing as t
 
+from ddtrace.debugging._config import di_config
 from ddtrace.debugging._probe.status import ProbeStatusLogger
 from ddtrace.internal import runtime
 from ddtrace.internal.utils.http import parse_form_multipart
@@ -92,3 +94,44 @@ def test_probe_status_error():
     exc = entry["debugger"]["diagnostics"]["exception"]
     assert exc["type"] == "RuntimeError"
     assert exc["message"] == "Test error"
+
+
+def test_probe_status_deduplication_across_forks():
+    status_logger = DummyProbeStatusLogger("test")
+
+    probe = create_snapshot_line_probe(
+        probe_id="probe-deduplicated",
+        source_file="tests/debugger/submod/stuff.py",
+        line=36,
+        condition=None,
+    )
+
+    child_pid = os.fork()
+    if child_pid == 0:
+        status_logger.received(probe)
+        os._exit(0)
+
+    _, status = os.waitpid(child_pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+    # The status was already emitted by the child process
+    status_logger.received(probe)
+    assert status_logger.queue == []
+
+    # Other statuses are emitted
+    status_logger.installed(probe)
+    (entry,) = status_logger.queue
+    assert entry["debugger"]["diagnostics"]["status"] == "INSTALLED"
+
+    # Statuses emitted by this process are not suppressed
+    status_logger.clear()
+    status_logger.installed(probe)
+    assert len(status_logger.queue) == 1
+
+    status_logger.clear()
+    di_config.diagnostics_deduplication = False
+    try:
+        status_logger.received(probe)
+        assert len(status_logger.queue) == 1
+    finally:
+        di_config.diagnostics_deduplication = True
@@ -0,0 +1,73 @@
+import mock
+
+from ddtrace.debugging._signal.budget import SignalBudget
+
+
+def test_signal_budget_degrade_and_restore():
+    degraded = []
+    restored = []
+
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=0):
+        budget = SignalBudget(
+            max_overhead=10.0,
+            window=1.0,
+            on_degraded=lambda key, rate: degraded.append((key, rate)),
+            on_restored=lambda key, rate: restored.append((key, rate)),
+        )
+
+    # The hot probe takes 80% of the window, well above the budget
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=int(1e9)):
+        budget.record("hot", int(0.8e9))
+
+    assert budget.share == 0.4
+    assert degraded == [("hot", 0.25)]
+    assert budget.sample_rate("hot") == 0.25
+    assert budget.sample_rate("cold") == 1.0
+    assert budget.admit("cold")
+
+    # The overhead goes back under the budget with little time spent in signals
+    for i in range(2, 12):
+        with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=int(i * 1e9)):
+            budget.record("hot", 0)
+
+    assert budget.share < 0.05
+    assert restored == [("hot", 1.0)]
+    assert budget.sample_rate("hot") == 1.0
+
+
+def test_signal_budget_window():
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=0):
+        budget = SignalBudget(max_overhead=10.0, window=1.0)
+
+    # No estimate is made before the end of the window
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=int(0.5e9)):
+        budget.record("hot", int(0.5e9))
+
+    assert budget.share == 0.0
+    assert budget.sample_rate("hot") == 1.0
+
+
+def test_signal_budget_disabled():
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=0):
+        budget = SignalBudget(max_overhead=0.0, window=1.0)
+
+    assert not budget.enabled
+
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=int(1e9)):
+        budget.record("hot", int(1e9))
+
+    assert budget.share == 0.0
+    assert budget.admit("hot")
+
+
+def test_signal_budget_min_sample_rate():
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=0):
+        budget = SignalBudget(max_overhead=0.001, window=1.0)
+
+    with mock.patch("ddtrace.debugging._signal.budget.monotonic_ns", return_value=int(1e9)):
+        budget.record("hot", int(1e9))
+
+    assert budget.sample_rate("hot") == SignalBudget.MIN_SAMPLE_RATE
+
+    budget.discard("hot")
+    assert budget.sample_rate("hot") == 1.0
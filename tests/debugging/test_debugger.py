@@ -1,4 +1,5 @@
 from collections import Counter
+from itertools import count
 import os.path
 import sys
 from threading import Thread
@@ -771,6 +772,120 @@ def test_debugger_condition_eval_then_rate_limit():
         assert "42" == snapshot["debugger.snapshot"]["captures"]["lines"]["36"]["arguments"]["bar"]["value"], snapshot
 
 
+def test_debugger_function_probe_rate_limit_skips_signals():
+    from tests.submod.stuff import Stuff
+
+    with debugger(upload_flush_interval=float("inf")) as d:
+        d.add_probes(
+            create_snapshot_function_probe(
+                probe_id="rate-limited",
+                module="tests.submod.stuff",
+                func_qname="Stuff.instancestuff",
+                rate=1,
+            ),
+        )
+
+        for i in range(100):
+            Stuff().instancestuff(i)
+
+        d.uploader.wait_for_payloads()
+
+        # Once the rate limit is exceeded, the calls do not create any signal
+        assert d.signal_state_counter == {SignalState.DONE: 1}
+
+        (snapshots,) = d.uploader.payloads
+        (snapshot,) = snapshots
+        assert snapshot["debugger.snapshot"]["captures"]["entry"]["arguments"]["bar"]["value"] == "0"
+
+
+def test_debugger_signal_budget_skips_signals():
+    from tests.submod.stuff import Stuff
+
+    with debugger(upload_flush_interval=float("inf")) as d:
+        d.add_probes(
+            create_snapshot_function_probe(
+                probe_id="sampled-function",
+                module="tests.submod.stuff",
+                func_qname="Stuff.instancestuff",
+                rate=float("inf"),
+            ),
+            create_snapshot_line_probe(
+                probe_id="sampled-line",
+                source_file="tests/submod/stuff.py",
+                line=36,
+                rate=float("inf"),
+            ),
+        )
+
+        # Probes sampled out by the overhead budget do not create any signal
+        d._signal_budget._sample_rates.update({"sampled-function": 0.0, "sampled-line": 0.0})
+
+        for i in range(10):
+            Stuff().instancestuff(i)
+
+        assert d.signal_state_counter == {}
+        d.assert_no_snapshots()
+
+
+def test_debugger_function_probe_condition_added_on_modify():
+    from tests.submod.stuff import Stuff
+
+    with debugger(upload_flush_interval=float("inf")) as d:
+        d.add_probes(
+            create_snapshot_function_probe(
+                probe_id="rate-limited",
+                version=1,
+                module="tests.submod.stuff",
+                func_qname="Stuff.instancestuff",
+                rate=1,
+            ),
+        )
+
+        # Exhaust the rate limit of the unconditional probe
+        Stuff().instancestuff(0)
+        assert d.signal_state_counter == {SignalState.DONE: 1}
+
+        d.modify_probes(
+            create_snapshot_function_probe(
+                probe_id="rate-limited",
+                version=2,
+                module="tests.submod.stuff",
+                func_qname="Stuff.instancestuff",
+                rate=1,
+                condition=DDExpression(dsl="bar == 42", callable=dd_compile({"eq": [{"ref": "bar"}, 42]})),
+            ),
+        )
+
+        for i in range(100):
+            Stuff().instancestuff(i)
+
+        # The condition added by the update is evaluated before the rate limit
+        assert d.signal_state_counter[SignalState.SKIP_COND] == 99
+
+
+def test_debugger_signal_budget_cpu_time():
+    from tests.submod.stuff import Stuff
+
+    with debugger(upload_flush_interval=float("inf")) as d:
+        d.add_probes(
+            create_snapshot_line_probe(
+                probe_id="budget-line",
+                source_file="tests/submod/stuff.py",
+                line=36,
+                rate=float("inf"),
+            ),
+        )
+
+        # The budget is charged with the CPU time of the thread that emits the
+        # signal
+        clock = count(0, 1000)
+        with mock.patch("ddtrace.internal.compat.thread_time_ns", side_effect=lambda: next(clock)):
+            with mock.patch.object(d._signal_budget, "record") as record:
+                Stuff().instancestuff()
+
+        record.assert_called_once_with("budget-line", 1000)
+
+
 def test_debugger_condition_eval_error_get_reported_once():
     from tests.submod.stuff import Stuff
 
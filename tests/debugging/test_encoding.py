@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import gc
 import inspect
 import json
 import sys
 import threading
+import weakref
 
 import pytest
 
+from ddtrace.debugging._encoding import BudgetedJsonEncoder
 from ddtrace.debugging._encoding import JSONTree
 from ddtrace.debugging._encoding import LogSignalJsonEncoder
 from ddtrace.debugging._encoding import SignalQueue
@@ -237,6 +240,133 @@ def test_batch_flush_reencode():
     assert len(queue.flush()) == a + b + 3
 
 
+def test_batch_deferred_encoding():
+    s = Snapshot(
+        probe=create_snapshot_line_probe(probe_id="batch-test", source_file="foo.py", line=42),
+        frame=inspect.currentframe(),
+        thread=threading.current_thread(),
+    )
+
+    s.line()
+
+    queue = SignalQueue(LogSignalJsonEncoder(None), buffer_size=30 * (1 << 10), deferred=True, max_pending=10)
+
+    # Signals are only encoded when the queue is flushed
+    assert sum(queue.put(s) for _ in range(10)) == 0
+    assert queue.count == 10
+    with pytest.raises(BufferFull):
+        queue.put(s)
+
+    payload = queue.flush()
+    decoded = json.loads(payload.decode())
+    # The signals that do not fit in the buffer are left for the next flush
+    assert 0 < len(decoded) < 10
+    assert queue.count == 10 - len(decoded)
+    assert decoded[0]["debugger.snapshot"]["stack"][0]["function"] == "test_batch_deferred_encoding"
+
+    while queue.count:
+        assert queue.flush() is not None
+    assert queue.flush() is None
+
+
+def test_batch_size_deferred_encoding():
+    s = Snapshot(
+        probe=create_snapshot_line_probe(probe_id="batch-size-test", source_file="foo.py", line=42),
+        frame=inspect.currentframe(),
+        thread=threading.current_thread(),
+    )
+
+    s.line()
+
+    queue = SignalQueue(LogSignalJsonEncoder(None), deferred=True, batch_size=1)
+
+    for _ in range(3):
+        queue.put(s)
+
+    # Each flush stops encoding once the batch size is reached
+    for n in range(3, 0, -1):
+        assert queue.count == n
+        (decoded,) = json.loads(queue.flush().decode())
+        assert decoded["debugger.snapshot"]["probe"]["id"] == "batch-size-test"
+    assert queue.flush() is None
+
+
+def test_deferred_encoding_captures_on_put():
+    queue = SignalQueue(LogSignalJsonEncoder(None), deferred=True)
+
+    def emit(data):
+        s = Snapshot(
+            probe=create_snapshot_line_probe(probe_id="capture-test", source_file="foo.py", line=42),
+            frame=inspect.currentframe(),
+            thread=threading.current_thread(),
+        )
+        s.line()
+        queue.put(s)
+        return weakref.ref(s)
+
+    data = [[1]]
+    signal_ref = emit(data)
+
+    # The pending payload refers neither to the signal nor to the captured values
+    gc.collect()
+    assert signal_ref() is None
+
+    data[0].append(2)
+
+    (decoded,) = json.loads(queue.flush().decode())
+    (captured,) = decoded["debugger.snapshot"]["captures"]["lines"]["42"]["arguments"]["data"]["elements"]
+    assert captured["size"] == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"a": [1, 2.5, None, True, "x\u00e9"], "b": {"c": {}}, 42: "int key"},
+        [],
+        {},
+        {"a": (1, "b")},
+    ],
+)
+def test_budgeted_json_encoder_within_budget(value):
+    assert BudgetedJsonEncoder(1 << 20, 0).encode(value) == json.dumps(value)
+
+
+def test_budgeted_json_encoder_pruning():
+    value = {"keep": {"a": {"b": 1}}, "prune": {"a": {"b": 1}}, "after": "value", "list": [{"c": 2}]}
+
+    # Objects are not descended into once the budget is reached, unless they
+    # are not nested deep enough
+    assert json.loads(BudgetedJsonEncoder(12, 1).encode(value)) == {
+        "keep": {"a": {"pruned": True}},
+        "prune": {"pruned": True},
+        "after": "value",
+        "list": [{"pruned": True}],
+    }
+    assert json.loads(BudgetedJsonEncoder(0, 3).encode(value)) == value
+
+
+def test_log_signal_json_encoder_oversized():
+    class TestEncoder(LogSignalJsonEncoder):
+        MAX_SIGNAL_SIZE = 8 << 10
+
+    big = [Custom() for _ in range(100)]  # noqa: F841
+
+    s = Snapshot(
+        probe=create_snapshot_line_probe(probe_id="oversized-test", source_file="foo.py", line=42),
+        frame=inspect.currentframe(),
+        thread=threading.current_thread(),
+    )
+    s.line()
+
+    encoded = TestEncoder(None).encode(s)
+    assert len(encoded) <= TestEncoder.MAX_SIGNAL_SIZE
+    assert len(LogSignalJsonEncoder(None).encode(s)) > TestEncoder.MAX_SIGNAL_SIZE
+
+    decoded = json.loads(encoded)
+    assert decoded["debugger.snapshot"]["probe"]["id"] == "oversized-test"
+    assert '{"pruned":true}' in encoded.decode()
+
+
 # ---- Side effects ----
 
 
@@ -2,7 +2,10 @@ from dis import dis
 
 import pytest
 
+from ddtrace.debugging._expressions import DDCompiler
 from ddtrace.debugging._expressions import dd_compile
+from ddtrace.debugging._redaction import DDRedactedExpressionError
+from ddtrace.debugging._redaction import dd_compile_redacted
 from ddtrace.internal.safety import SafeObjectProxy
 
 
@@ -134,3 +137,45 @@ def test_side_effects():
     assert b["hello"] == "worldcustom"
     c = CustomAttr()
     assert c.field == "xcustom"
+
+
+def test_compiled_expression_cache():
+    compiler = DDCompiler()
+
+    ast = {"eq": [{"getmember": [{"ref": "self"}, "name"]}, "test-me"]}
+    compiled = compiler.compile(ast)
+
+    # Identical ASTs share the same compiled function
+    assert compiler.compile({"eq": [{"getmember": [{"ref": "self"}, "name"]}, "test-me"]}) is compiled
+    assert compiler.compile({"eq": [{"getmember": [{"ref": "self"}, "name"]}, "other"]}) is not compiled
+    assert compiled({"self": CustomObject("test-me")}) is True
+
+    # Literals of different types are not confused
+    assert compiler.compile(1)({}) == 1
+    assert compiler.compile(True)({}) is True
+    assert compiler.compile(1.0)({}) == 1.0 and isinstance(compiler.compile(1.0)({}), float)
+
+
+@pytest.mark.parametrize(
+    "ast, _locals, value",
+    [
+        ({"getmember": [{"ref": "self"}, "name"]}, {"self": CustomObject("test-me")}, "test-me"),
+        ({"getmember": [{"ref": "self"}, "password"]}, {"self": CustomObject("test-me")}, DDRedactedExpressionError),
+        ({"index": [{"ref": "arr"}, 1]}, {"arr": CustomList(["hello", "world"])}, "world"),
+        ({"index": [{"ref": "dict"}, "world"]}, {"dict": {"world": "space"}}, "space"),
+        ({"index": [{"ref": "dict"}, "password"]}, {"dict": {"password": "secret"}}, DDRedactedExpressionError),
+        (
+            {"index": [{"ref": "dict"}, {"ref": "key"}]},
+            {"dict": {"token": "secret"}, "key": "token"},
+            DDRedactedExpressionError,
+        ),
+    ],
+)
+def test_redacted_expressions(ast, _locals, value):
+    compiled = dd_compile_redacted(ast)
+
+    if isinstance(value, type) and issubclass(value, Exception):
+        with pytest.raises(value):
+            compiled(_locals)
+    else:
+        assert compiled(_locals) == value
@@ -1,8 +1,10 @@
+import gzip
 import json
 
 import pytest
 
 from ddtrace.debugging._encoding import BufferFull
+from ddtrace.debugging._encoding import Encoder
 from ddtrace.debugging._encoding import SignalQueue
 from ddtrace.debugging._uploader import LogsIntakeUploaderV1
 from ddtrace.internal.compat import Queue
@@ -63,3 +65,100 @@ def test_uploader_full_buffer():
         # wakeup to mimic next interval
         uploader.periodic()
         assert uploader.queue.qsize() == 0
+
+
+class MockResponse(object):
+    status = 200
+    will_close = False
+
+    def read(self):
+        return b"OK"
+
+
+class MockConnection(object):
+    def __init__(self, fail=False):
+        self.requests = []
+        self.closed = False
+        self.fail = fail
+
+    def request(self, method, url, body, headers):
+        if self.fail:
+            raise ConnectionError("connection reset")
+        self.requests.append((body, headers))
+
+    def getresponse(self):
+        return MockResponse()
+
+    def close(self):
+        self.closed = True
+
+
+class MockConnectionUploader(LogsIntakeUploaderV1):
+    def __init__(self, *args, **kwargs):
+        super(MockConnectionUploader, self).__init__(*args, **kwargs)
+        self.connections = []
+        self.fail = False
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = MockConnection(fail=self.fail)
+            self.connections.append(self._conn)
+        return self._conn
+
+
+def test_uploader_gzip_keep_alive():
+    uploader = MockConnectionUploader(SignalQueue(None), interval=LONG_INTERVAL)
+
+    uploader._write(b"[hello]")
+    uploader._write(b"[world]")
+
+    # The connection is kept alive across uploads
+    (conn,) = uploader.connections
+    assert [gzip.decompress(body) for body, _ in conn.requests] == [b"[hello]", b"[world]"]
+    assert all(headers["Content-Encoding"] == "gzip" for _, headers in conn.requests)
+
+    # A failure on the kept-alive connection closes it and the payload is sent
+    # again on a new connection
+    conn.fail = True
+    uploader._write(b"[hello]")
+    assert conn.closed
+
+    uploader._write(b"[world]")
+    assert len(uploader.connections) == 2
+    assert [gzip.decompress(body) for body, _ in uploader.connections[1].requests] == [b"[hello]", b"[world]"]
+
+    uploader.on_shutdown()
+    assert uploader.connections[1].closed
+
+
+def test_uploader_new_connection_failure():
+    uploader = MockConnectionUploader(SignalQueue(None), interval=LONG_INTERVAL)
+
+    # A failure on a new connection is raised for the upload to be retried
+    uploader.fail = True
+    with pytest.raises(ConnectionError):
+        uploader._write(b"[hello]")
+    (conn,) = uploader.connections
+    assert conn.closed
+    assert uploader._conn is None
+
+    uploader.fail = False
+    uploader._write_with_backoff(b"[hello]")
+    assert [gzip.decompress(body) for body, _ in uploader.connections[1].requests] == [b"[hello]"]
+
+
+class BytesEncoder(Encoder):
+    def encode(self, item):
+        return item
+
+
+def test_uploader_batches():
+    queue = SignalQueue(BytesEncoder(), deferred=True, batch_size=1)
+    with MockLogsIntakeUploaderV1(queue, interval=LONG_INTERVAL) as uploader:
+        for item in (b"hello", b"world"):
+            queue.put(item)
+
+        # All the batches are uploaded on the same flush
+        uploader.periodic()
+        assert [uploader.queue.get(timeout=1) for _ in range(2)] == ["[hello]", "[world]"]
+        assert queue.count == 0
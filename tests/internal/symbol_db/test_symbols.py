@@ -1,15 +1,22 @@
+import gzip
 from importlib.machinery import ModuleSpec
+import json
 from pathlib import Path
 from types import ModuleType
 import typing as t
 
+import mock
 import pytest
 
+from ddtrace.internal.symbol_db import cache as scope_cache
 from ddtrace.internal.symbol_db.symbols import Scope
+from ddtrace.internal.symbol_db.symbols import ScopeContext
 from ddtrace.internal.symbol_db.symbols import ScopeData
 from ddtrace.internal.symbol_db.symbols import ScopeType
 from ddtrace.internal.symbol_db.symbols import Symbol
 from ddtrace.internal.symbol_db.symbols import SymbolType
+from ddtrace.internal.symbol_db.symbols import module_scope
+from ddtrace.settings.symbol_db import config as symdb_config
 
 
 def test_symbol_from_code():
@@ -194,6 +201,79 @@ def test_symbols_to_json():
     }
 
 
+def test_symbols_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(symdb_config, "_cache_dir", str(tmp_path / "cache"))
+
+    source = tmp_path / "symdb_cached.py"
+    source.write_text("def foo(a):\n    return a\n")
+
+    module = ModuleType("symdb_cached")
+    module.__spec__ = ModuleSpec("symdb_cached", None)
+    module.__spec__.origin = str(source)
+    exec(compile(source.read_text(), str(source), "exec"), module.__dict__)
+
+    scope = module_scope(module)
+    assert scope is not None
+    assert [_["name"] for _ in scope["scopes"]] == ["foo"]
+
+    # The scope of a module that did not change is not extracted again
+    with mock.patch.object(Scope, "from_module", side_effect=AssertionError):
+        assert module_scope(module) == json.loads(json.dumps(scope))
+
+    # A change to the source of the module invalidates the cached scope
+    key = scope_cache.cache_key(module)
+    source.write_text("def foo(a, b):\n    return a\n")
+    assert scope_cache.cache_key(module) != key
+    assert scope_cache.load(scope_cache.cache_key(module)) is None
+
+
+def test_symbols_cache_disabled(monkeypatch):
+    monkeypatch.setattr(symdb_config, "_cache_dir", "")
+
+    import tests.submod.stuff as stuff
+
+    assert scope_cache.cache_key(stuff) is None
+
+
+@pytest.mark.parametrize("compression", [True, False])
+def test_symbols_context_file(monkeypatch, compression):
+    monkeypatch.setattr(symdb_config, "_compression", compression)
+
+    import tests.submod.stuff as stuff
+
+    context = ScopeContext([module_scope(stuff)])
+    file = context._file()
+
+    data = gzip.decompress(file.data) if compression else file.data
+    assert json.loads(data) == json.loads(json.dumps(context.to_json()))
+    assert file.filename.endswith(".gz") is compression
+
+
+def test_symbols_compression_opt_in(monkeypatch):
+    from ddtrace.settings.symbol_db import SymbolDatabaseConfig
+
+    monkeypatch.delenv("_DD_SYMBOL_DATABASE_COMPRESSION", raising=False)
+    assert not SymbolDatabaseConfig()._compression
+
+    monkeypatch.setenv("_DD_SYMBOL_DATABASE_COMPRESSION", "true")
+    assert SymbolDatabaseConfig()._compression
+
+
+def test_symbols_extractor():
+    from ddtrace.internal.symbol_db.extractor import ScopeExtractor
+    import tests.submod.stuff as stuff
+
+    scopes = []
+    extractor = ScopeExtractor(["tests.submod.stuff", "tests.submod.does_not_exist"], scopes.extend)
+    extractor.start()
+    extractor.join(60)
+
+    (scope,) = scopes
+    assert scope["scope_type"] == ScopeType.MODULE
+    assert scope["name"] == "tests.submod.stuff"
+    assert scope["source_file"] == str(Path(stuff.__file__).resolve())
+
+
 @pytest.mark.subprocess(ddtrace_run=True, env=dict(DD_SYMBOL_DATABASE_UPLOAD_ENABLED="1"))
 def test_symbols_upload_enabled():
     from ddtrace.internal.remoteconfig.worker import remoteconfig_poller
@@ -232,3 +312,35 @@ def test_symbols_force_upload():
     (scope,) = context.to_json()["scopes"]
     assert scope["scope_type"] == ScopeType.MODULE
     assert scope["name"] == "tests.submod.stuff"
+
+
+@pytest.mark.subprocess(
+    ddtrace_run=True,
+    env=dict(
+        DD_SYMBOL_DATABASE_UPLOAD_ENABLED="1",
+        DD_SYMBOL_DATABASE_INCLUDES="tests.submod.stuff",
+        _DD_SYMBOL_DATABASE_OFFLOAD="1",
+    ),
+)
+def test_symbols_offload():
+    from ddtrace.internal.symbol_db.symbols import ScopeType
+    from ddtrace.internal.symbol_db.symbols import SymbolDatabaseUploader
+    import tests.submod.stuff  # noqa
+
+    contexts = []
+
+    def _upload_context(context):
+        contexts.append(context)
+
+    SymbolDatabaseUploader._upload_context = staticmethod(_upload_context)
+
+    SymbolDatabaseUploader.install()
+    SymbolDatabaseUploader._instance._extractor.join(60)
+
+    (context,) = [_ for _ in contexts if _]
+
+    (scope,) = context.to_json()["scopes"]
+    assert scope["scope_type"] == ScopeType.MODULE
+    assert scope["name"] == "tests.submod.stuff"
+
+    SymbolDatabaseUploader.uninstall()
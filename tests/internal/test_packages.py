@@ -20,10 +20,11 @@ def packages():
 
     # Clear caches
 
-    try:
-        del _p._package_for_root_module_mapping.__closure__[0].cell_contents.__callonce_result__
-    except AttributeError:
-        pass
+    for f in (_p._package_for_root_module_mapping, _p._package_index):
+        try:
+            del f.__closure__[0].cell_contents.__callonce_result__
+        except AttributeError:
+            pass
 
     for f in _p.__dict__.values():
         try:
@@ -77,6 +78,21 @@ def test_filename_to_package(packages):
     assert package.name == "protobuf"
 
 
+def test_package_index(packages):
+    from pathlib import Path
+
+    index = packages._PackageIndex()
+    foo = packages.Distribution(name="foo", version="1.0", path=None)
+    bar = packages.Distribution(name="bar", version="2.0", path=None)
+    index.add(Path("/site-packages/ns/foo"), foo)
+    index.add(Path("/site-packages/ns/bar"), bar)
+
+    assert index.lookup(Path("/site-packages/ns/foo/__init__.py")) == foo
+    assert index.lookup(Path("/site-packages/ns/bar/sub/mod.py")) == bar
+    assert index.lookup(Path("/site-packages/ns/baz.py")) is None
+    assert index.lookup(Path("/app/foo/__init__.py")) is None
+
+
 def test_third_party_packages():
     assert 4000 < len(_third_party_packages()) < 5000
 
@@ -0,0 +1,65 @@
+import os
+import sys
+
+from ddtrace.internal._stack import capture_stack
+from ddtrace.internal._stack import get_info_frame
+
+
+def outer(**kwargs):
+    return inner(**kwargs)
+
+
+def inner(**kwargs):
+    return capture_stack(sys._getframe(), **kwargs)
+
+
+def test_capture_stack():
+    stack = outer()
+
+    assert [frame[2] for frame in stack[:3]] == ["inner", "outer", "test_capture_stack"]
+    filename, lineno, name, qualname = stack[0]
+    assert filename == __file__
+    assert lineno == inner.__code__.co_firstlineno + 1
+    assert name == "inner"
+    assert qualname == getattr(inner.__code__, "co_qualname", "inner")
+
+
+def test_capture_stack_cache():
+    # Frames going through the same line share the same tuple
+    assert outer()[0] is outer()[0]
+
+
+def test_capture_stack_max_depth():
+    assert [frame[2] for frame in outer(max_depth=2)] == ["inner", "outer"]
+    assert outer(max_depth=0) == []
+
+
+def test_capture_stack_crop():
+    stack = outer(crop="outer")
+    assert stack[0][2] == "test_capture_stack_crop"
+    assert len(stack) == len(outer()) - 2
+
+    assert [frame[2] for frame in outer(crop="outer", max_depth=1)] == ["test_capture_stack_crop"]
+
+    # Unknown functions do not crop the stack
+    assert outer(crop="unknown") == outer()
+
+
+def test_get_info_frame():
+    cwd = os.path.dirname(__file__)
+
+    filename, lineno = get_info_frame(cwd)
+    assert filename == __file__
+    assert lineno == sys._getframe().f_lineno - 2
+
+    assert get_info_frame(os.path.join(cwd, "unknown")) == ("", -1)
+
+
+def test_capture_stack_unhashable_code():
+    # Instrumented code objects can hold unhashable constants
+    code = inner.__code__.replace(co_consts=inner.__code__.co_consts + ([],))
+    with_unhashable_code = type(inner)(code, inner.__globals__)
+
+    stack = with_unhashable_code()
+    assert stack[0][:3] == (__file__, inner.__code__.co_firstlineno + 1, "inner")
+    assert with_unhashable_code()[0] is stack[0]
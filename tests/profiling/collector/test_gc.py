@@ -0,0 +1,67 @@
+import gc
+
+from ddtrace.profiling import recorder
+from ddtrace.profiling.collector import gc as collector_gc
+
+from . import test_collector
+
+
+def test_repr():
+    test_collector._test_repr(
+        collector_gc.GCCollector,
+        "GCCollector(status=<ServiceStatus.STOPPED: 'stopped'>, "
+        "recorder=Recorder(default_max_events=16384, max_events={}), nframes=64, "
+        "endpoint_collection_enabled=True, export_libdd_enabled=False, tracer=None)",
+    )
+
+
+def _collect():
+    gc.collect(1)
+
+
+_COLLECT_LINE_NUMBER = _collect.__code__.co_firstlineno + 1
+
+
+def test_collect():
+    r = recorder.Recorder()
+    with collector_gc.GCCollector(r):
+        _collect()
+
+    events = r.events[collector_gc.GCEvent]
+    assert len(events) >= 1
+    event = events[-1]
+    assert event.generation == 1
+    assert event.duration_ns > 0
+    assert event.collected >= 0
+    assert event.uncollectable >= 0
+    assert event.frames[0][:3] == (__file__.replace(".pyc", ".py"), _COLLECT_LINE_NUMBER, "_collect")
+    assert event.nframes > 1
+
+
+def test_collect_cycles():
+    r = recorder.Recorder()
+
+    class Node(object):
+        pass
+
+    with collector_gc.GCCollector(r):
+        for _ in range(100):
+            a, b = Node(), Node()
+            a.other, b.other = b, a
+            del a, b
+        gc.collect()
+
+    assert sum(e.collected for e in r.events[collector_gc.GCEvent]) >= 200
+
+
+def test_stop_unregisters_callback():
+    r = recorder.Recorder()
+    c = collector_gc.GCCollector(r)
+    c.start()
+    assert c._callback in gc.callbacks
+    callback = c._callback
+    c.stop()
+    assert callback not in gc.callbacks
+
+    gc.collect()
+    assert len(r.events[collector_gc.GCEvent]) == 0
@@ -68,14 +68,15 @@ def test_iter_events():
     max_nframe = 32
     _memalloc.start(max_nframe, 10000, 512 * 1024)
     _allocate_1k()
-    events, count, alloc_count = _memalloc.iter_events()
+    events, count, alloc_count, tracebacks = _memalloc.iter_events()
     _memalloc.stop()
 
     assert count >= 1000
     # Watchout: if we dropped samples the test will likely fail
 
     object_count = 0
-    for (stack, nframe, thread_id), size, domain in events:
+    for traceback_id, thread_id, size, domain in events:
+        stack, nframe = tracebacks[traceback_id]
         assert domain == "object"
         assert 0 < len(stack) <= max_nframe
         assert nframe >= len(stack)
@@ -99,7 +100,7 @@ def test_iter_events_dropped():
     max_nframe = 32
     _memalloc.start(max_nframe, 100, 512 * 1024)
     _allocate_1k()
-    events, count, alloc_count = _memalloc.iter_events()
+    events, count, alloc_count, _ = _memalloc.iter_events()
     _memalloc.stop()
 
     assert count == 100
@@ -119,7 +120,7 @@ def test_iter_events_multi_thread():
     _allocate_1k()
     t.start()
     t.join()
-    events, count, alloc_count = _memalloc.iter_events()
+    events, count, alloc_count, tracebacks = _memalloc.iter_events()
     _memalloc.stop()
 
     assert count >= 1000
@@ -128,7 +129,8 @@ def test_iter_events_multi_thread():
 
     count_object = 0
     count_thread = 0
-    for (stack, nframe, thread_id), size, domain in events:
+    for traceback_id, thread_id, size, domain in events:
+        stack, nframe = tracebacks[traceback_id]
         assert domain == "object"
         assert 0 < len(stack) <= max_nframe
         assert nframe >= len(stack)
@@ -232,7 +234,9 @@ def test_heap():
     x = _allocate_1k()
     # Check that at least one sample comes from the main thread
     thread_found = False
-    for (stack, _nframe, thread_id), size in _memalloc.heap():
+    samples, tracebacks = _memalloc.heap()
+    for traceback_id, thread_id, size in samples:
+        stack, _nframe = tracebacks[traceback_id]
         assert 0 < len(stack) <= max_nframe
         assert size > 0
         if thread_id == threading.main_thread().ident:
@@ -246,7 +250,9 @@ def test_heap():
         pytest.fail("No trace of allocation in heap")
     assert thread_found, "Main thread not found"
     y = _pre_allocate_1k()
-    for (stack, _nframe, thread_id), size in _memalloc.heap():
+    samples, tracebacks = _memalloc.heap()
+    for traceback_id, thread_id, size in samples:
+        stack, _nframe = tracebacks[traceback_id]
         assert 0 < len(stack) <= max_nframe
         assert size > 0
         assert isinstance(thread_id, int)
@@ -258,7 +264,9 @@ def test_heap():
         pytest.fail("No trace of allocation in heap")
     del x
     gc.collect()
-    for (stack, _nframe, thread_id), size in _memalloc.heap():
+    samples, tracebacks = _memalloc.heap()
+    for traceback_id, thread_id, size in samples:
+        stack, _nframe = tracebacks[traceback_id]
         assert 0 < len(stack) <= max_nframe
         assert size > 0
         assert isinstance(thread_id, int)
@@ -271,7 +279,9 @@ def test_heap():
             pytest.fail("Allocated memory still in heap")
     del y
     gc.collect()
-    for (stack, _nframe, thread_id), size in _memalloc.heap():
+    samples, tracebacks = _memalloc.heap()
+    for traceback_id, thread_id, size in samples:
+        stack, _nframe = tracebacks[traceback_id]
         assert 0 < len(stack) <= max_nframe
         assert size > 0
         assert isinstance(thread_id, int)
@@ -312,6 +322,32 @@ def test_heap_collector():
         assert isinstance(event.thread_name, str)
 
 
+def test_iter_events_shared_tracebacks():
+    _memalloc.start(32, 10000, 0)
+    _allocate_1k()
+    events, count, alloc_count, tracebacks = _memalloc.iter_events()
+    _memalloc.stop()
+
+    events = list(events)
+    assert len(events) == count
+    # Allocations from the same site share the same traceback
+    assert len(tracebacks) < count
+    assert {traceback_id for traceback_id, _, _, _ in events} == set(tracebacks)
+
+
+def test_heap_collector_aggregates_sites():
+    r = recorder.Recorder()
+    mc = memalloc.MemoryCollector(r, heap_sample_size=1024)
+    with mc:
+        keep_me = _allocate_1k()
+        (events,) = mc.snapshot()
+
+    del keep_me
+
+    keys = [(event.thread_id, tuple(event.frames), event.nframes) for event in events]
+    assert len(keys) == len(set(keys))
+
+
 def test_heap_stress():
     # This should run for a few seconds, and is enough to spot potential segfaults.
     _memalloc.start(64, 64, 1024)
@@ -322,7 +322,7 @@ def test_repr():
         stack.StackCollector,
         "StackCollector(status=<ServiceStatus.STOPPED: 'stopped'>, "
         "recorder=Recorder(default_max_events=16384, max_events={}), min_interval_time=0.01, max_time_usage_pct=1.0, "
-        "nframes=64, ignore_profiler=False, endpoint_collection_enabled=None, tracer=None, "
+        "nframes=64, max_tasks=256, ignore_profiler=False, endpoint_collection_enabled=None, tracer=None, "
         "_stack_collector_v2_enabled=False)",
     )
 
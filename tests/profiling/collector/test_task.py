@@ -72,3 +72,157 @@ def test_list_tasks_gevent():
 
     assert t1_found
     assert main_thread_found
+
+
+def test_task_registry_sample():
+    from ddtrace.profiling import _asyncio
+
+    class Task(object):
+        def __init__(self):
+            self.callbacks = []
+
+        def add_done_callback(self, callback):
+            self.callbacks.append(callback)
+
+        def done(self):
+            for callback in self.callbacks:
+                callback(self)
+
+    registry = _asyncio._TaskRegistry()
+    tasks = [Task() for _ in range(10)]
+    for task in tasks:
+        registry.add(task)
+
+    sampled, weight = registry.sample(20)
+    assert set(sampled) == set(tasks)
+    assert weight == 1.0
+
+    sampled, weight = registry.sample(4)
+    assert len(sampled) == 4
+    assert set(sampled) <= set(tasks)
+    assert weight == 2.5
+
+    for task in tasks[:5]:
+        task.done()
+    assert len(registry) == 5
+    sampled, _ = registry.sample(10)
+    assert set(sampled) == set(tasks[5:])
+
+    # Pending tasks that are garbage collected are removed as well
+    del sampled, task
+    tasks[5:] = []
+    assert len(registry) == 0
+
+
+@pytest.mark.subprocess
+def test_sample_tasks_asyncio():
+    import asyncio
+    import threading
+
+    from ddtrace.profiling import _asyncio
+    from ddtrace.profiling.collector import _task
+
+    async def sleep():
+        await asyncio.sleep(10)
+
+    async def main():
+        tasks = [asyncio.create_task(sleep()) for _ in range(20)]
+        await asyncio.sleep(0)
+
+        loop = asyncio.get_running_loop()
+        registry = _asyncio.get_task_registry(loop)
+        assert registry is not None
+        # The main task and the sleeping ones
+        assert len(registry) == 21
+
+        thread_id = threading.main_thread().ident
+        sampled = _task.sample_tasks(thread_id, 5, 64)
+        assert len(sampled) == 5
+        for task_id, task_name, frames, nframes, weight in sampled:
+            assert nframes >= 1
+            assert weight == 21 / 5
+
+        # Suspended tasks have their stack cached until they resume
+        sampled = _task.sample_tasks(thread_id, 100, 64)
+        stacks = {task_id: frames for task_id, _, frames, _, _ in sampled}
+        assert len(registry.stacks) == 20
+        for task_id, _, frames, _, weight in _task.sample_tasks(thread_id, 100, 64):
+            assert weight == 1.0
+            if task_id in registry.stacks:
+                assert frames is stacks[task_id]
+
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert len(registry) == 1
+        assert len(registry.stacks) == 0
+
+    asyncio.run(main())
+
+
+def test_task_registry_concurrent_updates():
+    import gc
+    import sys
+    import threading
+
+    from ddtrace.profiling import _asyncio
+
+    class Task(object):
+        def add_done_callback(self, callback):
+            pass
+
+    registry = _asyncio._TaskRegistry()
+    kept = []
+
+    def worker():
+        for i in range(2000):
+            task = Task()
+            registry.add(task)
+            if i % 2:
+                kept.append(task)
+            if i % 100 == 0:
+                gc.collect()
+
+    # Switch threads as often as possible to interleave the updates
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert len(registry) == len(kept)
+    assert len(registry._index) == len(registry._refs)
+    for position, (task_id, ref) in enumerate(registry._refs):
+        assert registry._index[task_id] == position
+        assert id(ref()) == task_id
+
+
+@pytest.mark.subprocess
+def test_task_factory_restored_on_stop():
+    import asyncio
+
+    from ddtrace.profiling import _asyncio
+    from ddtrace.profiling import profiler
+
+    p = profiler.Profiler()
+    p.start()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    assert _asyncio.get_task_registry(loop) is not None
+
+    p.stop(flush=False)
+    assert loop.get_task_factory() is None
+
+    # Loops set while the profiler is stopped are left alone
+    other_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(other_loop)
+    assert other_loop.get_task_factory() is None
+
+    loop.close()
+    other_loop.close()
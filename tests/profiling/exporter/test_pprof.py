@@ -686,8 +686,8 @@ def test_pprof_exporter(gan):
     exp = pprof.PprofExporter()
     exports, _ = exp.export(TEST_EVENTS, 1, 7)
 
-    assert len(exports.sample_type) == 11
-    assert len(exports.string_table) == 58
+    assert len(exports.sample_type) == 15
+    assert len(exports.string_table) == 62
     assert len(exports.sample) == 28
     assert len(exports.location) == 8
 
@@ -790,6 +790,35 @@ def test_pprof_exporter_libs(gan):
     assert not expected_libs
 
 
+def test_pprof_exporter_libs_incremental():
+    exp = pprof.PprofExporter()
+
+    def lib_names(libs):
+        return {lib["name"] for lib in libs if lib["kind"] == "library"}
+
+    with mock.patch(
+        "ddtrace.internal.packages.filename_to_package", wraps=pprof.packages.filename_to_package
+    ) as filename_to_package:
+        libs = exp._build_libraries({six.__file__, os.__file__})
+        assert "six" in lib_names(libs)
+        assert filename_to_package.call_count == 2
+
+        # Mutating the reported libraries does not affect the next exports
+        for lib in libs:
+            lib["paths"].clear()
+
+        # Libraries not seen by an export are not reported
+        libs = exp._build_libraries({os.__file__})
+        assert "six" not in lib_names(libs)
+        assert all(lib["paths"] for lib in libs)
+
+        # Filenames are resolved only once
+        libs = exp._build_libraries({six.__file__, os.__file__})
+        assert "six" in lib_names(libs)
+        assert next(lib for lib in libs if lib["name"] == "six")["paths"] == [six.__file__]
+        assert filename_to_package.call_count == 2
+
+
 def test_pprof_exporter_empty():
     exp = pprof.PprofExporter()
     export, libs = exp.export({}, 0, 1)
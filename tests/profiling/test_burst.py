@@ -0,0 +1,107 @@
+import os
+import signal
+import time
+
+import pytest
+
+from ddtrace.profiling import burst
+
+
+def _controller(calls, duration=10.0):
+    return burst.BurstController(
+        activate=lambda: calls.append("activate"),
+        deactivate=lambda: calls.append("deactivate"),
+        duration=duration,
+        interval=3600,
+    )
+
+
+def test_burst_controller():
+    calls = []
+    c = _controller(calls)
+
+    c.periodic()
+    assert not c.active
+    assert calls == []
+
+    c.trigger(0.2)
+    c.periodic()
+    assert c.active
+    assert calls == ["activate"]
+
+    # Requesting a burst while one is running extends it
+    c.trigger(0.4)
+    c.periodic()
+    time.sleep(0.3)
+    c.periodic()
+    assert c.active
+    assert calls == ["activate"]
+
+    time.sleep(0.2)
+    c.periodic()
+    assert not c.active
+    assert calls == ["activate", "deactivate"]
+
+
+def test_burst_controller_default_duration():
+    c = _controller([], duration=42.0)
+    c.trigger()
+    assert c._requested == 42.0
+
+
+def test_trigger_running_controllers():
+    calls = []
+    c = _controller(calls)
+    burst.trigger(1.0)
+    assert c._requested is None
+
+    c.start()
+    try:
+        burst.trigger(1.0)
+        assert c._requested == 1.0
+    finally:
+        c.stop()
+        c.join()
+
+    c._requested = None
+    burst.trigger(1.0)
+    assert c._requested is None
+
+
+def test_rc_callback():
+    c = _controller([])
+    c.start()
+    try:
+        burst._rc_callback({"metadata": [{}], "config": [{"profiling_burst": False}]})
+        assert c._requested is None
+
+        burst._rc_callback({"metadata": [{}], "config": [{"profiling_burst": {"duration": 12}}]})
+        assert c._requested == 12.0
+
+        burst._rc_callback({"metadata": [{}], "config": [{"profiling_burst": True}]})
+        assert c._requested == 10.0
+    finally:
+        c.stop()
+        c.join()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="SIGUSR2 is not available")
+def test_signal_handler():
+    c = _controller([])
+    previous = signal.getsignal(signal.SIGUSR2)
+    burst.install_signal_handler("SIGUSR2")
+    c.start()
+    try:
+        os.kill(os.getpid(), signal.SIGUSR2)
+        assert c._requested == 10.0
+    finally:
+        c.stop()
+        c.join()
+        burst.uninstall_signal_handler()
+
+    assert signal.getsignal(signal.SIGUSR2) is previous
+
+
+def test_signal_handler_invalid_name():
+    burst.install_signal_handler("SIGDOESNOTEXIST")
+    assert burst._previous_signal_handler is None
@@ -6,6 +6,7 @@ import mock
 import pytest
 
 import ddtrace
+from ddtrace.internal import service
 from ddtrace.profiling import collector
 from ddtrace.profiling import event
 from ddtrace.profiling import exporter
@@ -13,6 +14,7 @@ from ddtrace.profiling import profiler
 from ddtrace.profiling import scheduler
 from ddtrace.profiling.collector import asyncio
 from ddtrace.profiling.collector import stack
+from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.collector import threading
 from ddtrace.profiling.exporter import http
 
@@ -347,6 +349,53 @@ def test_snapshot(monkeypatch):
     assert len(all_events["EVENTS"][event.Event]) == 1
 
 
+def test_burst():
+    all_events = []
+
+    class Exporter(exporter.Exporter):
+        def export(self, events, *args, **kwargs):
+            all_events.append(events)
+
+    class TestProfiler(profiler._ProfilerInstance):
+        def _build_default_exporters(self, *args, **kargs):
+            return [Exporter()]
+
+    p = TestProfiler(burst_enabled=True, memory_collector_enabled=False, lock_collector_enabled=False)
+    (col,) = p._collectors
+    assert isinstance(col, stack.StackCollector)
+    # Drive the burst controller manually
+    p._burst.interval = 3600
+    p.start()
+    try:
+        # Collectors are dormant until a burst is requested
+        assert col.status == service.ServiceStatus.STOPPED
+        p._burst.periodic()
+        assert col.status == service.ServiceStatus.STOPPED
+
+        p.burst(0.5)
+        p._burst.periodic()
+        assert p._burst.active
+        assert col.status == service.ServiceStatus.RUNNING
+
+        time.sleep(0.6)
+        p._burst.periodic()
+        assert not p._burst.active
+        assert col.status == service.ServiceStatus.STOPPED
+        assert len(all_events) == 1
+        assert all_events[0][stack_event.StackSampleEvent]
+    finally:
+        p.stop(flush=False)
+
+    # Nothing was collected since the last burst
+    assert len(all_events) == 1
+
+
+def test_burst_disabled():
+    p = profiler.Profiler()
+    with pytest.raises(RuntimeError):
+        p.burst()
+
+
 def test_failed_start_collector(caplog, monkeypatch):
     class ErrCollect(collector.Collector):
         def _start_service(self):
@@ -11,6 +11,6 @@ def check_pprof_file(
         content = f.read()
     p = pprof.pprof_pb2.Profile()
     p.ParseFromString(content)
-    assert len(p.sample_type) == 11
+    assert len(p.sample_type) == 15
     assert p.string_table[p.sample_type[0].type] == "cpu-samples"
     assert len(p.sample) >= 1
@@ -259,3 +259,23 @@ def test_rate_limiter_with_jitter_not_raise():
     limiter = BudgetRateLimiterWithJitter(limit_rate=1, raise_on_exceed=False)
 
     assert [limiter.limit(lambda: None) for _ in range(10)][1:] == [RateLimitExceeded] * 9
+
+
+def test_rate_limiter_with_jitter_exceeded():
+    exceeded = []
+    limiter = BudgetRateLimiterWithJitter(
+        limit_rate=1, raise_on_exceed=False, on_exceed=lambda: exceeded.append(True), call_once=True
+    )
+
+    # Checking does not consume the budget
+    assert limiter.exceeded() is False
+    assert limiter.exceeded() is False
+    assert limiter.limit() is None
+
+    assert limiter.exceeded() is True
+    assert limiter.exceeded() is True
+    assert exceeded == [True]
+    assert limiter.limit() is RateLimitExceeded
+
+    limiter.last_time -= 1.0
+    assert limiter.exceeded() is False